@@ -0,0 +1 @@
+"""Benchmarks for the volatility computation and page render path."""
@@ -0,0 +1,58 @@
+"""Deterministic synthetic OHLCV data and a provider serving it."""
+import numpy as np
+import pandas as pd
+
+from volatility.providers import Provider
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def synthetic_bars(n_bars, seed=0, freq="B", end="2024-12-31"):
+    """A random-walk OHLCV frame shaped like a yfinance download."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end=end, periods=n_bars, freq=freq, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n_bars)))
+    open_ = close * np.exp(rng.normal(0, 0.005, n_bars))
+    high = np.maximum(open_, close) * (1 + rng.gamma(2.0, 0.004, n_bars))
+    low = np.minimum(open_, close) * (1 - rng.gamma(2.0, 0.004, n_bars))
+    return pd.DataFrame({
+        "Open": open_, "High": high, "Low": low, "Close": close, "Adj Close": close,
+        "Volume": rng.integers(1_000_000, 50_000_000, n_bars).astype(float),
+    }, index=index)
+
+
+def synthetic_panel(n_bars, n_symbols, seed=0):
+    """Wide High/Low panels (dates x symbols) for the universe benchmarks."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end="2024-12-31", periods=n_bars, freq="B", name="Date")
+    columns = [f"S{i:05d}" for i in range(n_symbols)]
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, (n_bars, n_symbols)), axis=0))
+    high = close * (1 + rng.gamma(2.0, 0.004, (n_bars, n_symbols)))
+    low = close * (1 - rng.gamma(2.0, 0.004, (n_bars, n_symbols)))
+    return pd.DataFrame(high, index=index, columns=columns), pd.DataFrame(low, index=index, columns=columns)
+
+
+class SyntheticProvider(Provider):
+    """Serves synthetic bars without any network access."""
+    cacheable = False
+
+    def __init__(self, years=5):
+        self.years = years
+        self._frames = {}
+
+    def _frame(self, symbol, interval):
+        key = (symbol, interval)
+        if key not in self._frames:
+            seed = sum(map(ord, symbol))
+            if interval == "1m":
+                self._frames[key] = synthetic_bars(390, seed, freq="1min", end="2024-12-31 15:59")
+            else:
+                self._frames[key] = synthetic_bars(self.years * TRADING_DAYS_PER_YEAR, seed)
+        return self._frames[key]
+
+    def history(self, symbol, start, end, interval="1d"):
+        frame = self._frame(symbol, interval)
+        return frame[(frame.index >= pd.Timestamp(start).normalize()) & (frame.index < pd.Timestamp(end))]
+
+    def latest_session(self, symbol, interval="1m"):
+        return self._frame(symbol, interval)
@@ -0,0 +1,86 @@
+"""Local HTTP stand-in for a market data service.
+
+Serves synthetic bars ending today in the layout :class:`HttpProvider`
+expects, with optional latency and failures, so timeouts, retries and
+partial rendering can be exercised without network access:
+
+    python -m benchmarks.stub_server --port 8765 --delay 0.5 --fail-rate 0.2
+    VOLATILITY_PROVIDER=http VOLATILITY_HTTP_URL=http://127.0.0.1:8765 streamlit run main.py
+"""
+import argparse
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from benchmarks.fixtures import synthetic_bars
+
+DAILY_BARS = 1500
+SESSION_MINUTES = 390
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    delay = 0.0
+    fail_rate = 0.0
+
+    def _bars(self, symbol, interval):
+        seed = sum(map(ord, symbol))
+        today = pd.Timestamp.today().normalize()
+        if interval.endswith(("m", "h")):
+            # Today's session so far, one bar per minute from 09:30
+            minutes = min(SESSION_MINUTES, max(1, int((pd.Timestamp.now() - today).total_seconds() // 60) - 570))
+            bars = synthetic_bars(minutes, seed, freq="1min", end=today + pd.Timedelta(minutes=570 + minutes - 1))
+            bars.index.name = "Datetime"
+            return bars
+        return synthetic_bars(DAILY_BARS, seed, end=today)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        time.sleep(self.delay)
+        if random.random() < self.fail_rate:
+            self.send_error(503, "injected failure")
+            return
+        if url.path not in ("/history", "/latest") or "symbol" not in params:
+            self.send_error(404)
+            return
+        bars = self._bars(params["symbol"].upper(), params.get("interval", "1d"))
+        if url.path == "/history":
+            start = pd.Timestamp(params.get("start", bars.index[0])).normalize()
+            end = pd.Timestamp(params.get("end", bars.index[-1] + pd.Timedelta(days=1)))
+            bars = bars[(bars.index >= start) & (bars.index < end)]
+        body = bars.to_csv().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port=8765, delay=0.0, fail_rate=0.0, host="127.0.0.1"):
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"delay": delay, "fail_rate": fail_rate})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.stub_server",
+                                     description="Serve synthetic bars over HTTP.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    args = parser.parse_args(argv)
+    server = serve(args.port, args.delay, args.fail_rate)
+    print(f"serving synthetic bars on http://127.0.0.1:{args.port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Timed stages of the dashboard pipeline on synthetic data.
+
+    python -m benchmarks                       # full run, print a table
+    python -m benchmarks --quick               # smaller fixtures
+    python -m benchmarks --save baseline.json  # record results
+    python -m benchmarks --compare baseline.json --tolerance 0.25
+
+``--compare`` exits with status 1 when a case is slower than the baseline
+by more than the tolerance, so it can gate CI or a deployment.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+from benchmarks.fixtures import TRADING_DAYS_PER_YEAR, SyntheticProvider, synthetic_bars, synthetic_panel
+from volatility.backtest import sweep
+from volatility.data import download_data, resample_bars
+from volatility.engine import compute_daily, compute_weekly, compute_x_day
+from volatility.estimators import rolling_estimators
+from volatility.export import to_bytes
+from volatility.horizons import horizon_matrix
+from volatility.incremental import VolatilityState
+from volatility.panel import band_snapshot
+from volatility.providers import get_provider, set_provider
+from volatility.sensitivity import period_sweep
+from volatility.store import BarStore
+
+PERIOD = 50
+X_DAYS = 5
+YEARS = (1, 5, 10, 30)
+SYMBOLS = (1, 100, 1000, 5000)
+QUICK_YEARS = (1, 5)
+QUICK_SYMBOLS = (1, 100)
+
+
+def measure(func, min_time=0.2, max_repeats=50):
+    """Run ``func`` until ``min_time`` has passed; return (best, median) seconds."""
+    func()  # warm-up: imports, caches and lazily built state
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < max_repeats and (not timings or time.perf_counter() - started < min_time):
+        begin = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - begin)
+    return min(timings), statistics.median(timings)
+
+
+def _render_case(bars):
+    try:
+        import streamlit  # noqa: F401 -- only needed for the render stage
+    except ImportError:
+        return None
+    from volatility.dashboard import render_tab
+    from volatility.labels import EN
+    result = compute_daily(bars, PERIOD)
+    # Outside ``streamlit run`` the calls go through Streamlit's bare mode,
+    # so this times building the elements, not the browser round trip
+    return lambda: render_tab(result, EN, "daily", PERIOD, X_DAYS, 0.0)
+
+
+def cases(years, symbols):
+    """Yield ``(name, callable)`` for every stage and fixture size."""
+    for n_years in years:
+        bars = synthetic_bars(n_years * TRADING_DAYS_PER_YEAR, seed=sum(map(ord, "BENCH")))
+        start, end = bars.index[0], bars.index[-1] + timedelta(days=1)
+        label = f"{n_years}y"
+        provider = SyntheticProvider(n_years)
+
+        def fetch(provider=provider, start=start, end=end):
+            set_provider(provider)
+            download_data("BENCH", start, end)
+        yield f"fetch.provider[{label}]", fetch
+
+        store = BarStore(os.path.join(tempfile.mkdtemp(), "bars.sqlite"))
+        store.save("BENCH", "1d", bars)
+        yield f"fetch.store[{label}]", lambda store=store: store.load("BENCH", "1d")
+
+        yield f"stats.daily[{label}]", lambda bars=bars: compute_daily(bars, PERIOD)
+        yield f"stats.x_day[{label}]", lambda bars=bars: compute_x_day(bars, PERIOD, X_DAYS)
+        yield f"stats.horizons[{label}]", lambda bars=bars: horizon_matrix(bars, PERIOD)
+        yield f"stats.sensitivity[{label}]", lambda bars=bars: period_sweep(bars, x_days=X_DAYS)
+
+        yield f"stats.weekly[{label}]", lambda bars=bars: compute_weekly(resample_bars(bars), PERIOD)
+        yield f"stats.estimators[{label}]", lambda bars=bars: rolling_estimators(bars, PERIOD)
+
+        state = VolatilityState.from_frame(bars.iloc[:-1], PERIOD, X_DAYS)
+        last = bars.iloc[-1]
+        yield f"stats.incremental[{label}]", lambda state=state, last=last: (
+            state.daily(last["High"], last["Low"]), state.x_day(last["High"], last["Low"]))
+
+        frame = compute_x_day(compute_daily(bars, PERIOD).frame, PERIOD, X_DAYS).frame
+        yield f"export.csv[{label}]", lambda frame=frame: to_bytes([frame], "csv")
+
+        yield (f"backtest.sweep[{label}]",
+               lambda bars=bars: sweep(bars, range(20, 120, 20), (1, 5), (0.0, 0.05, 0.1), max_workers=1))
+
+        render = _render_case(bars)
+        if render is not None:
+            yield f"render.tab[{label}]", render
+
+    for n_symbols in symbols:
+        high, low = synthetic_panel(5 * TRADING_DAYS_PER_YEAR, n_symbols)
+        yield f"panel.snapshot[5y x {n_symbols}]", lambda high=high, low=low: band_snapshot(high, low, PERIOD, X_DAYS)
+
+
+def run(years, symbols, min_time):
+    previous = get_provider()
+    results = {}
+    try:
+        for name, func in cases(years, symbols):
+            best, median = measure(func, min_time)
+            results[name] = {"best": best, "median": median}
+            print(f"{name:<32} best {best * 1e3:10.3f} ms   median {median * 1e3:10.3f} ms", flush=True)
+    finally:
+        set_provider(previous)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Names of cases whose best time regressed by more than ``tolerance``."""
+    regressions = []
+    for name, timing in results.items():
+        reference = baseline.get("results", {}).get(name)
+        if reference and timing["best"] > reference["best"] * (1 + tolerance):
+            regressions.append(name)
+            print(f"REGRESSION {name}: {reference['best'] * 1e3:.3f} ms -> {timing['best'] * 1e3:.3f} ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the volatility pipeline.")
+    parser.add_argument("--quick", action="store_true", help="small fixtures only")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds spent per case (default 0.2)")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%% (default)")
+    args = parser.parse_args(argv)
+
+    results = run(QUICK_YEARS if args.quick else YEARS, QUICK_SYMBOLS if args.quick else SYMBOLS, args.min_time)
+    if args.save:
+        with open(args.save, "w") as handle:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "results": results}, handle, indent=2)
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
@@ -0,0 +1,8 @@
+import pytest
+
+from helpers import HISTORIES
+
+
+@pytest.fixture(params=sorted(HISTORIES))
+def bars(request):
+    return HISTORIES[request.param]
@@ -0,0 +1,49 @@
+"""Synthetic bars and comparisons shared by the tests."""
+import numpy as np
+import pandas as pd
+import pytest
+
+PERIOD = 20
+X_DAYS = 5
+# Bars to blank: one inside the latest windows, one in older history
+GAPS = (-8, -60)
+
+
+def make_bars(rows, seed=0, gaps=()):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, rows).cumsum()
+    bars = pd.DataFrame({
+        "Open": close,
+        "High": close + rng.random(rows) * 3,
+        "Low": close - rng.random(rows) * 3,
+        "Close": close,
+    }, index=pd.bdate_range("2022-01-03", periods=rows, name="Date"))
+    for gap in gaps:
+        if -gap <= rows:
+            bars.iloc[gap, bars.columns.get_indexer(["High", "Low"])] = np.nan
+    return bars
+
+
+# A long history, one with missing bars and one shorter than PERIOD
+HISTORIES = {
+    "long": make_bars(300),
+    "gaps": make_bars(300, seed=1, gaps=GAPS),
+    "short": make_bars(PERIOD - 5, seed=2),
+}
+
+
+def result_figures(result):
+    figures = {"volatility": result.volatility, "average": result.average, "std": result.std}
+    for n in (1, 2, 3):
+        figures[f"lower_{n}"], figures[f"upper_{n}"] = result.band(n)
+    return figures
+
+
+def assert_figures(result, figures):
+    """``figures`` match the result's volatility, average, std and bands.
+
+    Compared to the cent plus one, since summing in another order can flip
+    a rounding.
+    """
+    for column, value in result_figures(result).items():
+        assert figures[column] == pytest.approx(value, abs=0.011, nan_ok=True), column
@@ -0,0 +1,64 @@
+"""The vectorized backtest against a bar-by-bar evaluation of the signal."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from helpers import make_bars
+from volatility.backtest import backtest, sweep
+from volatility.engine import BUY, SELL
+
+PERIOD = 20
+
+
+def reference_trades(bars, period, v_alert, hold):
+    """The rule applied to one bar at a time, with only the bars up to it."""
+    trades = []
+    close = bars["Close"].to_numpy()
+    for i in range(period - 1, len(bars) - hold):
+        window = bars.iloc[i + 1 - period:i + 1]
+        ranges = (window["High"] - window["Low"]).to_numpy()
+        average, volatility = ranges.mean(), ranges[-1]
+        if volatility > average * (1 + v_alert):
+            side = SELL
+        elif volatility < average * (1 - v_alert):
+            side = BUY
+        else:
+            continue
+        pnl = (close[i + hold] - close[i]) * (1 if side == BUY else -1)
+        trades.append((bars.index[i], bars.index[i + hold], side, pnl))
+    return trades
+
+
+@pytest.mark.parametrize("v_alert, hold", [(0.0, 1), (0.1, 3)])
+def test_daily_trades(v_alert, hold):
+    bars = make_bars(150)
+    result = backtest(bars, "daily", PERIOD, v_alert=v_alert, hold=hold)
+    trades = list(zip(result.trades["entry_date"], result.trades["exit_date"], result.trades["side"],
+                      result.trades["pnl"]))
+    expected = reference_trades(bars, PERIOD, v_alert, hold)
+    assert [trade[:3] for trade in trades] == [trade[:3] for trade in expected]
+    np.testing.assert_allclose([trade[3] for trade in trades], [trade[3] for trade in expected])
+    assert result.summary["trades"] == len(expected)
+    assert result.summary["buy_trades"] + result.summary["sell_trades"] == len(expected)
+
+
+def test_no_look_ahead():
+    bars = make_bars(150)
+    changed = bars.copy()
+    changed.iloc[100:, changed.columns.get_indexer(["High", "Low", "Close"])] *= 3
+    before = backtest(bars, "daily", PERIOD, hold=1).trades
+    after = backtest(changed, "daily", PERIOD, hold=1).trades
+    # Signals before the change only depend on bars up to their own
+    cutoff = bars.index[99]
+    pd.testing.assert_frame_equal(before[before["exit_date"] <= cutoff], after[after["exit_date"] <= cutoff])
+
+
+def test_sweep_matches_single_backtests():
+    bars = make_bars(300)
+    table = sweep(bars, [10, PERIOD], x_days_values=(1, 5), v_alerts=(0.0, 0.05), max_workers=1)
+    assert len(table) == 2 * 2 + 2 * 2 * 2 + 2 * 2
+    for row in table.itertuples(index=False):
+        summary = backtest(bars, row.horizon, row.period, row.x_days, row.v_alert).summary
+        assert row.trades == summary["trades"]
+        assert row.total_pnl == pytest.approx(summary["total_pnl"])
+        assert row.hit_rate == pytest.approx(summary["hit_rate"], nan_ok=True)
@@ -0,0 +1,84 @@
+"""KeyedLock keeps other processes out for as long as any key of a stripe is held."""
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from volatility.coalesce import KeyedLock, fcntl
+
+pytestmark = pytest.mark.skipif(fcntl is None, reason="record locks need fcntl")
+
+PROBE = """
+import fcntl, os, sys
+fd = os.open(sys.argv[1], os.O_RDWR)
+try:
+    fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, 0)
+    print("free")
+except OSError:
+    print("held")
+"""
+
+
+def stripe_state(path):
+    """Whether another process could take stripe 0 of the lock file right now."""
+    return subprocess.run([sys.executable, "-c", PROBE, path], capture_output=True, text=True,
+                          check=True).stdout.strip()
+
+
+def test_two_keys_on_one_stripe(tmp_path):
+    path = str(tmp_path / "bars.lock")
+    # A single stripe puts every key on offset 0
+    keys = KeyedLock(path, stripes=1)
+    first_in, first_out, second_in, second_out = (threading.Event() for _ in range(4))
+
+    def first():
+        with keys.hold("AAPL", "1d"):
+            first_in.set()
+            first_out.wait(5)
+
+    def second():
+        first_in.wait(5)
+        with keys.hold("MSFT", "1d"):
+            second_in.set()
+            second_out.wait(5)
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    try:
+        assert first_in.wait(5)
+        time.sleep(0.2)
+        # The second key waits in-process instead of sharing the record lock
+        assert not second_in.is_set()
+        assert stripe_state(path) == "held"
+        first_out.set()
+        assert second_in.wait(5)
+        # The first key leaving must not release the stripe the second still holds
+        assert stripe_state(path) == "held"
+    finally:
+        first_out.set()
+        second_out.set()
+        for thread in threads:
+            thread.join(5)
+    assert stripe_state(path) == "free"
+
+
+def test_same_key_is_serialized():
+    keys = KeyedLock()
+    inside, overlaps = [], []
+
+    def work():
+        with keys.hold("AAPL", "1d"):
+            inside.append(1)
+            overlaps.append(len(inside))
+            time.sleep(0.01)
+            inside.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert overlaps == [1] * 8
@@ -0,0 +1,59 @@
+"""Weekly bars derived from the daily history."""
+import pandas as pd
+import pytest
+
+from helpers import make_bars
+from volatility import data
+from volatility.data import derive_bars, resample_bars
+from volatility.store import BarStore
+
+
+class StoredProvider:
+    cacheable = True
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = BarStore(str(tmp_path / "bars.sqlite"), min_refresh=0)
+    monkeypatch.setattr(data, "get_store", lambda: store)
+    monkeypatch.setattr(data, "get_provider", StoredProvider)
+    return store
+
+
+def test_weeks_are_labelled_by_their_monday():
+    # Monday 2024-05-27 is Memorial Day: the week starts trading on Tuesday
+    days = pd.DatetimeIndex(["2024-05-21", "2024-05-24", "2024-05-28", "2024-05-29", "2024-05-31", "2024-06-03"],
+                            name="Date")
+    daily = pd.DataFrame({"Open": [1.0, 2, 3, 4, 5, 6], "High": [10.0, 20, 30, 40, 35, 60],
+                          "Low": [1.0, 2, 3, 1.5, 2.5, 6], "Close": [1.5, 2.5, 3.5, 4.5, 5.5, 6.5],
+                          "Volume": [100.0, 200, 300, 400, 500, 600]}, index=days)
+    weekly = resample_bars(daily)
+    assert list(weekly.index) == list(pd.DatetimeIndex(["2024-05-20", "2024-05-27", "2024-06-03"]))
+    assert weekly.index.name == "Date"
+    week = weekly.loc["2024-05-27"]
+    assert (week["Open"], week["High"], week["Low"], week["Close"], week["Volume"]) == (3, 40, 1.5, 5.5, 1200)
+
+
+def test_weeks_without_bars_are_dropped():
+    daily = make_bars(30)
+    daily = daily[(daily.index < "2022-01-17") | (daily.index >= "2022-01-31")]
+    weekly = resample_bars(daily)
+    assert pd.Timestamp("2022-01-17") not in weekly.index
+    assert pd.Timestamp("2022-01-24") not in weekly.index
+    assert weekly[["High", "Low"]].notna().all().all()
+
+
+def test_derived_bars_are_topped_up(store):
+    daily = make_bars(200)
+    derive_bars("AAPL", daily.iloc[:103])
+    weekly = derive_bars("AAPL", daily)
+    pd.testing.assert_frame_equal(weekly[["Open", "High", "Low", "Close"]],
+                                  resample_bars(daily)[["Open", "High", "Low", "Close"]], check_freq=False)
+
+
+def test_derived_bars_follow_a_shorter_history(store):
+    daily = make_bars(200)
+    derive_bars("AAPL", daily)
+    # A later, shorter window of the same history starts at its own first week
+    weekly = derive_bars("AAPL", daily.iloc[100:])
+    assert weekly.index[0] == resample_bars(daily.iloc[100:]).index[0]
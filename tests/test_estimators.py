@@ -0,0 +1,59 @@
+"""The one-pass estimators against a textbook rolling computation of each."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from helpers import make_bars
+from volatility.estimators import ESTIMATORS, annualized, price_band, rolling_estimators
+
+PERIOD = 20
+
+
+def ohlc(rows, seed=0, gaps=()):
+    bars = make_bars(rows, seed, gaps)
+    rng = np.random.default_rng(seed + 100)
+    # Opens and closes inside the bar's range
+    span = bars["High"] - bars["Low"]
+    bars["Open"] = bars["Low"] + span * rng.random(rows)
+    bars["Close"] = bars["Low"] + span * rng.random(rows)
+    return bars
+
+
+def reference(bars, period):
+    log = np.log
+    r = log(bars["Close"] / bars["Close"].shift())
+    o = log(bars["Open"] / bars["Close"].shift())
+    c = log(bars["Close"] / bars["Open"])
+    h = log(bars["High"] / bars["Open"])
+    lo = log(bars["Low"] / bars["Open"])
+    rs = (h * (h - c) + lo * (lo - c)).rolling(period).mean()
+    k = 0.34 / (1.34 + (period + 1) / (period - 1))
+    variances = {
+        "close_to_close": r.rolling(period).var(),
+        "parkinson": ((h - lo) ** 2 / (4 * np.log(2))).rolling(period).mean(),
+        "garman_klass": (0.5 * (h - lo) ** 2 - (2 * np.log(2) - 1) * c ** 2).rolling(period).mean(),
+        "rogers_satchell": rs,
+        "yang_zhang": o.rolling(period).var() + k * c.rolling(period).var() + (1 - k) * rs,
+    }
+    return pd.DataFrame({name: np.sqrt(variance.clip(lower=0)) for name, variance in variances.items()})
+
+
+@pytest.mark.parametrize("rows, gaps", [(200, ()), (200, (-8, -60)), (PERIOD - 5, ())])
+def test_estimators_match_rolling(rows, gaps):
+    bars = ohlc(rows, gaps=gaps)
+    table = rolling_estimators(bars, PERIOD)
+    assert list(table.columns) == list(ESTIMATORS)
+    pd.testing.assert_frame_equal(table, reference(bars, PERIOD), check_freq=False, rtol=1e-9)
+
+
+def test_flat_prices_give_zero():
+    bars = pd.DataFrame({column: 100.0 for column in ("Open", "High", "Low", "Close")},
+                        index=pd.bdate_range("2024-01-01", periods=30))
+    assert (rolling_estimators(bars, PERIOD).iloc[-1] == 0).all()
+
+
+def test_annualized_band():
+    assert annualized(0.01, "daily") == pytest.approx(0.01 * np.sqrt(252))
+    lower, upper = price_band(100.0, 0.02, 2)
+    assert lower * upper == pytest.approx(100.0 ** 2)
+    assert lower < 100.0 < upper
@@ -0,0 +1,46 @@
+"""Chunked exports give the same file as writing the whole table at once."""
+import io
+
+import pandas as pd
+import pytest
+
+from helpers import make_bars
+from volatility import export
+
+
+@pytest.fixture
+def bars():
+    return make_bars(25)
+
+
+def test_chunked_csv_equals_to_csv(bars):
+    assert export.to_bytes([bars], "csv", chunk_rows=7) == bars.to_csv().encode("utf-8")
+
+
+def test_bulk_csv_has_one_header_and_a_symbol_column(bars):
+    parts = export.symbol_parts([("AAPL", bars.iloc[:10]), ("MSFT", bars.iloc[10:])])
+    text = export.to_bytes(parts, "csv", chunk_rows=4).decode("utf-8")
+    assert text.count("Date,symbol") == 1
+    table = pd.read_csv(io.StringIO(text), index_col=0, parse_dates=True)
+    assert list(table["symbol"].value_counts().sort_index()) == [10, 15]
+    pd.testing.assert_frame_equal(table.drop(columns="symbol"), bars, check_freq=False)
+
+
+def test_empty_parts_still_write_the_header(bars):
+    assert export.to_bytes([bars.iloc[:0]]).decode("utf-8").startswith("Date,Open,High,Low,Close")
+
+
+def test_parquet_round_trip(bars):
+    pytest.importorskip("pyarrow")
+    parts = export.symbol_parts([("AAPL", bars.iloc[:10]), ("MSFT", bars.iloc[10:])])
+    table = pd.read_parquet(io.BytesIO(export.to_bytes(parts, "parquet", chunk_rows=4)))
+    assert len(table) == len(bars)
+    pd.testing.assert_frame_equal(table.drop(columns="symbol"), bars, check_freq=False)
+
+
+def test_write_table_picks_the_format(bars, tmp_path):
+    for name in ("out.csv", "out.json"):
+        export.write_table(bars, str(tmp_path / name))
+    assert (tmp_path / "out.csv").read_bytes() == bars.to_csv().encode("utf-8")
+    assert len(pd.read_json(tmp_path / "out.json")) == len(bars)
+    assert export.table_format("x.parquet") == "parquet" and export.table_format("x.txt") == "csv"
@@ -0,0 +1,54 @@
+"""Replayed bars reach the live figures on the same index as the daily history."""
+import io
+
+import numpy as np
+import pandas as pd
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
+
+from volatility.dashboard import _feed, _stop_feed, live_results
+from volatility.feeds import CsvReplayFeed
+
+
+def replay(path):
+    return drain(CsvReplayFeed(str(path), delay=0).start())
+
+
+def drain(feed):
+    while not feed.finished:
+        feed.poll(timeout=0.1)
+    return feed.received()
+
+
+def test_replay_with_utc_offsets(tmp_path):
+    index = pd.date_range("2024-06-03 09:30", periods=30, freq="1min", tz="America/New_York", name="Datetime")
+    close = 100 + np.arange(30) * 0.1
+    minute = pd.DataFrame({"High": close + 0.5, "Low": close - 0.5, "Close": close}, index=index)
+    path = tmp_path / "bars.csv"
+    # yfinance's 1-minute bars keep their offset, e.g. 09:30:00-04:00
+    minute.to_csv(path)
+    assert "-04:00" in path.read_text()
+
+    data_c = replay(path)
+    assert data_c.index.tz is None
+    assert data_c.index[0] == pd.Timestamp("2024-06-03 09:30")
+    assert len(data_c) == 30
+
+    days = pd.bdate_range("2024-05-01", "2024-05-31", name="Date")
+    history = pd.DataFrame({"High": 102.0, "Low": 98.0}, index=days)
+    daily, x_day = live_results("REPLAY", 5, 3, history, data_c)
+    assert daily.high == round(data_c["High"].max(), 2)
+    assert daily.low == round(data_c["Low"].min(), 2)
+    assert daily.previous_date == days[-1]
+
+
+def test_replay_from_an_upload():
+    text = "Datetime,High,Low,Close\n2024-06-03 09:30:00-04:00,101,99,100\n2024-06-03 09:31:00-04:00,102,100,101\n"
+    upload = UploadedFile(UploadedFileRec(7, "bars.csv", "text/csv", text.encode()))
+    feed = _feed("REPLAY", 15, upload)
+    _stop_feed()
+    # The feed reads a copy of the bytes, never a path on the server
+    assert isinstance(feed, CsvReplayFeed) and feed.path is not upload
+    assert feed.path.getvalue() == upload.getvalue()
+    data_c = drain(CsvReplayFeed(io.BytesIO(upload.getvalue()), delay=0).start())
+    assert list(data_c["High"]) == [101, 102]
+    assert data_c.index[-1] == pd.Timestamp("2024-06-03 09:31")
@@ -0,0 +1,32 @@
+"""horizon_matrix against compute_x_day for every horizon."""
+import numpy as np
+import pytest
+
+from helpers import PERIOD, assert_figures, make_bars
+from volatility.engine import compute_x_day
+from volatility.horizons import horizon_matrix, sparse_table, window_extreme
+
+
+def test_horizon_matrix(bars):
+    matrix = horizon_matrix(bars, PERIOD)
+    for x_days, figures in matrix.iterrows():
+        reference = compute_x_day(bars, PERIOD, x_days)
+        assert_figures(reference, figures)
+        assert figures["range"] == pytest.approx(reference.range, abs=0.011, nan_ok=True)
+
+
+def test_window_extreme_matches_rolling():
+    values = make_bars(100, gaps=(-30,))["High"]
+    table = sparse_table(values.to_numpy(), levels=6)
+    for window in (1, 2, 3, 7, 32, 33, 63):
+        expected = values.rolling(window).max().to_numpy()[window - 1:]
+        np.testing.assert_array_equal(window_extreme(table, window), expected)
+
+
+def test_selected_horizons():
+    bars = make_bars(120)
+    matrix = horizon_matrix(bars, PERIOD, horizons=[3, 10, 40])
+    assert list(matrix.index) == [3, 10, 40]
+    assert_figures(compute_x_day(bars, PERIOD, 40), matrix.loc[40])
+    assert matrix["z_score"].loc[10] == pytest.approx(
+        (matrix.loc[10, "range"] - matrix.loc[10, "average"]) / matrix.loc[10, "std"])
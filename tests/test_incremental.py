@@ -0,0 +1,72 @@
+"""VolatilityState and RollingQuantiles against compute_daily, compute_x_day and np.quantile."""
+import json
+import math
+
+import numpy as np
+import pytest
+
+from helpers import PERIOD, X_DAYS, assert_figures, make_bars, result_figures
+from volatility.engine import QUANTILES, compute_daily, compute_x_day
+from volatility.incremental import RollingQuantiles, VolatilityState
+
+
+def test_volatility_state(bars):
+    state = VolatilityState.from_frame(bars.iloc[:-1], PERIOD, X_DAYS)
+    high, low = bars["High"].iloc[-1], bars["Low"].iloc[-1]
+    for result, reference in ((state.daily(high, low), compute_daily(bars, PERIOD)),
+                              (state.x_day(high, low), compute_x_day(bars, PERIOD, X_DAYS))):
+        assert_figures(reference, result_figures(result))
+        assert result.previous_date == reference.previous_date
+
+
+def test_catch_up_pushes_only_new_bars():
+    bars = make_bars(120)
+    state = VolatilityState.from_frame(bars.iloc[:60], PERIOD, X_DAYS)
+    # Overlapping frames, as each rerun passes the whole cached history
+    state.catch_up(bars.iloc[:80]).catch_up(bars.iloc[:-1])
+    high, low = bars["High"].iloc[-1], bars["Low"].iloc[-1]
+    assert_figures(compute_daily(bars, PERIOD), result_figures(state.daily(high, low)))
+    assert_figures(compute_x_day(bars, PERIOD, X_DAYS), result_figures(state.x_day(high, low)))
+
+
+def test_state_round_trips_through_a_dict():
+    bars = make_bars(120)
+    state = VolatilityState.from_frame(bars.iloc[:-10], PERIOD, X_DAYS)
+    restored = VolatilityState.from_dict(json.loads(json.dumps(state.to_dict())))
+    restored.catch_up(bars.iloc[:-1])
+    high, low = bars["High"].iloc[-1], bars["Low"].iloc[-1]
+    assert_figures(compute_daily(bars, PERIOD), result_figures(restored.daily(high, low)))
+    assert_figures(compute_x_day(bars, PERIOD, X_DAYS), result_figures(restored.x_day(high, low)))
+
+
+def test_volatility_state_quantiles(bars):
+    state = VolatilityState.from_frame(bars.iloc[:-1], PERIOD, X_DAYS)
+    high, low = bars["High"].iloc[-1], bars["Low"].iloc[-1]
+    for result, reference in ((state.daily(high, low), compute_daily(bars, PERIOD)),
+                              (state.x_day(high, low), compute_x_day(bars, PERIOD, X_DAYS))):
+        assert result.quantiles == pytest.approx(reference.quantiles, abs=0.011, nan_ok=True)
+        for n in (1, 2, 3):
+            assert result.quantile_band(n) == pytest.approx(reference.quantile_band(n), abs=0.011, nan_ok=True)
+
+
+def test_rolling_quantiles(bars):
+    values = (bars["High"] - bars["Low"]).to_numpy()
+    quantiles = RollingQuantiles(PERIOD)
+    for end in range(len(values)):
+        quantiles.push(values[end])
+        window = values[max(end + 1 - PERIOD, 0):end + 1]
+        if len(window) < PERIOD or np.isnan(window).any():
+            assert all(math.isnan(value) for value in quantiles.result())
+        else:
+            assert quantiles.result() == pytest.approx(tuple(np.quantile(window, QUANTILES)))
+
+
+def test_rolling_quantiles_peek():
+    bars = make_bars(60)
+    values = (bars["High"] - bars["Low"]).to_numpy()
+    quantiles = RollingQuantiles.from_values(PERIOD, values[:-1])
+    peeked = quantiles.peek(values[-1])
+    # Peeking leaves the window as it was
+    assert quantiles.result() == pytest.approx(tuple(np.quantile(values[-PERIOD - 1:-1], QUANTILES)))
+    quantiles.push(values[-1])
+    assert peeked == quantiles.result()
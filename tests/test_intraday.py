@@ -0,0 +1,90 @@
+"""Intraday bars and their bands against a direct computation over the sessions."""
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from volatility import data
+from volatility.data import download_intraday, session_bars
+from volatility.engine import QUANTILES, compute_intraday
+from volatility.store import BarStore
+
+
+def minute_session(day, minutes=390, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(pd.Timestamp(day) + timedelta(hours=9, minutes=30), periods=minutes, freq="1min",
+                          name="Datetime")
+    close = 100 + rng.normal(0, 0.1, minutes).cumsum()
+    return pd.DataFrame({"Open": close, "High": close + rng.random(minutes) * 0.2,
+                         "Low": close - rng.random(minutes) * 0.2, "Close": close,
+                         "Adj Close": close, "Volume": 10.0}, index=index)
+
+
+def sessions(days, minutes=390):
+    return pd.concat([minute_session(day, minutes, seed) for seed, day in enumerate(days)])
+
+
+def test_buckets_start_at_each_session_open():
+    minute = sessions(["2024-06-03", "2024-06-04"])
+    bars = session_bars(minute, 60)
+    first = bars.loc["2024-06-03"]
+    assert list(first.index.strftime("%H:%M")) == ["09:30", "10:30", "11:30", "12:30", "13:30", "14:30", "15:30"]
+    # The last bucket is cut at the close instead of running into the next session
+    last = minute.loc["2024-06-03 15:30":"2024-06-03 15:59"]
+    assert first.iloc[-1]["High"] == last["High"].max()
+    assert first.iloc[-1]["Open"] == last["Open"].iloc[0]
+    assert first.iloc[-1]["Volume"] == 300.0
+    assert len(bars.loc["2024-06-04"]) == 7
+
+
+def test_half_day_session():
+    minute = sessions(["2024-07-03"], minutes=210)
+    assert list(session_bars(minute, 60).index.strftime("%H:%M")) == ["09:30", "10:30", "11:30", "12:30"]
+
+
+@pytest.mark.parametrize("count", [1, 3])
+def test_bands_cover_the_previous_sessions(count):
+    bars = session_bars(sessions(pd.bdate_range("2024-06-03", periods=5)), 5)
+    result = compute_intraday(bars, count)
+    days = bars.index.normalize().unique()
+    previous = bars[(bars.index.normalize() >= days[-count - 1]) & (bars.index.normalize() < days[-1])]
+    ranges = (previous["High"] - previous["Low"]).to_numpy()
+    assert result.average == round(ranges.mean(), 2)
+    assert result.std == round(ranges.std(ddof=1), 2)
+    assert result.quantiles == tuple(round(value, 2) for value in np.quantile(ranges, QUANTILES))
+
+
+def test_too_few_sessions():
+    bars = session_bars(sessions(["2024-06-03", "2024-06-04"]), 5)
+    result = compute_intraday(bars, 5)
+    assert np.isnan(result.average) and np.isnan(result.quantiles[0])
+
+
+class MinuteProvider:
+    cacheable = True
+
+    def __init__(self, minute):
+        self.minute = minute
+
+    def history(self, symbol, start, end, interval="1d"):
+        return self.minute[(self.minute.index >= pd.Timestamp(start)) & (self.minute.index < pd.Timestamp(end))]
+
+
+def test_download_intraday_tops_up_the_stored_aggregates(tmp_path, monkeypatch):
+    today = pd.Timestamp.today().normalize()
+    days = [today - timedelta(days=n) for n in (4, 3, 2, 1)]
+    minute = sessions(days)
+    provider = MinuteProvider(minute.loc[:days[2] + timedelta(hours=12)])
+    store = BarStore(str(tmp_path / "bars.sqlite"), min_refresh=0)
+    monkeypatch.setattr(data, "get_provider", lambda: provider)
+    monkeypatch.setattr(data, "get_store", lambda: store)
+
+    download_intraday("AAPL", 5, 2)
+    # The rest of that session and the next one arrive
+    provider.minute = minute
+    bars = download_intraday("AAPL", 5, 2)
+    expected = session_bars(minute, 5)
+    expected = expected[expected.index >= days[1]]
+    pd.testing.assert_frame_equal(bars[["Open", "High", "Low", "Close", "Volume"]],
+                                  expected[["Open", "High", "Low", "Close", "Volume"]], check_freq=False)
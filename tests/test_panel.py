@@ -0,0 +1,55 @@
+"""band_snapshot against compute_daily and compute_x_day, one symbol per column."""
+import numpy as np
+import pytest
+
+from helpers import PERIOD, X_DAYS, assert_figures, make_bars
+from volatility.engine import compute_daily, compute_x_day
+from volatility.panel import band_snapshot, to_panels
+
+
+def snapshot_of(bars):
+    high, low = to_panels({"A": bars})
+    return band_snapshot(high, low, PERIOD, X_DAYS).loc["A"]
+
+
+def test_band_snapshot(bars):
+    snapshot = snapshot_of(bars)
+    # pack() moves a symbol's missing bars out of the way, as if the dates were
+    # not in its history at all, so the reference is computed without them
+    bars = bars.dropna(subset=["High", "Low"])
+    daily = compute_daily(bars, PERIOD)
+    assert_figures(daily, snapshot)
+    assert snapshot["range"] == pytest.approx(daily.range, abs=0.011)
+    assert snapshot["x_day_average"] == pytest.approx(compute_x_day(bars, PERIOD, X_DAYS).average,
+                                                      abs=0.011, nan_ok=True)
+
+
+def test_symbols_with_different_trading_days():
+    histories = {
+        "OLD": make_bars(200, seed=3),
+        # Listed later, and not trading on some of the other symbol's days
+        "NEW": make_bars(80, seed=4).iloc[::2],
+    }
+    high, low = to_panels(histories)
+    snapshot = band_snapshot(high, low, PERIOD, X_DAYS)
+    for symbol, bars in histories.items():
+        assert_figures(compute_daily(bars, PERIOD), snapshot.loc[symbol])
+        assert snapshot.loc[symbol, "x_day_average"] == pytest.approx(compute_x_day(bars, PERIOD, X_DAYS).average,
+                                                                      abs=0.011)
+
+
+def test_bands_are_rounded():
+    high, low = to_panels({seed: make_bars(60, seed=seed) for seed in range(50)})
+    bands = band_snapshot(high, low, PERIOD, X_DAYS)[[f"{side}_{n}" for side in ("lower", "upper")
+                                                      for n in (1, 2, 3)]]
+    assert bands.notna().all().all()
+    assert bands.equals(bands.round(2))
+
+
+def test_quantile_bands(bars):
+    snapshot = snapshot_of(bars)
+    daily = compute_daily(bars.dropna(subset=["High", "Low"]), PERIOD)
+    for n in (1, 2, 3):
+        assert (snapshot[f"q_lower_{n}"], snapshot[f"q_upper_{n}"]) == pytest.approx(daily.quantile_band(n),
+                                                                                    nan_ok=True)
+    assert np.isnan(snapshot["q_lower_1"]) == np.isnan(daily.average)
@@ -0,0 +1,46 @@
+"""Providers return bars on the naive exchange-local index of the bar store."""
+import pandas as pd
+import pytest
+
+from volatility import data, providers
+from volatility.providers import LocalProvider, local_bars
+
+pytest.importorskip("pyarrow")
+
+
+def minute_bars(tz="America/New_York"):
+    index = pd.date_range("2024-03-08 09:30", periods=5, freq="1min", tz=tz, name="Datetime")
+    return pd.DataFrame({"Open": 10.0, "High": 11.0, "Low": 9.0, "Close": 10.5, "Adj Close": 10.5, "Volume": 100},
+                        index=index)
+
+
+@pytest.fixture
+def local(tmp_path, monkeypatch):
+    (tmp_path / "1m").mkdir()
+    minute_bars().reset_index().to_parquet(tmp_path / "1m" / "AAPL.parquet", index=False)
+    provider = LocalProvider(str(tmp_path))
+    monkeypatch.setattr(providers, "_provider", provider)
+    return provider
+
+
+def test_local_provider_drops_the_offset(local):
+    bars = local.latest_session("AAPL")
+    assert bars.index.tz is None
+    assert bars.index[0] == pd.Timestamp("2024-03-08 09:30")
+    assert len(local.history("AAPL", "2024-03-08", "2024-03-09", "1m")) == 5
+
+
+def test_current_bars_compare_with_daily_history(local):
+    data_c = data.download_data_current("AAPL")
+    history = pd.DataFrame({"High": [1.0]}, index=pd.DatetimeIndex(["2024-03-08"], name="Date"))
+    assert data_c.index.tz is None
+    assert data_c.index[-1].normalize() == history.index[-1]
+
+
+def test_local_bars_with_offsets_across_dst():
+    # read_csv leaves timestamps with two different offsets as an object index
+    frame = pd.DataFrame({"Close": [1.0, 2.0]},
+                         index=pd.Index(["2024-03-08 15:59:00-05:00", "2024-03-11 09:30:00-04:00"], name="Datetime"))
+    bars = local_bars(frame)
+    assert list(bars.index) == [pd.Timestamp("2024-03-08 15:59"), pd.Timestamp("2024-03-11 09:30")]
+    assert local_bars(minute_bars(tz=None)).index.equals(minute_bars(tz=None).index)
@@ -0,0 +1,64 @@
+"""period_sweep against compute_daily, compute_x_day and compute_weekly for every period."""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from helpers import HISTORIES, PERIOD, X_DAYS, assert_figures, make_bars
+from volatility.data import recent_weeks, resample_bars
+from volatility.engine import compute_daily, compute_weekly, compute_x_day
+from volatility.sensitivity import add_signals, period_sweep, sweep_many
+
+
+def test_period_sweep(bars):
+    weekly = resample_bars(bars)
+    periods = [2, 10, PERIOD, 50, 250]
+    sweep = period_sweep(bars, periods, X_DAYS, weekly=weekly)
+    for period in periods:
+        assert_figures(compute_daily(bars, period), sweep.loc[("daily", period)])
+        assert_figures(compute_x_day(bars, period, X_DAYS), sweep.loc[("x_day", period)])
+        if len(weekly) >= 2:
+            assert_figures(compute_weekly(weekly, period), sweep.loc[("weekly", period)])
+
+
+def test_period_sweep_weekly_gap():
+    weekly = resample_bars(HISTORIES["long"])
+    weekly.iloc[-3, weekly.columns.get_indexer(["High", "Low"])] = np.nan
+    sweep = period_sweep(HISTORIES["long"], [5, 10], X_DAYS, weekly=weekly)
+    for period in (5, 10):
+        assert_figures(compute_weekly(weekly, period), sweep.loc[("weekly", period)])
+
+
+def test_default_weekly_bars_span_the_weekly_tab():
+    bars = make_bars(1200)
+    bars.index = pd.bdate_range(end=datetime.today(), periods=len(bars), name="Date")
+    weekly = recent_weeks(resample_bars(bars))
+    sweep = period_sweep(bars, [50, 200], X_DAYS)
+    for period in (50, 200):
+        assert_figures(compute_weekly(weekly, period), sweep.loc[("weekly", period)])
+    # Longer than the weekly tab's history, although the daily bars would allow it
+    assert np.isnan(sweep.loc[("weekly", 200), "average"])
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_sweep_many(max_workers):
+    histories = {"A": HISTORIES["long"], "B": HISTORIES["gaps"], "ONE": HISTORIES["long"].iloc[:1]}
+    table = sweep_many(histories, [10, PERIOD], X_DAYS, max_workers=max_workers)
+    # A single bar has no completed bar to compare
+    assert sorted(table.index.get_level_values("symbol").unique()) == ["A", "B"]
+    for symbol in ("A", "B"):
+        expected = period_sweep(histories[symbol][["High", "Low"]], [10, PERIOD], X_DAYS)
+        pd.testing.assert_frame_equal(table.loc[symbol], expected)
+
+
+def test_add_signals():
+    table = period_sweep(HISTORIES["long"], [10, PERIOD], X_DAYS)
+    signals = add_signals(table, 0.05)
+    for (horizon, period), row in signals.iterrows():
+        if row["volatility"] > row["average"] * 1.05:
+            assert row["signal"] == "Sell"
+        elif row["volatility"] < row["average"] * 0.95:
+            assert row["signal"] == "Buy"
+        else:
+            assert row["signal"] == ""
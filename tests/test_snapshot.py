@@ -0,0 +1,85 @@
+"""The nightly snapshot plus the 1-minute bars against the full computation."""
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from helpers import assert_figures, make_bars, result_figures
+from volatility import data
+from volatility.dashboard import live_results
+from volatility.data import recent_weeks, resample_bars
+from volatility.engine import compute_daily, compute_weekly, compute_x_day
+from volatility.snapshot import SnapshotStore
+
+PERIOD = 20
+X_DAYS = 5
+# A recent Tuesday whose week is over, so the tests can move to later sessions
+TODAY = pd.Timestamp.today().normalize()
+BAR_TIME = TODAY - timedelta(days=TODAY.weekday() + 6)
+
+
+class FileProvider:
+    cacheable = False
+
+
+def minute_bars(day, high, low):
+    index = pd.date_range(day + timedelta(hours=9, minutes=30), periods=30, freq="1min", name="Datetime")
+    return pd.DataFrame({"High": np.linspace(low + 1, high, 30), "Low": np.linspace(high - 1, low, 30),
+                         "Close": (high + low) / 2}, index=index)
+
+
+@pytest.fixture
+def history():
+    bars = make_bars(400)
+    bars.index = pd.bdate_range(end=BAR_TIME, periods=len(bars), name="Date")
+    return bars
+
+
+@pytest.fixture
+def snapshot(history, tmp_path, monkeypatch):
+    monkeypatch.setattr(data, "get_provider", FileProvider)
+    store = SnapshotStore(str(tmp_path / "snapshot.sqlite"))
+    assert store.rebuild({"AAPL": history, "ONE": history.iloc[:1]}, [PERIOD], [X_DAYS]) == 1
+    assert store.read("ONE", PERIOD, X_DAYS) is None
+    return store.read("AAPL", PERIOD, X_DAYS)
+
+
+def test_live_figures_match_the_full_history(history, snapshot):
+    data_c = minute_bars(BAR_TIME + timedelta(days=1), 200.0, 50.0)
+    daily, x_day = live_results("AAPL", PERIOD, X_DAYS, snapshot.bars(), data_c, seed=snapshot.state)
+    today = pd.DataFrame({"High": [200.0], "Low": [50.0]}, index=pd.DatetimeIndex([data_c.index[-1].normalize()]))
+    full = pd.concat([history[["High", "Low"]], today])
+    assert_figures(compute_daily(full, PERIOD), result_figures(daily))
+    assert_figures(compute_x_day(full, PERIOD, X_DAYS), result_figures(x_day))
+    assert x_day.high == 200.0 and x_day.low == 50.0
+
+
+def test_usable(snapshot):
+    assert snapshot.usable(minute_bars(BAR_TIME, 200.0, 50.0))
+    assert snapshot.usable(minute_bars(BAR_TIME + timedelta(days=1), 200.0, 50.0))
+    # Wednesday's bar is missing from a Thursday session
+    assert not snapshot.usable(minute_bars(BAR_TIME + timedelta(days=2), 200.0, 50.0))
+    assert not snapshot.usable(minute_bars(BAR_TIME - timedelta(days=1), 200.0, 50.0))
+
+
+def test_usable_over_a_weekend(history, tmp_path, monkeypatch):
+    monkeypatch.setattr(data, "get_provider", FileProvider)
+    friday = BAR_TIME + timedelta(days=3)
+    history.index = pd.bdate_range(end=friday, periods=len(history), name="Date")
+    store = SnapshotStore(str(tmp_path / "snapshot.sqlite"))
+    store.rebuild({"AAPL": history}, [PERIOD], [X_DAYS])
+    snapshot = store.read("AAPL", PERIOD, X_DAYS)
+    assert snapshot.usable(minute_bars(friday + timedelta(days=3), 200.0, 50.0))
+    assert snapshot.weekly_for(minute_bars(friday + timedelta(days=3), 200.0, 50.0)) is None
+
+
+def test_weekly_for(history, snapshot):
+    weekly = compute_weekly(recent_weeks(resample_bars(history)), PERIOD)
+    assert_figures(weekly, result_figures(snapshot.weekly))
+    # Later in the same week: the session's range widens the week in progress
+    folded = snapshot.weekly_for(minute_bars(BAR_TIME + timedelta(days=1), 500.0, 1.0))
+    assert (folded.high, folded.low) == (500.0, 1.0)
+    assert (folded.average, folded.std) == (snapshot.weekly.average, snapshot.weekly.std)
+    # The next week moves the previous week and its statistics on
+    assert snapshot.weekly_for(minute_bars(BAR_TIME + timedelta(days=6), 200.0, 50.0)) is None
@@ -0,0 +1,129 @@
+"""Top-ups, coverage and adjusted histories of the bar store."""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from volatility import watchlist
+from volatility.store import BarStore, _intraday_limit
+
+START = pd.Timestamp("2024-01-02")
+END = pd.Timestamp("2024-04-01")
+
+
+class Source:
+    """A provider's daily bars; records every download."""
+
+    def __init__(self):
+        index = pd.bdate_range(START, END - timedelta(days=1), name="Date")
+        close = 100 + np.arange(len(index), dtype=float)
+        self.bars = pd.DataFrame({"Open": close - 0.5, "High": close + 1, "Low": close - 1, "Close": close,
+                                  "Adj Close": close * 0.98, "Volume": 1000.0}, index=index)
+        self.calls = []
+
+    def __call__(self, start, end):
+        self.calls.append(pd.Timestamp(start))
+        return self.bars[(self.bars.index >= pd.Timestamp(start).normalize()) & (self.bars.index < end)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BarStore(str(tmp_path / "bars.sqlite"), min_refresh=0)
+
+
+def test_tops_up_from_the_last_bar(store):
+    source = Source()
+    first = store.fetch("AAPL", "1d", START, END, source)
+    assert source.calls == [START]
+    pd.testing.assert_frame_equal(first, source.bars, check_freq=False)
+
+    store.fetch("AAPL", "1d", START, END, source)
+    assert source.calls == [START, source.bars.index[-1]]
+
+
+def test_fresh_bars_are_not_downloaded_again(tmp_path):
+    store = BarStore(str(tmp_path / "bars.sqlite"), min_refresh=3600)
+    source = Source()
+    store.fetch("AAPL", "1d", START, END, source)
+    assert store.plan("AAPL", "1d", START) is None
+    store.fetch("AAPL", "1d", START, END, source)
+    assert source.calls == [START]
+    # An earlier start than the covered span is downloaded from that start
+    assert store.plan("AAPL", "1d", START - timedelta(days=30)) == START - timedelta(days=30)
+
+
+@pytest.mark.parametrize("column, factor", [("Open", 0.5), ("Adj Close", 0.99)])
+def test_adjusted_history_is_downloaded_again(store, column, factor):
+    source = Source()
+    store.fetch("AAPL", "1d", START, END, source)
+    store.save("AAPL", "resample-W-MON", source.bars.iloc[:5])
+    # A split rescales every earlier price, a dividend every earlier Adj Close
+    adjusted = source.bars.copy()
+    if column == "Open":
+        adjusted[["Open", "High", "Low", "Close", "Adj Close"]] *= factor
+    else:
+        adjusted[column] *= factor
+    source.bars = adjusted
+
+    bars = store.fetch("AAPL", "1d", START, END, source)
+    assert source.calls == [START, adjusted.index[-1], START]
+    pd.testing.assert_frame_equal(bars, adjusted, check_freq=False)
+    # Bars derived from the old history are dropped with it
+    assert store.load("AAPL", "resample-W-MON").empty
+
+
+def test_other_symbols_keep_their_bars(store):
+    source, other = Source(), Source()
+    store.fetch("AAPL", "1d", START, END, source)
+    store.fetch("MSFT", "1d", START, END, other)
+    source.bars = source.bars * 2
+    store.fetch("AAPL", "1d", START, END, source)
+    assert other.calls == [START]
+    assert len(store.load("MSFT", "1d")) == len(other.bars)
+
+
+class BatchProvider:
+    cacheable = True
+
+    def __init__(self, sources):
+        self.sources = sources
+
+    def history_many(self, symbols, start, end, interval="1d"):
+        return {symbol: self.sources[symbol](start, end) for symbol in symbols}
+
+
+def test_watchlist_downloads_adjusted_symbols_again(store, monkeypatch):
+    sources = {"AAPL": Source(), "MSFT": Source()}
+    monkeypatch.setattr(watchlist, "get_provider", lambda: BatchProvider(sources))
+    monkeypatch.setattr(watchlist, "get_store", lambda: store)
+    watchlist.download_many(["AAPL", "MSFT"], START, END)
+    sources["AAPL"].bars = sources["AAPL"].bars * 2
+    histories = watchlist.download_many(["AAPL", "MSFT"], START, END)
+    assert sources["AAPL"].calls[-1] == START
+    assert sources["MSFT"].calls[-1] == sources["MSFT"].bars.index[-1]
+    pd.testing.assert_frame_equal(histories["AAPL"], sources["AAPL"].bars, check_freq=False)
+
+
+def test_intraday_start_is_clamped(store):
+    start = pd.Timestamp(datetime.today() - timedelta(days=30))
+    assert store.plan("AAPL", "1m", start) == _intraday_limit()
+    assert store.plan("AAPL", "1d", start) == start
+
+
+def test_adjusted_session_is_downloaded_again(store):
+    index = pd.date_range(pd.Timestamp(datetime.today()).normalize() + timedelta(hours=9, minutes=30),
+                          periods=10, freq="1min", name="Datetime")
+    bars = pd.DataFrame({"Open": 10.0, "High": 11.0, "Low": 9.0, "Close": 10.0, "Adj Close": 10.0,
+                         "Volume": 1.0}, index=index)
+    sessions = []
+
+    def download_session():
+        sessions.append(True)
+        return bars
+
+    assert len(store.fetch_latest_session("AAPL", "1m", download_session, lambda start, end: bars)) == 10
+    assert len(sessions) == 1
+    split = bars * 0.5
+    store.fetch_latest_session("AAPL", "1m", download_session, lambda start, end: split.iloc[-1:])
+    assert len(sessions) == 2
@@ -0,0 +1,3 @@
+from volatility.cli import main
+
+main()
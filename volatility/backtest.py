@@ -0,0 +1,149 @@
+"""Historical evaluation of the Buy/Sell volatility signal.
+
+The dashboard only evaluates the rule for the previous bar.  Here it is
+evaluated for every bar of the history at once: a bar whose range is above
+``average * (1 + v_alert)`` is a Sell (short), one below
+``average * (1 - v_alert)`` a Buy (long).  Each signal opens a trade at that
+bar's close and closes it ``hold`` bars later, so trades may overlap when
+``hold > 1``.  Averages only use bars up to the signal bar, so there is no
+look-ahead (the x-day tab's live average, which includes the bar in
+progress, has no historical equivalent).
+
+:func:`sweep` evaluates grids of ``period``, ``x_days`` and ``v_alert`` and
+spreads the (horizon, period, x_days) combinations over processes; all
+``v_alert`` values of a combination reuse the same rolling averages.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from volatility.data import resample_bars
+from volatility.engine import BUY, SELL
+
+HORIZONS = ("daily", "x_day", "weekly")
+TRADE_COLUMNS = ["entry_date", "exit_date", "side", "entry_price", "exit_price", "pnl", "return"]
+
+
+@dataclass
+class BacktestResult:
+    horizon: str
+    period: int
+    x_days: int
+    v_alert: float
+    hold: int
+    trades: pd.DataFrame
+    summary: dict
+
+
+def horizon_series(data, horizon, period, x_days=1):
+    """Bars, range and rolling average range of one horizon over the whole history."""
+    if horizon == "weekly":
+        bars = resample_bars(data)
+    elif horizon in ("daily", "x_day"):
+        bars = data
+    else:
+        raise ValueError(f"Unknown horizon: {horizon}")
+    if horizon == "x_day":
+        volatility = bars["High"].rolling(window=x_days).max() - bars["Low"].rolling(window=x_days).min()
+    else:
+        volatility = bars["High"] - bars["Low"]
+    return bars, volatility.to_numpy(), volatility.rolling(period).mean().to_numpy()
+
+
+def signal_array(volatility, average, v_alert):
+    """+1 for Buy, -1 for Sell and 0 for no signal, bar by bar."""
+    with np.errstate(invalid="ignore"):
+        return np.select([volatility > average * (1 + v_alert), volatility < average * (1 - v_alert)],
+                         [-1, 1], default=0)
+
+
+def trade_list(bars, sides, hold=1):
+    close = bars["Close"].to_numpy(dtype=float)
+    entries = np.flatnonzero(sides[:max(len(close) - hold, 0)])
+    exits = entries + hold
+    direction = sides[entries]
+    pnl = (close[exits] - close[entries]) * direction
+    return pd.DataFrame({
+        "entry_date": bars.index[entries],
+        "exit_date": bars.index[exits],
+        "side": np.where(direction > 0, BUY, SELL),
+        "entry_price": close[entries],
+        "exit_price": close[exits],
+        "pnl": pnl,
+        "return": pnl / close[entries],
+    }, columns=TRADE_COLUMNS)
+
+
+def _summary(pnl, returns, direction):
+    summary = {"trades": len(pnl)}
+    for name, mask in (("", slice(None)), ("buy_", direction > 0), ("sell_", direction < 0)):
+        selected = pnl[mask]
+        summary[f"{name}trades"] = len(selected)
+        summary[f"{name}hit_rate"] = float((selected > 0).mean()) if len(selected) else np.nan
+    summary["total_pnl"] = float(pnl.sum())
+    summary["mean_return"] = float(returns.mean()) if len(returns) else np.nan
+    summary["total_return"] = float(returns.sum())
+    return summary
+
+
+def summarize(trades):
+    direction = np.where(trades["side"].to_numpy() == BUY, 1, -1)
+    return _summary(trades["pnl"].to_numpy(), trades["return"].to_numpy(), direction)
+
+
+def backtest(data, horizon="daily", period=50, x_days=1, v_alert=0.0, hold=1):
+    bars, volatility, average = horizon_series(data, horizon, period, x_days)
+    trades = trade_list(bars, signal_array(volatility, average, v_alert), hold)
+    return BacktestResult(horizon, period, x_days, v_alert, hold, trades, summarize(trades))
+
+
+_worker_data = None
+
+
+def _init_worker(data):
+    global _worker_data
+    _worker_data = data
+
+
+def _sweep_task(task):
+    # Runs in a worker: one rolling pass, then every threshold on top of it
+    horizon, period, x_days, v_alerts, hold = task
+    bars, volatility, average = horizon_series(_worker_data, horizon, period, x_days)
+    close = bars["Close"].to_numpy(dtype=float)
+    usable = max(len(close) - hold, 0)
+    forward = np.full(len(close), np.nan)
+    forward[:usable] = close[hold:hold + usable] - close[:usable]
+    rows = []
+    for v_alert in v_alerts:
+        sides = signal_array(volatility, average, v_alert)
+        entries = np.flatnonzero(sides[:usable])
+        direction = sides[entries]
+        pnl = forward[entries] * direction
+        row = {"horizon": horizon, "period": period, "x_days": x_days, "v_alert": v_alert, "hold": hold}
+        row.update(_summary(pnl, pnl / close[entries], direction))
+        rows.append(row)
+    return rows
+
+
+def sweep(data, periods, x_days_values=(1,), v_alerts=(0.0,), horizons=HORIZONS, hold=1, max_workers=None):
+    """Summary statistics for every parameter combination, one row each.
+
+    ``x_days_values`` only applies to the x-day horizon.  ``max_workers=1``
+    runs in-process, which is faster for small grids.
+    """
+    tasks = []
+    for horizon in horizons:
+        for period, x_days in product(periods, x_days_values if horizon == "x_day" else (1,)):
+            tasks.append((horizon, int(period), int(x_days), tuple(v_alerts), hold))
+    if max_workers == 1:
+        _init_worker(data)
+        results = map(_sweep_task, tasks)
+        rows = [row for task_rows in results for row in task_rows]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(data,)) as pool:
+            results = pool.map(_sweep_task, tasks, chunksize=max(1, len(tasks) // 64))
+            rows = [row for task_rows in results for row in task_rows]
+    return pd.DataFrame(rows)
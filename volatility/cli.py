@@ -0,0 +1,186 @@
+"""Headless entry point: ``python -m volatility <command>``.
+
+Runs the same download, rolling band and signal computation as the
+dashboard without Streamlit, e.g. for cron jobs.  Heavy modules are
+imported inside the commands so ``--help`` and argument errors return
+immediately.
+
+    python -m volatility scan AAPL MSFT --period 50 --x-days 5 -o scan.csv
+    python -m volatility scan --symbols-file universe.txt -o scan.parquet
+    python -m volatility backtest AAPL --periods 20:100:10 --v-alerts 0,0.05,0.1 -o grid.json
+    python -m volatility export --symbols-file universe.txt -o history.parquet
+    python -m volatility snapshot --symbols-file universe.txt --periods 20,50 --x-days 1,5
+    python -m volatility sensitivity AAPL MSFT --periods 10:251 --x-days 5 -o sensitivity.csv
+    python -m volatility alerts --symbols-file universe.txt --sink log:alerts.log --interval 60
+"""
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+
+def _int_range(text):
+    # "20:100:10" -> 20, 30, ..., 90; "20,50" -> 20, 50
+    if ":" in text:
+        return list(range(*(int(part) for part in text.split(":"))))
+    return [int(part) for part in text.split(",")]
+
+
+def _floats(text):
+    return [float(part) for part in text.split(",")]
+
+
+def _symbols(args):
+    from volatility.watchlist import parse_symbols
+    text = " ".join(args.symbols)
+    if args.symbols_file:
+        with open(args.symbols_file) as handle:
+            text += " " + handle.read()
+    symbols = parse_symbols(text)
+    if not symbols:
+        sys.exit("no symbols given")
+    return symbols
+
+
+def scan(args):
+    from volatility.export import write_table
+    from volatility.watchlist import add_signals, run_watchlist
+
+    table = add_signals(run_watchlist(_symbols(args), args.period, args.x_days), args.v_alert)
+    write_table(table, args.output, args.format)
+
+
+def backtest(args):
+    from volatility.backtest import sweep
+    from volatility.data import download_daily
+    from volatility.export import write_table
+
+    frames = []
+    for symbol in _symbols(args):
+        data = download_daily(symbol, days=args.days)
+        if data.empty:
+            print(f"No data available for the stock code: {symbol}", file=sys.stderr)
+            continue
+        result = sweep(data, args.periods, args.x_days, args.v_alerts, hold=args.hold, max_workers=args.workers)
+        result.insert(0, "symbol", symbol)
+        frames.append(result)
+    if frames:
+        import pandas as pd
+        write_table(pd.concat(frames, ignore_index=True).set_index("symbol"), args.output, args.format)
+
+
+def export(args):
+    from volatility.export import symbol_parts, table_format, write_parts
+    from volatility.watchlist import watchlist_frames
+
+    fmt = args.format or table_format(args.output)
+    if fmt == "json":
+        sys.exit("export writes csv or parquet")
+    frames = watchlist_frames(_symbols(args), args.period, args.x_days, args.days)
+    write_parts(symbol_parts(frames), sys.stdout.buffer if args.output == "-" else args.output, fmt)
+
+
+def snapshot(args):
+    from volatility.snapshot import DEFAULT_PATH, build_snapshot
+
+    path = args.snapshot or DEFAULT_PATH
+    rows = build_snapshot(_symbols(args), args.periods, args.x_days, path, args.days)
+    print(f"{rows} rows written to {path}", file=sys.stderr)
+
+
+def sensitivity(args):
+    from volatility.export import write_table
+    from volatility.sensitivity import add_signals, sweep_many
+    from volatility.watchlist import download_many
+
+    end_date = datetime.today()
+    histories = download_many(_symbols(args), end_date - timedelta(days=args.days), end_date)
+    table = add_signals(sweep_many(histories, args.periods, args.x_days, max_workers=args.workers), args.v_alert)
+    write_table(table.reset_index(["horizon", "period"]), args.output, args.format)
+
+
+def alerts(args):
+    from volatility.alerts import DEFAULT_PATH, AlertDaemon, AlertLog, parse_sink
+
+    try:
+        sinks = [parse_sink(spec) for spec in args.sink or ["log:-"]]
+    except ValueError as error:
+        sys.exit(str(error))
+    daemon = AlertDaemon(_symbols(args), args.period, args.x_days, args.v_alert, sinks,
+                         AlertLog(args.state or DEFAULT_PATH), args.interval)
+    try:
+        daemon.run(cycles=1 if args.once else None)
+    except KeyboardInterrupt:
+        pass
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m volatility",
+                                     description="Run the volatility pipeline without Streamlit.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(command):
+        command.add_argument("symbols", nargs="*", help="stock codes")
+        command.add_argument("--symbols-file", help="file with stock codes separated by spaces, commas or lines")
+        command.add_argument("-o", "--output", default="-", help="output file (.csv, .parquet, .json); default stdout")
+        command.add_argument("--format", choices=("csv", "parquet", "json"), help="override the output format")
+
+    command = commands.add_parser("scan", help="latest bands and Buy/Sell signals per symbol")
+    add_common(command)
+    command.add_argument("--period", type=int, default=50, help="rolling period (default 50)")
+    command.add_argument("--x-days", type=int, default=1, help="days of the x-day range (default 1)")
+    command.add_argument("--v-alert", type=float, default=0.0, help="signal threshold as a fraction, 0.05 = 5%%")
+    command.set_defaults(handler=scan)
+
+    command = commands.add_parser("backtest", help="backtest the signal over parameter grids")
+    add_common(command)
+    command.add_argument("--periods", type=_int_range, default=[50], help="e.g. 20,50 or 20:100:10")
+    command.add_argument("--x-days", type=_int_range, default=[1], help="e.g. 1,3,5 or 1:11")
+    command.add_argument("--v-alerts", type=_floats, default=[0.0], help="e.g. 0,0.05,0.1")
+    command.add_argument("--hold", type=int, default=1, help="bars each trade is held (default 1)")
+    command.add_argument("--days", type=int, default=1800, help="days of daily history (default 1800)")
+    command.add_argument("--workers", type=int, help="worker processes (default: one per core)")
+    command.set_defaults(handler=backtest)
+
+    command = commands.add_parser("export", help="daily and x-day columns of every symbol in one table")
+    add_common(command)
+    command.add_argument("--period", type=int, default=50, help="rolling period (default 50)")
+    command.add_argument("--x-days", type=int, default=1, help="days of the x-day range (default 1)")
+    command.add_argument("--days", type=int, default=1800, help="days of daily history (default 1800)")
+    command.set_defaults(handler=export)
+
+    command = commands.add_parser("snapshot", help="precompute the dashboard state for a universe of symbols")
+    command.add_argument("symbols", nargs="*", help="stock codes")
+    command.add_argument("--symbols-file", help="file with stock codes separated by spaces, commas or lines")
+    command.add_argument("--periods", type=_int_range, default=[50], help="e.g. 20,50 or 20:100:10")
+    command.add_argument("--x-days", type=_int_range, default=[1], help="e.g. 1,3,5 or 1:11")
+    command.add_argument("--days", type=int, default=1800, help="days of daily history (default 1800)")
+    command.add_argument("--snapshot", help="snapshot file (default: VOLATILITY_SNAPSHOT or ~/.volatility)")
+    command.set_defaults(handler=snapshot)
+
+    command = commands.add_parser("sensitivity", help="bands and signals of every symbol for a range of periods")
+    add_common(command)
+    command.add_argument("--periods", type=_int_range, default=list(range(10, 251)), help="e.g. 10:251 (default)")
+    command.add_argument("--x-days", type=int, default=1, help="days of the x-day range (default 1)")
+    command.add_argument("--v-alert", type=float, default=0.0, help="signal threshold as a fraction, 0.05 = 5%%")
+    command.add_argument("--days", type=int, default=1800, help="days of daily history (default 1800)")
+    command.add_argument("--workers", type=int, help="worker processes (default: one per core)")
+    command.set_defaults(handler=sensitivity)
+
+    command = commands.add_parser("alerts", help="raise Buy/Sell alerts for a universe of symbols in the background")
+    command.add_argument("symbols", nargs="*", help="stock codes")
+    command.add_argument("--symbols-file", help="file with stock codes separated by spaces, commas or lines")
+    command.add_argument("--period", type=int, default=50, help="rolling period (default 50)")
+    command.add_argument("--x-days", type=int, default=1, help="days of the x-day range (default 1)")
+    command.add_argument("--v-alert", type=float, default=0.0, help="signal threshold as a fraction, 0.05 = 5%%")
+    command.add_argument("--interval", type=float, default=60, help="seconds between evaluations (default 60)")
+    command.add_argument("--sink", action="append",
+                         help="log:PATH, webhook:URL or smtp://HOST:PORT?to=ADDR; repeatable (default log:-)")
+    command.add_argument("--state", help="file of raised alerts (default: VOLATILITY_ALERTS or ~/.volatility)")
+    command.add_argument("--once", action="store_true", help="evaluate once and exit")
+    command.set_defaults(handler=alerts)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.handler(args)
@@ -0,0 +1,80 @@
+"""Request coalescing for downloads shared by many sessions and processes.
+
+:class:`KeyedLock` serializes work per key.  Within a process it is a plain
+lock per key (per stripe of the lock file, if there is one); with a lock
+file it also takes a byte-range lock on that file, so several server
+processes sharing one bar store (e.g. behind a load balancer) coalesce as
+well.  The bar store holds it around "is this fresh?
+-> download -> save", so when twenty sessions ask for the same symbol the
+first one downloads and the others find fresh bars once they get the lock.
+"""
+import os
+import threading
+import zlib
+from contextlib import contextmanager
+
+from volatility import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows: coalesce within the process only
+    fcntl = None
+
+
+class KeyedLock:
+    """One lock per key, optionally shared between processes through ``path``.
+
+    Keys are hashed onto ``stripes`` byte offsets of the lock file, so
+    unrelated keys rarely wait for each other and the file stays empty.
+    With a lock file the threads of a process queue per stripe rather than
+    per key: a record lock belongs to the process, so two keys on one
+    stripe must not hold it at once, or the first to leave would release it
+    for the second.
+    """
+
+    def __init__(self, path=None, stripes=4096):
+        self.path = path if fcntl is not None else None
+        self.stripes = stripes
+        self._guard = threading.Lock()
+        # slot -> [lock, number of threads holding or waiting for it]
+        self._locks = {}
+        self._fd = None
+
+    def _file(self):
+        with self._guard:
+            if self._fd is None:
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            return self._fd
+
+    @contextmanager
+    def hold(self, *key):
+        slot = key if self.path is None else zlib.crc32(repr(key).encode("utf-8")) % self.stripes
+        with self._guard:
+            entry = self._locks.setdefault(slot, [threading.Lock(), 0])
+            entry[1] += 1
+        lock = entry[0]
+        try:
+            if not lock.acquire(blocking=False):
+                metrics.increment("coalesced_waits_total", scope="thread")
+                lock.acquire()
+            try:
+                if self.path is None:
+                    yield
+                else:
+                    fd = self._file()
+                    try:
+                        fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, slot)
+                    except OSError:
+                        metrics.increment("coalesced_waits_total", scope="process")
+                        fcntl.lockf(fd, fcntl.LOCK_EX, 1, slot)
+                    try:
+                        yield
+                    finally:
+                        fcntl.lockf(fd, fcntl.LOCK_UN, 1, slot)
+            finally:
+                lock.release()
+        finally:
+            with self._guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[slot]
@@ -0,0 +1,603 @@
+"""Streamlit rendering of the volatility dashboard.
+
+Every page calls :func:`run` with its own labels.  The cached loaders live
+at module level so one computed result is shared by all language pages and
+sessions of the server process.
+"""
+import functools
+import io
+import threading
+
+import altair as alt
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import StopException, add_script_run_ctx, get_script_run_ctx
+
+from volatility import export, metrics, sensitivity
+from volatility.data import download_daily, download_data_current, download_intraday, download_weekly
+from volatility.engine import (BUY, DERIVED_COLUMNS, SELL, compact_frame, compute_daily, compute_intraday,
+                               compute_weekly, compute_x_day)
+from volatility.estimators import ESTIMATORS, annualized, price_band, rolling_estimators
+from volatility.feeds import CsvReplayFeed, PollingFeed
+from volatility.fetch import gather
+from volatility.horizons import MAX_HORIZON, horizon_matrix
+from volatility.incremental import VolatilityState
+from volatility.snapshot import SnapshotStore
+from volatility.watchlist import add_signals, parse_symbols, run_watchlist, watchlist_frames
+
+# Cached results expire after CACHE_TTL seconds; at most CACHE_MAX_ENTRIES
+# (symbol, period, x_days) combinations are kept per function.  The bars are
+# cached once per symbol and the daily/x-day results only keep their derived
+# columns (as VOLATILITY_CACHE_DTYPE), so exports join them back together.
+CACHE_TTL = 600
+CACHE_MAX_ENTRIES = 64
+CURRENT_PRICE_TTL = 60
+INTRADAY_MINUTES = (5, 15, 30, 60)
+INTRADAY_SESSIONS = 5
+# Seconds the page waits for its downloads before rendering what it has
+PAGE_FETCH_TIMEOUT = 8
+SEPARATOR = "_________________________"
+# The page sections, in the order of labels["tabs"]
+SECTIONS = ("daily", "x_day", "weekly", "horizons", "intraday", "sensitivity")
+
+
+def _counted(loader):
+    """Count lookups of a cached loader; its body counts the misses.
+
+    Streamlit does not report cache hits, so hits are lookups minus misses.
+    """
+    @functools.wraps(loader)
+    def lookup(*args):
+        metrics.increment("cache_lookups_total", cache=loader.__name__)
+        return loader(*args)
+    lookup.clear = loader.clear
+    return lookup
+
+
+def _miss(name):
+    metrics.increment("cache_misses_total", cache=name)
+
+
+@_counted
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_history(stock_code):
+    _miss("load_history")
+    return compact_frame(download_daily(stock_code))
+
+
+@_counted
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_daily(stock_code, period):
+    _miss("load_daily")
+    history = load_history(stock_code)
+    if history.empty:
+        return None
+    return compute_daily(history, period).compact(DERIVED_COLUMNS["daily"])
+
+
+@_counted
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_x_day(stock_code, period, x_days):
+    _miss("load_x_day")
+    history = load_history(stock_code)
+    if history.empty:
+        return None
+    return compute_x_day(history, period, x_days).compact(DERIVED_COLUMNS["x_day"])
+
+
+@_counted
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_weekly(stock_code, period):
+    _miss("load_weekly")
+    history = load_history(stock_code)
+    if history.empty:
+        return None
+    return compute_weekly(download_weekly(stock_code, daily=history), period).compact()
+
+
+@_counted
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_estimators(stock_code, period, horizon):
+    # All estimators at once, so switching between them is a cache hit
+    _miss("load_estimators")
+    bars = load_history(stock_code) if horizon == "daily" else load_weekly(stock_code, period).frame
+    return compact_frame(rolling_estimators(bars, period))
+
+
+@_counted
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_horizons(stock_code, period, max_horizon):
+    # Every horizon from one sparse table, so x_days changes need no recomputation
+    _miss("load_horizons")
+    return horizon_matrix(load_history(stock_code), period, range(1, max_horizon + 1))
+
+
+@_counted
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_sensitivity(stock_code, x_days):
+    # Every period at once, so changing the period input needs no recomputation
+    _miss("load_sensitivity")
+    history = load_history(stock_code)
+    # The weekly bars of the weekly section, so both give the same figures
+    return sensitivity.period_sweep(history, sensitivity.PERIODS, x_days,
+                                    weekly=download_weekly(stock_code, daily=history))
+
+
+@_counted
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_watchlist(symbols, period, x_days):
+    _miss("load_watchlist")
+    return run_watchlist(list(symbols), period, x_days)
+
+
+@_counted
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_snapshot(stock_code, period, x_days):
+    _miss("load_snapshot")
+    return SnapshotStore().read(stock_code, period, x_days)
+
+
+@_counted
+@st.cache_data(ttl=CURRENT_PRICE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_intraday(stock_code, minutes, sessions):
+    # Includes the bar in progress, so it expires like the current price
+    _miss("load_intraday")
+    bars = download_intraday(stock_code, minutes, sessions)
+    if len(bars) < 2:
+        return None
+    return compute_intraday(bars, sessions).compact(DERIVED_COLUMNS["intraday"])
+
+
+@_counted
+@st.cache_data(ttl=CURRENT_PRICE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_current(stock_code):
+    _miss("load_current")
+    return download_data_current(stock_code)
+
+
+def _in_script_context(func):
+    # Cached loaders only read and write st.cache_data from a thread that
+    # carries the script run context
+    ctx = get_script_run_ctx()
+
+    def call():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return func()
+    return call
+
+
+def load_page_data(stock_code, with_history=True, with_current=True):
+    """Fetch the history and the current price concurrently.
+
+    Returns ``(history, data_c, errors)``; a source that failed or is still
+    loading after PAGE_FETCH_TIMEOUT is None and has an entry in ``errors``.
+    """
+    tasks = {}
+    if with_history:
+        tasks["history"] = _in_script_context(lambda: load_history(stock_code))
+    if with_current:
+        tasks["current"] = _in_script_context(lambda: load_current(stock_code))
+    loaded, errors = gather(tasks, timeout=PAGE_FETCH_TIMEOUT)
+    return loaded.get("history"), loaded.get("current"), errors
+
+
+def daily_export(stock_code, period, x_days):
+    """The daily tab's table: bars plus the daily and x-day columns."""
+    return pd.concat([load_history(stock_code), load_daily(stock_code, period).frame,
+                      load_x_day(stock_code, period, x_days).frame], axis=1)
+
+
+@metrics.timed("stats.live")
+def live_results(stock_code, period, x_days, history, data_c, seed=None):
+    """Daily and x-day results for the bar in progress.
+
+    Rolling statistics of the completed bars live in session_state, so a
+    rerun only pushes the bars that arrived since the last one and combines
+    them with today's high/low from the 1-minute data.  ``seed`` is a state
+    that already covers every bar of ``history`` but the last, e.g. from
+    the nightly snapshot.
+    """
+    completed = history.iloc[:-1]
+    high, low = history["High"].iloc[-1], history["Low"].iloc[-1]
+    if not data_c.empty:
+        session = data_c.index[-1].normalize()
+        if session > history.index[-1]:
+            # The cached history does not have today's bar yet
+            completed = history
+            high, low = data_c["High"].max(), data_c["Low"].min()
+        elif session == history.index[-1]:
+            high, low = max(high, data_c["High"].max()), min(low, data_c["Low"].min())
+
+    states = st.session_state.setdefault("volatility_states", {})
+    key = (stock_code, period, x_days)
+    if key not in states:
+        if len(states) >= CACHE_MAX_ENTRIES:
+            states.pop(next(iter(states)))
+        states[key] = seed if seed is not None else VolatilityState(period, x_days)
+    state = states[key].catch_up(completed)
+    return state.daily(high, low), state.x_day(high, low)
+
+
+def _big(text, color, size):
+    st.markdown(f"""
+    <span style="font-size: {size}px; color: {color};">
+    {text}
+    </span>
+    """, unsafe_allow_html=True)
+
+
+def _note(text):
+    st.markdown(f'<span style="color: blue;">{text}</span>', unsafe_allow_html=True)
+
+
+def render_price(labels, data_c):
+    if data_c.empty:
+        return
+    current_price = data_c["Close"].iloc[-1]
+    update_time = data_c.index[-1]
+    _big(labels["price"].format(price=round(current_price, 2)), "green", 34)
+    st.write(labels["last_update"], update_time)
+
+
+def render_tab(result, labels, horizon, period, x_days, v_alert, band_mode="std"):
+    with metrics.timer("render.tab", horizon=horizon):
+        _render_tab(result, labels, horizon, period, x_days, v_alert, band_mode)
+
+
+def _render_tab(result, labels, horizon, period, x_days, v_alert, band_mode):
+    texts = labels[horizon]
+    col1, col2 = st.columns(2)
+    with col1:
+        _big(texts["range"].format(x_days=x_days, value=result.range), "green", 24)
+    with col2:
+        _big(texts["high"].format(x_days=x_days, value=result.high) + "<br>\n    "
+             + texts["low"].format(x_days=x_days, value=result.low), "green", 24)
+
+    st.write(SEPARATOR)
+    notes = [
+        texts["previous"].format(x_days=x_days, value=result.volatility),
+        labels["average"].format(period=period, value=result.average),
+        labels["std"].format(value=result.std),
+    ]
+    if band_mode == "quantile":
+        band, band_labels = result.quantile_band, labels["quantile_bands"]
+    else:
+        band, band_labels = result.band, labels["std_bands"]
+    for n, (column, label, note) in enumerate(zip(st.columns(3), band_labels, notes), start=1):
+        with column:
+            lower, upper = band(n)
+            st.metric(label=label, value=f"{lower:.5} - {upper:.5}")
+            _note(note)
+    st.write(texts["previous_date"].format(x_days=x_days), result.previous_date)
+
+    st.write(SEPARATOR)
+    signal = result.signal(v_alert)
+    if signal == SELL:
+        _big(labels["sell"], "red", 34)
+        _big(texts["higher"].format(x_days=x_days, volatility=result.volatility, average=result.average), "red", 24)
+    elif signal == BUY:
+        _big(labels["buy"], "green", 34)
+        _big(texts["lower"].format(x_days=x_days, volatility=result.volatility, average=result.average), "green", 24)
+
+
+def render_estimator(labels, horizon, name, estimates, bars, period):
+    """The selected estimator for the last completed bar and the price bands it implies."""
+    sigma = estimates[name].iloc[-2]
+    close = bars["Close"].iloc[-2]
+    st.write(SEPARATOR)
+    st.write(labels["estimator_value"].format(name=labels["estimators"][name], period=period,
+                                              value=annualized(sigma, horizon)))
+    for n, (column, label) in enumerate(zip(st.columns(3), labels["estimator_bands"]), start=1):
+        with column:
+            lower, upper = price_band(close, sigma, n)
+            st.metric(label=label, value=f"{lower:.5} - {upper:.5}")
+    st.write(labels["estimator_close"], bars.index[-2])
+
+
+def render_horizons(labels, matrix, period, fmt):
+    """Horizon x band heatmap of :func:`horizon_matrix`, coloured relative to each horizon's average."""
+    bands = labels["horizon_bands"]
+    cells = matrix[list(bands)].rename_axis("x_days").reset_index().melt(
+        id_vars="x_days", var_name="band", value_name="value")
+    cells["relative"] = cells["value"] / cells["x_days"].map(matrix["average"])
+    cells["band"] = cells["band"].map(bands)
+    base = alt.Chart(cells).encode(
+        x=alt.X("band:N", sort=list(bands.values()), title=None),
+        y=alt.Y("x_days:O", title=labels["horizon_axis"]),
+    )
+    heatmap = base.mark_rect().encode(
+        color=alt.Color("relative:Q", scale=alt.Scale(scheme="redyellowgreen", reverse=True),
+                        title=labels["horizon_relative"]),
+        tooltip=["x_days", "band", alt.Tooltip("value:Q", format=".2f"), alt.Tooltip("relative:Q", format=".2f")],
+    )
+    text = base.mark_text(fontSize=11).encode(text=alt.Text("value:Q", format=".2f"))
+    st.caption(labels["horizons_caption"].format(period=period, max_horizon=len(matrix)))
+    st.altair_chart(heatmap + text, use_container_width=True)
+    render_download(labels, [matrix], "horizon_volatility", fmt, "horizons_download")
+
+
+def render_intraday(labels, stock_code, v_alert, band_mode):
+    minutes = st.selectbox(labels["intraday_minutes"], INTRADAY_MINUTES)
+    sessions = st.number_input(labels["intraday_sessions"], value=INTRADAY_SESSIONS, min_value=1, step=1)
+    result = load_intraday(stock_code, minutes, int(sessions))
+    # The store only fills up to ``sessions`` sessions as the days pass
+    if result is None or pd.isna(result.average):
+        st.info(labels["intraday_unavailable"].format(x_days=minutes))
+        return
+    st.caption(labels["intraday_caption"].format(x_days=minutes, period=int(sessions)))
+    render_tab(result, labels, "intraday", int(sessions), minutes, v_alert, band_mode)
+
+
+def render_sensitivity(labels, table, period, x_days, v_alert, fmt):
+    """Bands of one horizon against the rolling period, with the period in use marked."""
+    horizons = ("daily", "x_day", "weekly")
+    names = dict(zip(horizons, (name.format(x_days=x_days) for name in labels["tabs"])))
+    horizon = st.radio(labels["sensitivity_horizon"], horizons, format_func=names.get, horizontal=True)
+    rows = sensitivity.add_signals(table.loc[horizon], v_alert)
+    series = dict(labels["horizon_bands"], volatility=labels["sensitivity_previous"])
+    series.pop("range")
+    lines = rows[list(series)].rename(columns=series).reset_index().melt(
+        id_vars="period", var_name="band", value_name="value")
+    chart = alt.Chart(lines).mark_line().encode(
+        x=alt.X("period:Q", title=labels["sensitivity_axis"]),
+        y=alt.Y("value:Q", title=labels["sensitivity_value"]),
+        color=alt.Color("band:N", sort=list(series.values()), title=None),
+        tooltip=["period", "band", alt.Tooltip("value:Q", format=".2f")],
+    )
+    rule = alt.Chart(pd.DataFrame({"period": [period]})).mark_rule(strokeDash=[4, 4]).encode(x="period:Q")
+    st.caption(labels["sensitivity_caption"].format(low=rows.index[0], high=rows.index[-1], period=period))
+    st.altair_chart(chart + rule, use_container_width=True)
+
+    signals = {SELL: labels["sell"], BUY: labels["buy"]}
+    columns = dict(series, std=labels["watchlist_columns"]["std"], signal=labels["watchlist_columns"]["signal"])
+    shown = rows.assign(signal=rows["signal"].map(signals).fillna(""))
+    st.dataframe(shown.rename(columns=columns).rename_axis(labels["sensitivity_axis"]), use_container_width=True)
+    render_download(labels, [rows], f"{horizon}_sensitivity", fmt, "sensitivity_download")
+
+
+def render_download(labels, parts, file_name, fmt, key):
+    """Offer ``parts`` for download, encoding them only after the user asks.
+
+    Streamlit 1.20's download button needs the finished file, so a first
+    button prepares it on demand instead of encoding on every rerun.
+    ``parts`` may be a callable so the frames are not even built before that.
+    """
+    if not st.button(labels["prepare_download"], key=key):
+        return
+    with metrics.timer("export", format=fmt):
+        data = export.to_bytes(parts() if callable(parts) else parts, fmt)
+    st.download_button(
+        label=labels["download"][fmt],
+        data=data,
+        file_name=f"{file_name}.{fmt}",
+        mime=export.MIME_TYPES[fmt],
+        key=f"{key}_file",
+    )
+
+
+def render_watchlist(labels, symbols, period, x_days, v_alert, fmt, band_mode="std"):
+    # Threshold changes only redo the signal columns on the cached table
+    table = add_signals(load_watchlist(tuple(symbols), period, x_days), v_alert)
+    # Show one set of bands; the export keeps both
+    hidden = [column for column in table.columns
+              if column.startswith(("lower_", "upper_") if band_mode == "quantile" else "q_")]
+    signals = {SELL: labels["sell"], BUY: labels["buy"]}
+    table["signal"] = table["signal"].map(signals).fillna("")
+    table["x_day_signal"] = table["x_day_signal"].map(signals).fillna("")
+    columns = {key: name.format(x_days=x_days) for key, name in labels["watchlist_columns"].items()}
+    st.dataframe(table.drop(columns=hidden).rename(columns=columns).rename_axis(columns["symbol"]),
+                 use_container_width=True)
+    render_download(labels, [table], "watchlist", fmt, "watchlist_download")
+    render_download(labels, lambda: export.symbol_parts(watchlist_frames(symbols, period, x_days)),
+                    "watchlist_history", fmt, "watchlist_bulk_download")
+
+
+def render_debug_panel(labels):
+    """Process-wide stage timings and counters, for diagnosing slow pages."""
+    with st.sidebar.expander(labels["debug_panel"], expanded=True):
+        st.caption(labels["debug_timings"])
+        st.dataframe(metrics.timings().round(3), use_container_width=True)
+        st.caption(labels["debug_counters"])
+        st.dataframe(metrics.counters(), use_container_width=True)
+
+
+def _feed(stock_code, poll_interval, replay):
+    # One feed per session; a new symbol or source replaces the old feed
+    key = (stock_code, poll_interval, None if replay is None else replay.id)
+    current = st.session_state.get("volatility_feed")
+    if current is not None:
+        # A feed stopped with its last session is started again
+        if current[0] == key and not current[1].stopped:
+            return current[1]
+        current[1].stop()
+    if replay is not None:
+        # The feed thread gets its own copy of the uploaded bytes
+        feed = CsvReplayFeed(io.BytesIO(replay.getvalue()))
+    else:
+        feed = PollingFeed(stock_code, poll_interval)
+    st.session_state["volatility_feed"] = (key, feed.start())
+    return feed
+
+
+def _stop_feed():
+    current = st.session_state.pop("volatility_feed", None)
+    if current is not None:
+        current[1].stop()
+
+
+def stream(feed, labels, stock_code, period, x_days, v_alert, history, data_c, slots, band_mode="std"):
+    """Redraw the price and the live section whenever the feed delivers bars.
+
+    Every pass touches a placeholder, which is where Streamlit interrupts
+    the script for the next rerun; only the placeholders in ``slots`` are
+    updated, nothing is downloaded or re-rolled.  A replay that has run out
+    ends the loop, and a session that is stopped or closed stops its feed.
+    """
+    tick = st.empty()
+    # Bars an interrupted run already took from the feed
+    bars = feed.received()
+    try:
+        while True:
+            if not bars.empty:
+                data_c = pd.concat([data_c, bars])
+                data_c = data_c[~data_c.index.duplicated(keep="last")]
+                daily, x_day = live_results(stock_code, period, x_days, history, data_c)
+                with slots["price"].container():
+                    render_price(labels, data_c)
+                # Only the section on screen has a slot
+                for horizon, result in (("daily", daily), ("x_day", x_day)):
+                    if horizon in slots:
+                        with slots[horizon].container():
+                            render_tab(result, labels, horizon, period, x_days, v_alert, band_mode)
+            elif feed.finished:
+                return
+            tick.empty()
+            bars = feed.poll(timeout=1.0)
+    except StopException:
+        feed.stop()
+        raise
+
+
+def _render_section(section, labels, slots, stock_code, period, x_days, v_alert, band_mode, estimator,
+                    max_horizon, fmt, daily, x_day, weekly):
+    if section == "daily":
+        slots["daily"] = st.empty()
+        with slots["daily"].container():
+            render_tab(daily, labels, "daily", period, x_days, v_alert, band_mode)
+        if estimator != "range":
+            render_estimator(labels, "daily", estimator, load_estimators(stock_code, period, "daily"),
+                             load_history(stock_code), period)
+        # The daily export also carries the x-day columns
+        render_download(labels, lambda: [daily_export(stock_code, period, x_days)], "daily_volatility", fmt,
+                        "daily_download")
+    elif section == "x_day":
+        slots["x_day"] = st.empty()
+        with slots["x_day"].container():
+            render_tab(x_day, labels, "x_day", period, x_days, v_alert, band_mode)
+    elif section == "weekly":
+        if weekly is None:
+            # Not from the snapshot, so loaded only when the section is viewed
+            weekly = load_weekly(stock_code, period)
+        render_tab(weekly, labels, "weekly", period, x_days, v_alert, band_mode)
+        if estimator != "range":
+            render_estimator(labels, "weekly", estimator, load_estimators(stock_code, period, "weekly"),
+                             load_weekly(stock_code, period).frame, period)
+        render_download(labels, lambda: [load_weekly(stock_code, period).frame], "Weekly_volatility", fmt,
+                        "weekly_download")
+    elif section == "horizons":
+        render_horizons(labels, load_horizons(stock_code, period, int(max_horizon)), period, fmt)
+    elif section == "intraday":
+        render_intraday(labels, stock_code, v_alert, band_mode)
+    elif section == "sensitivity":
+        render_sensitivity(labels, load_sensitivity(stock_code, x_days), period, x_days, v_alert, fmt)
+
+
+def run(labels):
+    metrics.configure_from_env()
+    with metrics.timer("page"):
+        live = _run(labels)
+    # Streaming runs until the next rerun, so it is not part of the page time
+    if live is not None:
+        live()
+
+
+def _run(labels):
+    if labels["page_title"]:
+        st.set_page_config(
+            page_title=labels["page_title"],
+            page_icon="📈",
+        )
+    pd.set_option("display.float_format", "{:.2f}".format)
+    st.title(labels["title"])
+
+    # User input for stock code and period
+    watchlist_mode = st.sidebar.radio(labels["mode"], labels["modes"]) == labels["modes"][1]
+    if watchlist_mode:
+        symbols = parse_symbols(st.sidebar.text_area(labels["watchlist_symbols"], value="AAPL, MSFT, GOOG"))
+    else:
+        stock_code = st.sidebar.text_input(labels["stock_code"], value="AAPL")
+    period = st.sidebar.number_input(labels["period"], value=50, step=1)
+    x_days = st.sidebar.number_input(labels["x_days"], value=1, step=1)
+    v_alert = (st.sidebar.number_input(labels["v_alert"], value=0, step=1) / 100)
+    quantile_bands = st.sidebar.radio(labels["band_mode"], labels["band_modes"]) == labels["band_modes"][1]
+    band_mode = "quantile" if quantile_bands else "std"
+    estimator = "range"
+    if not watchlist_mode:
+        estimator = st.sidebar.selectbox(labels["estimator"], ("range",) + ESTIMATORS,
+                                         format_func=lambda name: labels["estimators"][name])
+        max_horizon = st.sidebar.number_input(labels["max_horizon"], value=MAX_HORIZON, min_value=2,
+                                              max_value=120, step=1)
+
+    formats = export.download_formats()
+    fmt = st.sidebar.selectbox(labels["download_format"], formats) if len(formats) > 1 else formats[0]
+    debug = st.sidebar.checkbox(labels["debug"])
+
+    streaming = not watchlist_mode and st.sidebar.checkbox(labels["streaming"])
+    if streaming:
+        poll_interval = st.sidebar.number_input(labels["poll_interval"], value=15, min_value=1, step=1)
+        # An upload rather than a path: visitors must not read files off the server
+        replay = st.sidebar.file_uploader(labels["replay_csv"], type="csv")
+    else:
+        _stop_feed()
+        if st.sidebar.button(labels["refresh"]):
+            if not watchlist_mode:
+                # Top the store up now, even within its refresh interval; the
+                # page load below reports the error if this download fails
+                try:
+                    download_data_current(stock_code, min_refresh=0)
+                except Exception:
+                    pass
+            load_current.clear()
+
+    if watchlist_mode:
+        render_watchlist(labels, symbols, period, x_days, v_alert, fmt, band_mode)
+        if debug:
+            render_debug_panel(labels)
+        return
+
+    # Changing only v_alert reuses the cached results and just re-evaluates the signals.
+    # Replayed bars are the only intraday data in the replay mode
+    with_current = not (streaming and replay is not None)
+    history = weekly = seed = None
+    # The nightly snapshot replaces the history download when it is still current
+    snapshot = load_snapshot(stock_code, period, x_days)
+    if snapshot is not None:
+        _, data_c, errors = load_page_data(stock_code, with_history=False, with_current=with_current)
+        if snapshot.usable(data_c):
+            # No weekly figures in a new week: the weekly section then loads them live
+            history, weekly, seed = snapshot.bars(), snapshot.weekly_for(data_c), snapshot.state
+    metrics.increment("snapshot_lookups_total", result="miss" if history is None else "hit")
+    if history is None:
+        history, data_c, errors = load_page_data(stock_code, with_current=with_current)
+    if data_c is None:
+        data_c = pd.DataFrame(columns=["High", "Low", "Close"], dtype=float)
+    if "current" in errors:
+        st.warning(labels["current_unavailable"].format(error=errors["current"]))
+    if "history" in errors:
+        # Partial page: the price is known, the bands need the history
+        render_price(labels, data_c)
+        st.warning(labels["history_unavailable"].format(error=errors["history"]))
+        return None
+    if history.empty:
+        raise ValueError(labels["no_data"].format(stock_code=stock_code))
+
+    daily, x_day = live_results(stock_code, period, x_days, history, data_c, seed)
+    slots = {"price": st.empty()}
+    with slots["price"].container():
+        render_price(labels, data_c)
+
+    # Only the selected section is computed; st.tabs would run every tab on each rerun
+    names = dict(zip(SECTIONS, (name.format(x_days=x_days) for name in labels["tabs"])))
+    section = st.radio(labels["section"], SECTIONS, format_func=names.get, horizontal=True,
+                       label_visibility="collapsed")
+    with metrics.timer("render.section", section=section):
+        _render_section(section, labels, slots, stock_code, period, x_days, v_alert, band_mode, estimator,
+                        max_horizon, fmt, daily, x_day, weekly)
+    st.write(SEPARATOR)
+    if debug:
+        render_debug_panel(labels)
+
+    if streaming:
+        return functools.partial(stream, _feed(stock_code, poll_interval, replay), labels, stock_code, period,
+                                 x_days, v_alert, history, data_c, slots, band_mode)
+    return None
@@ -0,0 +1,165 @@
+"""Market data access for the dashboard.
+
+Bars come from the active provider and, for network providers, through the
+local bar store so only missing bars are requested.
+"""
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from volatility import metrics
+from volatility.fetch import with_retries
+from volatility.providers import get_provider, local_bars
+from volatility.store import MINUTE_HISTORY_DAYS, get_store
+
+DAILY_HISTORY_DAYS = 1800
+WEEKLY_HISTORY_DAYS = 900
+WEEKLY_RULE = "W-MON"
+BAR_AGGREGATIONS = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Adj Close": "last",
+    "Volume": "sum",
+}
+
+
+def _source(provider):
+    return type(provider).__name__
+
+
+def _fetch(provider, interval, download):
+    # The same naive timestamps whether or not the bars go through the store
+    bars = local_bars(with_retries(download, name=_source(provider)))
+    return metrics.record_fetch(_source(provider), interval, bars)
+
+
+# Download historical data as dataframe
+@metrics.timed("download_data")
+def download_data(stock_code, start_date, end_date, interval="1d"):
+    provider = get_provider()
+    if not provider.cacheable:
+        return _fetch(provider, interval, lambda: provider.history(stock_code, start_date, end_date, interval))
+    data = get_store().fetch(
+        stock_code, interval, start_date, end_date,
+        lambda start, end: _fetch(provider, interval, lambda: provider.history(stock_code, start, end, interval)))
+    return data
+
+
+@metrics.timed("download_data_current")
+def download_data_current(stock_code, min_refresh=None):
+    provider = get_provider()
+    if not provider.cacheable:
+        return _fetch(provider, "1m", lambda: provider.latest_session(stock_code, "1m"))
+    data_c = get_store().fetch_latest_session(
+        stock_code, "1m",
+        lambda: _fetch(provider, "1m", lambda: provider.latest_session(stock_code, "1m")),
+        lambda start, end: _fetch(provider, "1m", lambda: provider.history(stock_code, start, end, "1m")),
+        min_refresh=min_refresh)
+    return data_c
+
+
+def download_daily(stock_code, days=DAILY_HISTORY_DAYS):
+    end_date = datetime.today()
+    return download_data(stock_code, end_date - timedelta(days=days), end_date)
+
+
+def resample_bars(daily, rule=WEEKLY_RULE):
+    """Aggregate daily bars into ``rule`` buckets labelled by their first day.
+
+    The default ``W-MON`` gives Monday-labelled weeks like yfinance's
+    ``1wk`` interval; any pandas offset ("MS", "5D", ...) works.
+    """
+    aggregations = {column: how for column, how in BAR_AGGREGATIONS.items() if column in daily.columns}
+    bars = daily.resample(rule, label="left", closed="left").agg(aggregations)
+    bars = bars.dropna(subset=["High", "Low"])
+    bars.index.name = "Date"
+    return bars
+
+
+def derive_bars(stock_code, daily, rule=WEEKLY_RULE):
+    """Resample ``daily``, reusing the buckets already derived for ``stock_code``.
+
+    Derived bars are kept in the bar store; only the last stored bucket and
+    the ones after it are recomputed from the new daily bars.
+    """
+    if daily.empty or not get_provider().cacheable:
+        return resample_bars(daily, rule)
+    store = get_store()
+    interval = f"resample-{rule}"
+    last = store.last_timestamp(stock_code, interval)
+    if last is None or last < daily.index[0]:
+        store.save(stock_code, interval, resample_bars(daily, rule))
+    else:
+        store.save(stock_code, interval, resample_bars(daily[daily.index >= last], rule))
+    first = resample_bars(daily.iloc[:1], rule).index[0]
+    return store.load(stock_code, interval, start=first)
+
+
+@metrics.timed("download_weekly")
+def download_weekly(stock_code, daily=None, days=WEEKLY_HISTORY_DAYS, rule=WEEKLY_RULE):
+    """Weekly bars derived from the daily bars instead of a second download.
+
+    Pass the ``daily`` frame already in use so both horizons come from the
+    same snapshot; otherwise the stored daily bars are read.
+    """
+    end_date = datetime.today()
+    if daily is None:
+        daily = download_data(stock_code, end_date - timedelta(days=days), end_date)
+    return recent_weeks(derive_bars(stock_code, daily, rule), days)
+
+
+def recent_weeks(weekly, days=WEEKLY_HISTORY_DAYS):
+    """The weekly bars of the last ``days`` days, the span the weekly tab uses."""
+    start_date = datetime.today() - timedelta(days=days)
+    # Keep the bucket that contains start_date, as the 1wk download did
+    return weekly[weekly.index > start_date - timedelta(days=7)]
+
+
+def session_bars(minute_bars, minutes):
+    """Aggregate 1-minute bars into ``minutes``-minute bars counted from each session's first bar.
+
+    Buckets never span two sessions, so a 60-minute bar of a 09:30 open
+    covers 09:30-10:29 rather than 09:00-09:59.
+    """
+    if minute_bars.empty:
+        return minute_bars.copy()
+    aggregations = {column: how for column, how in BAR_AGGREGATIONS.items() if column in minute_bars.columns}
+    index = minute_bars.index
+    opened = index.to_series().groupby(index.normalize()).transform("min")
+    size = pd.Timedelta(minutes=minutes)
+    starts = pd.DatetimeIndex(opened + (index - opened) // size * size, name="Datetime")
+    bars = minute_bars.groupby(starts).agg(aggregations)
+    return bars.dropna(subset=["High", "Low"])
+
+
+@metrics.timed("download_intraday")
+def download_intraday(stock_code, minutes, sessions):
+    """``minutes``-minute bars of the last ``sessions`` sessions and the current one.
+
+    The provider only serves about the last week of 1-minute bars; older
+    sessions exist only in the bar store, which keeps every minute ever
+    downloaded.
+
+    New 1-minute bars are appended to the bar store; like :func:`derive_bars`
+    the aggregated bars are stored as well, and only the last stored
+    session and the ones after it are aggregated again.
+    """
+    end_date = datetime.today()
+    recent = download_data(stock_code, end_date - timedelta(days=MINUTE_HISTORY_DAYS), end_date, "1m")
+    if recent.empty:
+        return recent
+    if not get_provider().cacheable:
+        bars = session_bars(recent, minutes)
+    else:
+        store = get_store()
+        interval = f"intraday-{minutes}m"
+        last = store.last_timestamp(stock_code, interval)
+        if last is not None and last >= recent.index[0]:
+            recent = recent[recent.index >= last.normalize()]
+        store.save(stock_code, interval, session_bars(recent, minutes))
+        # Weekends and holidays: two calendar days per session is plenty
+        bars = store.load(stock_code, interval, start=(end_date - timedelta(days=2 * sessions + 7)).date())
+    days = bars.index.normalize().unique()
+    return bars[bars.index >= days[max(len(days) - sessions - 1, 0)]]
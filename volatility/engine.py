@@ -0,0 +1,225 @@
+"""Rolling range statistics behind the daily, x-day and weekly tabs.
+
+Everything here works on plain OHLCV frames and has no Streamlit
+dependency, so the same results can be reused by every page and
+benchmarked or tested on their own.
+"""
+import os
+import warnings
+from dataclasses import dataclass, replace
+
+import numpy as np
+import pandas as pd
+
+from volatility import metrics
+
+SELL = "Sell"
+BUY = "Buy"
+# dtype of the price and derived columns kept in caches; "float32" halves
+# their size at the cost of about 7 significant digits
+CACHE_DTYPE = os.environ.get("VOLATILITY_CACHE_DTYPE", "float64")
+# Percentiles behind the quantile bands: 25-75, 5-95 and 1-99 are the
+# counterparts of the 1, 2 and 3 std bands
+QUANTILES = (0.01, 0.05, 0.25, 0.75, 0.95, 0.99)
+# The columns each compute_* function adds to its input
+DERIVED_COLUMNS = {
+    "daily": ["daily_volatility", "std_daily_volatility", "avg_daily_volatility"],
+    "x_day": ["x_day_high", "x_day_low", "x_day_volatility", "std_x_day_volatility", "avg_x_day_volatility"],
+    "weekly": ["weekly_volatility", "std_weekly_volatility", "avg_weekly_volatility"],
+    "intraday": ["intraday_volatility", "std_intraday_volatility", "avg_intraday_volatility"],
+}
+
+
+def compact_frame(frame, columns=None, dtype=None):
+    """``frame`` reduced to ``columns`` with its float columns stored as ``dtype``.
+
+    Volume keeps its dtype because float32 cannot hold large volumes exactly.
+    """
+    dtype = dtype or CACHE_DTYPE
+    if columns is not None:
+        frame = frame[[column for column in columns if column in frame.columns]]
+    casts = {column: dtype for column, kind in frame.dtypes.items()
+             if kind.kind == "f" and kind != dtype and column != "Volume"}
+    return frame.astype(casts) if casts else frame
+
+
+@dataclass
+class VolatilityResult:
+    """Latest figures of one horizon plus the frame they were read from.
+
+    ``volatility``, ``average`` and ``std`` describe the previous bar while
+    ``high`` and ``low`` belong to the bar that is still in progress.
+    """
+    frame: pd.DataFrame
+    volatility: float
+    average: float
+    std: float
+    high: float
+    low: float
+    previous_date: pd.Timestamp
+    # Empirical QUANTILES of the same window as ``average``/``std``
+    quantiles: tuple = None
+
+    @property
+    def range(self):
+        return round(self.high - self.low, 2)
+
+    def band(self, n):
+        upper = self.average + (self.std * n)
+        lower = self.average - (self.std * n)
+        if lower < 0:
+            lower = 0.0
+        return lower, upper
+
+    def quantile_band(self, n):
+        """Band ``n`` (1-3) from the window's percentiles, e.g. 25th-75th for ``n=1``."""
+        return self.quantiles[len(QUANTILES) // 2 - n], self.quantiles[len(QUANTILES) // 2 + n - 1]
+
+    def compact(self, columns=None, dtype=None):
+        """Copy for caching with only ``columns`` of the frame, see :func:`compact_frame`."""
+        return replace(self, frame=compact_frame(self.frame, columns, dtype))
+
+    def signal(self, v_alert):
+        if self.volatility > self.average * (1 + v_alert):
+            return SELL
+        if self.volatility < self.average * (1 - v_alert):
+            return BUY
+        return None
+
+
+def _round(value):
+    return round(float(value), 2)
+
+
+def tail(values, rows):
+    """The last ``rows`` rows of an array, padded with NaN rows in front if shorter."""
+    if len(values) >= rows:
+        return values[len(values) - rows:]
+    pad = np.full((rows - len(values),) + values.shape[1:], np.nan)
+    return np.concatenate([pad, values])
+
+
+def window_mean_std(window):
+    """Mean and sample std down the first axis of ``window``.
+
+    Any missing value gives NaN, like pandas' ``rolling(period)``.
+    """
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return window.mean(axis=0), window.std(axis=0, ddof=1)
+
+
+def add_bands(table):
+    """Add the :meth:`VolatilityResult.band` columns ``lower_1`` ... ``upper_3`` from ``average`` and ``std``."""
+    for n in (1, 2, 3):
+        # Rounded again: 1.0 + 0.12 * 3 is 1.3599999999999999 in floating point
+        table[f"lower_{n}"] = (table["average"] - table["std"] * n).clip(lower=0.0).round(2)
+        table[f"upper_{n}"] = (table["average"] + table["std"] * n).round(2)
+    return table
+
+
+def _window_quantiles(series, period, end):
+    # QUANTILES of the ``period`` values ending at position ``end`` (-1 or -2)
+    values = series.to_numpy(dtype=float)
+    stop = len(values) + end + 1
+    window = values[max(stop - period, 0):stop]
+    if len(window) < period or np.isnan(window).any():
+        return (np.nan,) * len(QUANTILES)
+    return tuple(_round(value) for value in np.quantile(window, QUANTILES))
+
+
+def _add_rolling_stats(frame, column, period):
+    frame[f"std_{column}"] = frame[column].rolling(period).std()
+    frame[f"avg_{column}"] = frame[column].rolling(period).mean()
+
+
+@metrics.timed("stats.daily")
+def compute_daily(data, period):
+    frame = data.copy()
+    # Calculate the daily high and low prices
+    frame["daily_volatility"] = frame["High"] - frame["Low"]
+    _add_rolling_stats(frame, "daily_volatility", period)
+    return VolatilityResult(
+        frame=frame,
+        volatility=_round(frame["daily_volatility"].iloc[-2]),
+        average=_round(frame["avg_daily_volatility"].iloc[-2]),
+        std=_round(frame["std_daily_volatility"].iloc[-2]),
+        high=_round(frame["High"].iloc[-1]),
+        low=_round(frame["Low"].iloc[-1]),
+        previous_date=frame.index[-2],
+        quantiles=_window_quantiles(frame["daily_volatility"], period, -2),
+    )
+
+
+@metrics.timed("stats.x_day")
+def compute_x_day(data, period, x_days):
+    frame = data.copy()
+    # Calculate the x-day high and low prices
+    frame["x_day_high"] = frame["High"].rolling(window=x_days).max()
+    frame["x_day_low"] = frame["Low"].rolling(window=x_days).min()
+    frame["x_day_volatility"] = frame["x_day_high"] - frame["x_day_low"]
+    _add_rolling_stats(frame, "x_day_volatility", period)
+    return VolatilityResult(
+        frame=frame,
+        volatility=_round(frame["x_day_volatility"].iloc[-2]),
+        average=_round(frame["avg_x_day_volatility"].iloc[-1]),
+        std=_round(frame["std_x_day_volatility"].iloc[-1]),
+        high=_round(frame["x_day_high"].iloc[-1]),
+        low=_round(frame["x_day_low"].iloc[-1]),
+        previous_date=frame.index[-2],
+        quantiles=_window_quantiles(frame["x_day_volatility"], period, -1),
+    )
+
+
+@metrics.timed("stats.weekly")
+def compute_weekly(data_wk, period):
+    frame = data_wk.copy()
+    # Calculate the weekly high and low prices
+    frame["weekly_volatility"] = frame["High"] - frame["Low"]
+    _add_rolling_stats(frame, "weekly_volatility", period)
+    return VolatilityResult(
+        frame=frame,
+        volatility=_round(frame["weekly_volatility"].iloc[-2]),
+        average=_round(frame["avg_weekly_volatility"].iloc[-2]),
+        std=_round(frame["std_weekly_volatility"].iloc[-2]),
+        high=_round(frame["High"].iloc[-1]),
+        low=_round(frame["Low"].iloc[-1]),
+        previous_date=frame.index[-2],
+        quantiles=_window_quantiles(frame["weekly_volatility"], period, -2),
+    )
+
+
+@metrics.timed("stats.intraday")
+def compute_intraday(data, sessions):
+    """Range bands of intraday bars against every bar of the ``sessions`` sessions before.
+
+    The statistics of a bar cover all bars of the preceding ``sessions``
+    sessions, built from per-session sums rather than a rolling pass over
+    the bars.  The latest bar is the one in progress.
+    """
+    frame = data.copy()
+    frame["intraday_volatility"] = frame["High"] - frame["Low"]
+    session = frame.index.normalize()
+    per_session = frame["intraday_volatility"].groupby(session).agg(["count", "sum"])
+    per_session["squares"] = (frame["intraday_volatility"] ** 2).groupby(session).sum()
+    window = per_session.rolling(sessions).sum().shift(1)
+    average = window["sum"] / window["count"]
+    std = np.sqrt(((window["squares"] - window["sum"] * average) / (window["count"] - 1)).clip(lower=0.0))
+    frame["std_intraday_volatility"] = std.reindex(session).to_numpy()
+    frame["avg_intraday_volatility"] = average.reindex(session).to_numpy()
+
+    days = per_session.index
+    quantiles = (np.nan,) * len(QUANTILES)
+    if len(days) > sessions:
+        values = frame.loc[(session >= days[-sessions - 1]) & (session < days[-1]), "intraday_volatility"]
+        quantiles = tuple(_round(value) for value in np.quantile(values.to_numpy(dtype=float), QUANTILES))
+    return VolatilityResult(
+        frame=frame,
+        volatility=_round(frame["intraday_volatility"].iloc[-2]),
+        average=_round(frame["avg_intraday_volatility"].iloc[-1]),
+        std=_round(frame["std_intraday_volatility"].iloc[-1]),
+        high=_round(frame["High"].iloc[-1]),
+        low=_round(frame["Low"].iloc[-1]),
+        previous_date=frame.index[-2],
+        quantiles=quantiles,
+    )
@@ -0,0 +1,83 @@
+"""OHLC volatility estimators over a rolling ``period``.
+
+The dashboard's own "volatility" is the raw High - Low range in price
+units.  These are the classic return-based estimators, as the standard
+deviation of log returns per bar:
+
+* ``close_to_close``: sample standard deviation of close-to-close returns
+* ``parkinson``: high/low range (Parkinson, 1980)
+* ``garman_klass``: open/high/low/close (Garman and Klass, 1980)
+* ``rogers_satchell``: drift-independent OHLC (Rogers and Satchell, 1991)
+* ``yang_zhang``: overnight + open-to-close + Rogers-Satchell (Yang and Zhang, 2000)
+
+All of them are averages of per-bar terms, so :func:`rolling_estimators`
+stacks the terms into one matrix and gets every window sum from a single
+cumulative sum instead of one rolling pass per estimator.
+"""
+import numpy as np
+import pandas as pd
+
+ESTIMATORS = ("close_to_close", "parkinson", "garman_klass", "rogers_satchell", "yang_zhang")
+PERIODS_PER_YEAR = {"daily": 252, "weekly": 52}
+
+_LN2 = np.log(2.0)
+# Column order of the term matrix
+_R, _R2, _O, _O2, _C, _C2, _PARKINSON, _GARMAN_KLASS, _ROGERS_SATCHELL = range(9)
+
+
+def _window_sums(terms, period):
+    # Rolling sums of every column; windows with a missing term are NaN
+    valid = np.isfinite(terms)
+    totals = np.cumsum(np.vstack([np.zeros((1, terms.shape[1])), np.where(valid, terms, 0.0)]), axis=0)
+    counts = np.cumsum(np.vstack([np.zeros((1, terms.shape[1]), dtype=int), valid]), axis=0)
+    sums = np.full(terms.shape, np.nan)
+    if len(terms) >= period:
+        window = totals[period:] - totals[:-period]
+        complete = (counts[period:] - counts[:-period]) == period
+        sums[period - 1:] = np.where(complete, window, np.nan)
+    return sums
+
+
+def rolling_estimators(bars, period):
+    """One column per estimator: volatility of log returns per bar over the last ``period`` bars."""
+    open_, high, low, close = (bars[column].to_numpy(dtype=float) for column in ("Open", "High", "Low", "Close"))
+    previous_close = np.concatenate([[np.nan], close[:-1]])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.log(close / previous_close)
+        o = np.log(open_ / previous_close)
+        c = np.log(close / open_)
+        h = np.log(high / open_)
+        lo = np.log(low / open_)
+    terms = np.column_stack([
+        r, r * r, o, o * o, c, c * c,
+        (h - lo) ** 2 / (4 * _LN2),
+        0.5 * (h - lo) ** 2 - (2 * _LN2 - 1) * c * c,
+        h * (h - c) + lo * (lo - c),
+    ])
+    sums = _window_sums(terms, period)
+    n = float(period)
+
+    def sample_variance(total, squares):
+        return (sums[:, squares] - sums[:, total] ** 2 / n) / (n - 1)
+
+    rogers_satchell = sums[:, _ROGERS_SATCHELL] / n
+    k = 0.34 / (1.34 + (n + 1) / (n - 1))
+    variances = {
+        "close_to_close": sample_variance(_R, _R2),
+        "parkinson": sums[:, _PARKINSON] / n,
+        "garman_klass": sums[:, _GARMAN_KLASS] / n,
+        "rogers_satchell": rogers_satchell,
+        "yang_zhang": sample_variance(_O, _O2) + k * sample_variance(_C, _C2) + (1 - k) * rogers_satchell,
+    }
+    # Rounding can push a near-zero variance below zero
+    return pd.DataFrame({name: np.sqrt(np.clip(variance, 0.0, None)) for name, variance in variances.items()},
+                        index=bars.index)
+
+
+def annualized(value, horizon):
+    return value * np.sqrt(PERIODS_PER_YEAR[horizon])
+
+
+def price_band(close, sigma, n):
+    """Price range ``n`` standard deviations of log return around ``close``."""
+    return close * np.exp(-n * sigma), close * np.exp(n * sigma)
@@ -0,0 +1,110 @@
+"""Writing result tables to files.
+
+CSV and Parquet output is produced in row chunks from one frame or from a
+sequence of frames (one per symbol for bulk exports), so a long history or
+a whole watchlist never has to exist as a single string or table in
+memory.  Parquet needs pyarrow, which is optional.
+"""
+import io
+import sys
+
+FORMATS = ("csv", "parquet", "json")
+MIME_TYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "json": "application/json",
+}
+CHUNK_ROWS = 50000
+
+
+def table_format(path, default="csv"):
+    for extension in FORMATS:
+        if path.endswith("." + extension):
+            return extension
+    return default
+
+
+def download_formats():
+    """Formats the dashboard can offer: CSV always, Parquet when pyarrow is installed."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return ("csv",)
+    return ("csv", "parquet")
+
+
+def _chunks(frame, chunk_rows):
+    for start in range(0, len(frame), chunk_rows):
+        yield frame.iloc[start:start + chunk_rows]
+
+
+def symbol_parts(frames):
+    """Turn ``(symbol, frame)`` pairs into frames with a leading ``symbol`` column."""
+    for symbol, frame in frames:
+        part = frame.copy(deep=False)
+        part.insert(0, "symbol", symbol)
+        yield part
+
+
+def iter_csv(parts, chunk_rows=CHUNK_ROWS):
+    """UTF-8 CSV of the concatenated ``parts``, yielded a chunk at a time."""
+    header = True
+    part = None
+    for part in parts:
+        for chunk in _chunks(part, chunk_rows):
+            yield chunk.to_csv(header=header).encode("utf-8")
+            header = False
+    if header and part is not None:
+        # Nothing but empty frames: still write the header
+        yield part.to_csv().encode("utf-8")
+
+
+def write_parquet(parts, sink, chunk_rows=CHUNK_ROWS):
+    """Write the concatenated ``parts`` to ``sink`` as one Parquet row group per chunk."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError("Parquet export needs pyarrow: pip install pyarrow") from error
+    writer = None
+    try:
+        for part in parts:
+            for chunk in _chunks(part, chunk_rows):
+                if writer is None:
+                    table = pa.Table.from_pandas(chunk, preserve_index=True)
+                    writer = pq.ParquetWriter(sink, table.schema)
+                else:
+                    table = pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=True)
+                writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_parts(parts, sink, fmt="csv", chunk_rows=CHUNK_ROWS):
+    """Stream ``parts`` to ``sink`` (a path or a binary file) as CSV or Parquet."""
+    if fmt == "parquet":
+        write_parquet(parts, sink, chunk_rows)
+        return
+    if isinstance(sink, str):
+        with open(sink, "wb") as handle:
+            handle.writelines(iter_csv(parts, chunk_rows))
+    else:
+        sink.writelines(iter_csv(parts, chunk_rows))
+
+
+def to_bytes(parts, fmt="csv", chunk_rows=CHUNK_ROWS):
+    """The encoded file for a download button, built only when it is asked for."""
+    buffer = io.BytesIO()
+    write_parts(parts, buffer, fmt, chunk_rows)
+    return buffer.getvalue()
+
+
+def write_table(frame, path, fmt=None):
+    """Write ``frame`` as CSV, Parquet or JSON (picked from the extension); ``-`` is stdout."""
+    fmt = fmt or table_format(path)
+    if fmt == "json":
+        frame.reset_index().to_json(sys.stdout if path == "-" else path, orient="records",
+                                    date_format="iso", indent=2)
+    else:
+        write_parts([frame], sys.stdout.buffer if path == "-" else path, fmt)
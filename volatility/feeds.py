@@ -0,0 +1,129 @@
+"""Background feeds of 1-minute bars for the live streaming mode.
+
+A feed runs on its own thread and queues the bars it has not delivered
+yet; the page thread drains the queue with :meth:`Feed.poll` and only
+redraws what those bars change.  :class:`PollingFeed` asks the data layer
+for the latest session, :class:`CsvReplayFeed` plays bars back from a CSV
+file so the streaming mode can be exercised offline.
+"""
+import queue
+import threading
+
+import pandas as pd
+
+from volatility.data import download_data_current
+from volatility.providers import local_bars
+
+
+class Feed:
+    """Base class: subclasses implement ``_run`` and call ``_emit``."""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+        self._received = pd.DataFrame()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def stopped(self):
+        return self._stop.is_set()
+
+    @property
+    def finished(self):
+        """The feed has stopped and every queued bar was polled."""
+        return self._thread is not None and not self._thread.is_alive() and self._queue.empty()
+
+    def received(self):
+        """Every bar polled so far, also by an earlier script run that was interrupted."""
+        return self._received
+
+    def _run(self):
+        raise NotImplementedError
+
+    def _emit(self, bars):
+        if not bars.empty:
+            self._queue.put(bars)
+
+    def poll(self, timeout=1.0):
+        """Bars received since the last call; waits up to ``timeout`` for the first."""
+        frames = []
+        try:
+            frames.append(self._queue.get(timeout=timeout))
+            while True:
+                frames.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not frames:
+            return pd.DataFrame()
+        bars = pd.concat(frames)
+        bars = bars[~bars.index.duplicated(keep="last")]
+        received = pd.concat([self._received, bars])
+        self._received = received[~received.index.duplicated(keep="last")]
+        return bars
+
+
+class PollingFeed(Feed):
+    """Polls the latest session of ``stock_code`` every ``interval`` seconds.
+
+    The last bar is re-emitted while it changes, because yfinance keeps
+    updating the minute that is still in progress.
+    """
+
+    def __init__(self, stock_code, interval=15.0, fetch=download_data_current):
+        super().__init__()
+        self.stock_code = stock_code
+        self.interval = interval
+        self.fetch = fetch
+        self._last = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                bars = self.fetch(self.stock_code, min_refresh=self.interval)
+            except Exception:
+                # Keep polling through transient network errors
+                bars = pd.DataFrame()
+            if not bars.empty:
+                if self._last is not None:
+                    bars = bars[bars.index >= self._last.name]
+                    if len(bars) == 1 and bars.iloc[-1].equals(self._last):
+                        bars = bars.iloc[0:0]
+                if not bars.empty:
+                    self._last = bars.iloc[-1]
+                    self._emit(bars)
+            self._stop.wait(self.interval)
+
+
+class CsvReplayFeed(Feed):
+    """Replays 1-minute bars from a CSV file, one bar every ``delay`` seconds.
+
+    ``path`` is a path or a file object; the file needs a datetime first column and at least High, Low and Close,
+    e.g. the CSV written by ``download_data_current(...).to_csv()``.  UTC
+    offsets in the timestamps are dropped like the providers' are.
+    """
+
+    def __init__(self, path, delay=1.0):
+        super().__init__()
+        self.path = path
+        self.delay = delay
+
+    def _run(self):
+        bars = local_bars(pd.read_csv(self.path, index_col=0, parse_dates=True))
+        for i in range(len(bars)):
+            if self._stop.is_set():
+                return
+            self._emit(bars.iloc[i:i + 1])
+            self._stop.wait(self.delay)
@@ -0,0 +1,66 @@
+"""Retries and concurrent fetching for slow or flaky data sources.
+
+:func:`with_retries` repeats a failing download with exponential backoff.
+:func:`gather` runs independent loads on a shared thread pool and waits up
+to a deadline: whatever finished is returned, the rest is reported as
+pending but keeps running, so a slow source delays only its own part of
+the page and is usually ready by the next rerun.
+
+``VOLATILITY_FETCH_TIMEOUT`` is the per-request timeout handed to the
+provider (seconds), ``VOLATILITY_FETCH_RETRIES`` the number of retries.
+"""
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from volatility import metrics
+
+FETCH_TIMEOUT = float(os.environ.get("VOLATILITY_FETCH_TIMEOUT", "10"))
+FETCH_RETRIES = int(os.environ.get("VOLATILITY_FETCH_RETRIES", "2"))
+FETCH_BACKOFF = 0.5
+FETCH_WORKERS = 16
+
+_executor = None
+
+
+def with_retries(func, retries=None, backoff=FETCH_BACKOFF, name="fetch"):
+    """Call ``func()``; on an exception wait ``backoff * 2**attempt`` (with jitter) and try again."""
+    retries = FETCH_RETRIES if retries is None else retries
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except Exception:
+            if attempt == retries:
+                metrics.increment("fetch_failures_total", source=name)
+                raise
+            metrics.increment("fetch_retries_total", source=name)
+            time.sleep(backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+
+
+def executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="volatility-fetch")
+    return _executor
+
+
+def gather(tasks, timeout=None):
+    """Run the callables of ``{name: callable}`` concurrently.
+
+    Returns ``(results, errors)``: results of the tasks that finished within
+    ``timeout`` seconds and, for the others, the exception they raised or a
+    ``TimeoutError`` if they are still running.
+    """
+    futures = {name: executor().submit(task) for name, task in tasks.items()}
+    wait(futures.values(), timeout=timeout)
+    results, errors = {}, {}
+    for name, future in futures.items():
+        if not future.done():
+            metrics.increment("fetch_timeouts_total", task=name)
+            errors[name] = TimeoutError(f"{name} did not finish within {timeout} seconds")
+        elif future.exception() is not None:
+            errors[name] = future.exception()
+        else:
+            results[name] = future.result()
+    return results, errors
@@ -0,0 +1,70 @@
+"""x-day range statistics for many horizons in one sweep.
+
+:func:`compute_x_day` rolls a max and a min for one ``x_days``.  Here a
+sparse table (level ``k`` holds the max/min of every run of ``2**k`` bars)
+is built once over the bars feeding the latest windows, and the x-day high
+and low of any horizon are the max/min of two overlapping runs from it.
+Every horizon gives the same figures as :func:`compute_x_day` with that
+``x_days``.
+"""
+import numpy as np
+import pandas as pd
+
+from volatility.engine import add_bands, tail, window_mean_std
+
+MAX_HORIZON = 20
+MATRIX_COLUMNS = [
+    "range", "high", "low", "volatility", "average", "std",
+    "lower_3", "lower_2", "lower_1", "upper_1", "upper_2", "upper_3", "z_score",
+]
+
+
+def sparse_table(values, levels, largest=True):
+    """``table[k][i]`` is the max (or min) of ``values[i:i + 2**k]``; NaN wins like in pandas."""
+    combine = np.maximum if largest else np.minimum
+    table = [values]
+    for k in range(1, levels):
+        previous = table[-1]
+        table.append(combine(previous[:-(1 << (k - 1))], previous[1 << (k - 1):]))
+    return table
+
+
+def window_extreme(table, window, largest=True):
+    """Max (or min) of every ``window`` consecutive values, one per window end."""
+    combine = np.maximum if largest else np.minimum
+    k = window.bit_length() - 1
+    level = table[k]
+    # Two runs of 2**k that together cover the window exactly
+    return combine(level[:len(level) - (window - (1 << k))], level[window - (1 << k):])
+
+
+def horizon_matrix(bars, period, horizons=range(1, MAX_HORIZON + 1)):
+    """One row per horizon with the x-day tab's figures and 1/2/3-std bands."""
+    horizons = list(horizons)
+    longest = max(horizons)
+    rows = max(period, 2) + longest - 1
+    high = tail(bars["High"].to_numpy(dtype=float), rows)
+    low = tail(bars["Low"].to_numpy(dtype=float), rows)
+    levels = longest.bit_length()
+    highs = sparse_table(high, levels, largest=True)
+    lows = sparse_table(low, levels, largest=False)
+
+    records = []
+    for x_days in horizons:
+        x_high = window_extreme(highs, x_days, largest=True)
+        x_low = window_extreme(lows, x_days, largest=False)
+        x_range = x_high - x_low
+        average, std = window_mean_std(x_range[len(x_range) - period:])
+        records.append({
+            "high": x_high[-1],
+            "low": x_low[-1],
+            "volatility": x_range[-2],
+            "average": average,
+            "std": std,
+        })
+    matrix = pd.DataFrame(records, index=pd.Index(horizons, name="x_days")).round(2)
+    # As in VolatilityResult.range, from the rounded high and low
+    matrix["range"] = (matrix["high"] - matrix["low"]).round(2)
+    add_bands(matrix)
+    matrix["z_score"] = (matrix["range"] - matrix["average"]) / matrix["std"].replace(0, np.nan)
+    return matrix[MATRIX_COLUMNS]
@@ -0,0 +1,361 @@
+"""Rolling statistics that are updated one bar at a time.
+
+The dashboard reads the rolling figures of the last bars only, so instead
+of re-rolling the whole history on every update these objects keep just
+enough state to add a bar in O(1):
+
+* :class:`RollingStats` -- sliding-window Welford mean/variance.
+* :class:`RollingExtreme` -- monotonic-deque rolling max or min.
+* :class:`RollingQuantiles` -- sorted window for rolling percentiles, in
+  O(log window) search plus a short list shift per bar.
+* :class:`VolatilityState` -- the above wired up like
+  :func:`volatility.engine.compute_daily` / ``compute_x_day``.
+
+Missing values follow pandas' ``rolling(window)``: any NaN inside the window,
+or fewer than ``window`` values, gives NaN.  All states round-trip through
+plain dicts (``to_dict``/``from_dict``) so they can be kept between reruns.
+"""
+import bisect
+import math
+from collections import deque
+
+import pandas as pd
+
+from volatility.engine import QUANTILES, VolatilityResult
+
+
+class RollingStats:
+    """Mean and sample standard deviation of the last ``window`` values."""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.nan_count = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._removed = 0
+
+    def _add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def _remove(self, value):
+        self.count -= 1
+        if self.count == 0:
+            self.mean = self.m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+
+    def _resync(self):
+        # Recompute from the window every ``window`` removals to stop drift
+        valid = [value for value in self.values if not math.isnan(value)]
+        self.count = len(valid)
+        self.mean = sum(valid) / self.count if valid else 0.0
+        self.m2 = sum((value - self.mean) ** 2 for value in valid)
+        self._removed = 0
+
+    def push(self, value):
+        value = float(value)
+        self.values.append(value)
+        if math.isnan(value):
+            self.nan_count += 1
+        else:
+            self._add(value)
+        if len(self.values) > self.window:
+            old = self.values.popleft()
+            if math.isnan(old):
+                self.nan_count -= 1
+            else:
+                self._remove(old)
+            self._removed += 1
+            if self._removed >= self.window:
+                self._resync()
+
+    def _result(self, count, mean, m2, size, nan_count):
+        if size < self.window or nan_count:
+            return math.nan, math.nan
+        std = math.sqrt(m2 / (count - 1)) if count > 1 else math.nan
+        return mean, std
+
+    def result(self):
+        """``(mean, std)`` of the current window."""
+        return self._result(self.count, self.mean, self.m2, len(self.values), self.nan_count)
+
+    def peek(self, value):
+        """``(mean, std)`` as if ``value`` were pushed, without changing the state."""
+        value = float(value)
+        count, mean, m2 = self.count, self.mean, self.m2
+        size, nan_count = len(self.values) + 1, self.nan_count
+        if math.isnan(value):
+            nan_count += 1
+        else:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+        if size > self.window:
+            size -= 1
+            old = self.values[0]
+            if math.isnan(old):
+                nan_count -= 1
+            else:
+                count -= 1
+                delta = old - mean
+                mean = mean - delta / count if count else 0.0
+                m2 = max(m2 - delta * (old - mean), 0.0) if count else 0.0
+        return self._result(count, mean, m2, size, nan_count)
+
+    def to_dict(self):
+        return {"window": self.window, "values": list(self.values)}
+
+    @classmethod
+    def from_dict(cls, state):
+        stats = cls(state["window"])
+        stats.values = deque(float(value) for value in state["values"])
+        stats.nan_count = sum(math.isnan(value) for value in stats.values)
+        stats._resync()
+        return stats
+
+
+class RollingExtreme:
+    """Rolling max (``largest=True``) or min of the last ``window`` values."""
+
+    def __init__(self, window, largest=True):
+        self.window = window
+        self.largest = largest
+        self.candidates = deque()
+        self.position = -1
+        self.last_nan = None
+
+    def _beats(self, a, b):
+        return a >= b if self.largest else a <= b
+
+    def push(self, value):
+        value = float(value)
+        self.position += 1
+        if math.isnan(value):
+            self.last_nan = self.position
+        else:
+            while self.candidates and self._beats(value, self.candidates[-1][1]):
+                self.candidates.pop()
+            self.candidates.append((self.position, value))
+        while self.candidates and self.candidates[0][0] <= self.position - self.window:
+            self.candidates.popleft()
+
+    def _extreme_since(self, first):
+        if self.position - first + 1 < 0 or first < 0:
+            return math.nan
+        if self.last_nan is not None and self.last_nan >= first:
+            return math.nan
+        for position, value in self.candidates:
+            if position >= first:
+                return value
+        return math.nan
+
+    def result(self):
+        return self._extreme_since(self.position - self.window + 1)
+
+    def peek(self, value):
+        """Extreme of the window ending with ``value``, without changing the state."""
+        value = float(value)
+        if math.isnan(value):
+            return math.nan
+        if self.window == 1:
+            return value
+        rest = self._extreme_since(self.position - self.window + 2)
+        if math.isnan(rest):
+            return math.nan
+        return max(rest, value) if self.largest else min(rest, value)
+
+    def to_dict(self):
+        return {"window": self.window, "largest": self.largest, "position": self.position,
+                "last_nan": self.last_nan, "candidates": [list(item) for item in self.candidates]}
+
+    @classmethod
+    def from_dict(cls, state):
+        extreme = cls(state["window"], state["largest"])
+        extreme.position = state["position"]
+        extreme.last_nan = state["last_nan"]
+        extreme.candidates = deque((int(position), float(value)) for position, value in state["candidates"])
+        return extreme
+
+
+class RollingQuantiles:
+    """Percentiles (linear interpolation, as numpy/pandas) of the last ``window`` values.
+
+    The window is kept sorted, so each bar is a binary search to insert the
+    new value and one to drop the oldest, instead of a sort per window.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.sorted = []
+        self.nan_count = 0
+
+    def push(self, value):
+        value = float(value)
+        self.values.append(value)
+        if math.isnan(value):
+            self.nan_count += 1
+        else:
+            bisect.insort(self.sorted, value)
+        if len(self.values) > self.window:
+            old = self.values.popleft()
+            if math.isnan(old):
+                self.nan_count -= 1
+            else:
+                del self.sorted[bisect.bisect_left(self.sorted, old)]
+
+    @staticmethod
+    def _interpolate(ordered, q):
+        position = q * (len(ordered) - 1)
+        lower = int(position)
+        if lower + 1 >= len(ordered):
+            return ordered[-1]
+        return ordered[lower] + (ordered[lower + 1] - ordered[lower]) * (position - lower)
+
+    def _result(self, ordered, size, nan_count, quantiles):
+        if size < self.window or nan_count:
+            return (math.nan,) * len(quantiles)
+        return tuple(self._interpolate(ordered, q) for q in quantiles)
+
+    def result(self, quantiles=QUANTILES):
+        return self._result(self.sorted, len(self.values), self.nan_count, quantiles)
+
+    def peek(self, value, quantiles=QUANTILES):
+        """Percentiles as if ``value`` were pushed, without changing the state."""
+        value = float(value)
+        ordered = list(self.sorted)
+        size, nan_count = len(self.values) + 1, self.nan_count
+        if math.isnan(value):
+            nan_count += 1
+        else:
+            bisect.insort(ordered, value)
+        if size > self.window:
+            size -= 1
+            old = self.values[0]
+            if math.isnan(old):
+                nan_count -= 1
+            else:
+                del ordered[bisect.bisect_left(ordered, old)]
+        return self._result(ordered, size, nan_count, quantiles)
+
+    @classmethod
+    def from_values(cls, window, values):
+        quantiles = cls(window)
+        for value in values:
+            quantiles.push(value)
+        return quantiles
+
+
+def _round(value):
+    return round(float(value), 2)
+
+
+class VolatilityState:
+    """Daily and x-day range statistics over the completed bars.
+
+    ``push`` adds one completed bar; ``daily``/``x_day`` combine the state with
+    the bar still in progress and return the same figures as
+    ``compute_daily``/``compute_x_day`` would for the full frame.
+    """
+
+    def __init__(self, period, x_days):
+        self.period = period
+        self.x_days = x_days
+        self.daily_stats = RollingStats(period)
+        self.x_stats = RollingStats(period)
+        self.x_high = RollingExtreme(x_days, largest=True)
+        self.x_low = RollingExtreme(x_days, largest=False)
+        self.daily_quantiles = RollingQuantiles(period)
+        self.x_quantiles = RollingQuantiles(period)
+        self.last_time = None
+        self.last_range = math.nan
+        self.last_x_range = math.nan
+
+    def push(self, time, high, low):
+        self.daily_stats.push(high - low)
+        self.daily_quantiles.push(high - low)
+        self.x_high.push(high)
+        self.x_low.push(low)
+        self.last_x_range = self.x_high.result() - self.x_low.result()
+        self.x_stats.push(self.last_x_range)
+        self.x_quantiles.push(self.last_x_range)
+        self.last_range = high - low
+        self.last_time = pd.Timestamp(time)
+
+    def catch_up(self, frame):
+        """Push the rows of ``frame`` that are newer than the last pushed bar."""
+        if self.last_time is not None:
+            frame = frame.iloc[frame.index.searchsorted(self.last_time, side="right"):]
+        for time, high, low in zip(frame.index, frame["High"].to_numpy(), frame["Low"].to_numpy()):
+            self.push(time, high, low)
+        return self
+
+    @classmethod
+    def from_frame(cls, frame, period, x_days):
+        return cls(period, x_days).catch_up(frame)
+
+    def daily(self, high, low):
+        average, std = self.daily_stats.result()
+        return VolatilityResult(
+            frame=None,
+            volatility=_round(self.last_range),
+            average=_round(average),
+            std=_round(std),
+            high=_round(high),
+            low=_round(low),
+            previous_date=self.last_time,
+            quantiles=tuple(_round(value) for value in self.daily_quantiles.result()),
+        )
+
+    def x_day(self, high, low):
+        x_high = self.x_high.peek(high)
+        x_low = self.x_low.peek(low)
+        average, std = self.x_stats.peek(x_high - x_low)
+        return VolatilityResult(
+            frame=None,
+            volatility=_round(self.last_x_range),
+            average=_round(average),
+            std=_round(std),
+            high=_round(x_high),
+            low=_round(x_low),
+            previous_date=self.last_time,
+            quantiles=tuple(_round(value) for value in self.x_quantiles.peek(x_high - x_low)),
+        )
+
+    def to_dict(self):
+        return {
+            "period": self.period,
+            "x_days": self.x_days,
+            "daily_stats": self.daily_stats.to_dict(),
+            "x_stats": self.x_stats.to_dict(),
+            "x_high": self.x_high.to_dict(),
+            "x_low": self.x_low.to_dict(),
+            "last_time": None if self.last_time is None else self.last_time.isoformat(),
+            "last_range": self.last_range,
+            "last_x_range": self.last_x_range,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        volatility_state = cls(state["period"], state["x_days"])
+        volatility_state.daily_stats = RollingStats.from_dict(state["daily_stats"])
+        volatility_state.x_stats = RollingStats.from_dict(state["x_stats"])
+        volatility_state.x_high = RollingExtreme.from_dict(state["x_high"])
+        volatility_state.x_low = RollingExtreme.from_dict(state["x_low"])
+        # The percentile windows hold the same values as the rolling stats
+        volatility_state.daily_quantiles = RollingQuantiles.from_values(state["period"],
+                                                                        state["daily_stats"]["values"])
+        volatility_state.x_quantiles = RollingQuantiles.from_values(state["period"], state["x_stats"]["values"])
+        if state["last_time"] is not None:
+            volatility_state.last_time = pd.Timestamp(state["last_time"])
+        volatility_state.last_range = state["last_range"]
+        volatility_state.last_x_range = state["last_x_range"]
+        return volatility_state
@@ -0,0 +1,386 @@
+"""User-facing text of the dashboard, one dictionary per page language.
+
+Placeholders: ``{x_days}``, ``{period}`` and ``{value}`` in the per-horizon
+texts, ``{volatility}``/``{average}`` in the signal explanations.
+"""
+
+EN = {
+    "page_title": None,
+    "title": "Volatility Dashboard",
+    "stock_code": "Enter the stock code:",
+    "period": "Enter the period for the rolling:",
+    "x_days": "Enter the number of days volatility:",
+    "v_alert": "Average volatility Higher/Low than pervious (%):",
+    "estimator": "Volatility estimator:",
+    "estimators": {
+        "range": "High - Low range",
+        "close_to_close": "Close-to-close",
+        "parkinson": "Parkinson",
+        "garman_klass": "Garman-Klass",
+        "rogers_satchell": "Rogers-Satchell",
+        "yang_zhang": "Yang-Zhang",
+    },
+    "estimator_value": "{name} volatility over {period} bars (annualized): {value:.2%}",
+    "estimator_bands": ["1 Std move", "2 Std move", "3 Std move"],
+    "estimator_close": "From the close of: ",
+    "refresh": "Refresh",
+    "streaming": "Live streaming",
+    "poll_interval": "Update every (seconds):",
+    "replay_csv": "Replay 1-minute bars from CSV file (optional):",
+    "debug": "Show performance panel",
+    "debug_panel": "Performance",
+    "debug_timings": "Stage timings (ms, all sessions)",
+    "debug_counters": "Counters (cache lookups/misses, fetches, bytes)",
+    "no_data": "No data available for the stock code: {stock_code}",
+    "current_unavailable": "Current price not available yet ({error}); using the completed bars.",
+    "history_unavailable": "Price history not available yet ({error}); press Refresh in a moment.",
+    "price": "Price: {price}",
+    "last_update": "Last update time: ",
+    "section": "View:",
+    "tabs": ["Today Volatility", "{x_days}-Day Volatility", "Weekly Volatility", "Horizons", "Intraday", "Sensitivity"],
+    "sensitivity_horizon": "Horizon:",
+    "sensitivity_caption": "Bands for every rolling period from {low} to {high}; the vertical line marks the period in use ({period}).",
+    "sensitivity_axis": "Rolling period",
+    "sensitivity_value": "Volatility",
+    "sensitivity_previous": "Previous volatility",
+    "intraday_minutes": "Bar size (minutes):",
+    "intraday_sessions": "Sessions in the statistics:",
+    "intraday_caption": "Statistics of every {x_days}-minute bar of the last {period} sessions, from the stored 1-minute bars.",
+    "intraday_unavailable": "Not enough stored 1-minute bars yet for {x_days}-minute bands.",
+    "intraday": {
+        "range": "{x_days}-Minute Range: {value}",
+        "high": "{x_days}-Minute high: {value}",
+        "low": "{x_days}-Minute low: {value}",
+        "previous": "Previous {x_days}-minute volatility: {value}",
+        "previous_date": "Previous {x_days}-minute bar: ",
+        "higher": "Previous {x_days}-minute volatility: {volatility} is higher than average volatility: {average}",
+        "lower": "Previous {x_days}-minute volatility: {volatility} is lower than average volatility: {average}",
+    },
+    "max_horizon": "Longest horizon for the horizons tab (days):",
+    "horizons_caption": "Bands of the 1 to {max_horizon}-day range over the last {period} days; colour is the value relative to the horizon's average.",
+    "horizon_axis": "Days",
+    "horizon_bands": {
+        "lower_3": "-3 Std", "lower_2": "-2 Std", "lower_1": "-1 Std", "average": "Average",
+        "upper_1": "+1 Std", "upper_2": "+2 Std", "upper_3": "+3 Std", "range": "Current range",
+    },
+    "horizon_relative": "Relative to average",
+    "std_bands": ["1 Std Deviation", "2 Std Deviation", "3 Std Deviation"],
+    "band_mode": "Bands:",
+    "band_modes": ["Std deviation", "Percentiles"],
+    "quantile_bands": ["25th - 75th percentile", "5th - 95th percentile", "1st - 99th percentile"],
+    "average": "Average {period} volatility: {value}",
+    "std": "Std Deviation of volatility: {value}",
+    "sell": "Sell",
+    "buy": "Buy",
+    "download_format": "Download format:",
+    "prepare_download": "Prepare download",
+    "download": {"csv": "Download data as CSV", "parquet": "Download data as Parquet"},
+    "mode": "Mode:",
+    "modes": ["Single stock", "Watchlist"],
+    "watchlist_symbols": "Enter the stock codes (comma or space separated):",
+    "watchlist_columns": {
+        "symbol": "Stock code",
+        "range": "Today Range",
+        "volatility": "Previous day volatility",
+        "average": "Average volatility",
+        "std": "Std Deviation of volatility",
+        "lower_1": "1 Std low",
+        "upper_1": "1 Std high",
+        "lower_2": "2 Std low",
+        "upper_2": "2 Std high",
+        "lower_3": "3 Std low",
+        "upper_3": "3 Std high",
+        "q_lower_1": "25th pct",
+        "q_upper_1": "75th pct",
+        "q_lower_2": "5th pct",
+        "q_upper_2": "95th pct",
+        "q_lower_3": "1st pct",
+        "q_upper_3": "99th pct",
+        "z_score": "Today Range (Std)",
+        "x_day_volatility": "Previous {x_days}-day volatility",
+        "x_day_average": "Average {x_days}-day volatility",
+        "signal": "Signal",
+        "x_day_signal": "{x_days}-Day signal",
+    },
+    "daily": {
+        "range": "Today Range: {value}",
+        "high": "Day high: {value}",
+        "low": "Day low: {value}",
+        "previous": "Previous day volatility: {value}",
+        "previous_date": "Previous day: ",
+        "higher": "Previous day volatility: {volatility} is higher than average volatility: {average}",
+        "lower": "Previous day volatility: {volatility} is lower than average volatility: {average}",
+    },
+    "x_day": {
+        "range": "{x_days}-Day Range: {value}",
+        "high": "{x_days}-Day high: {value}",
+        "low": "{x_days}-Day low: {value}",
+        "previous": "Previous volatility: {value}",
+        "previous_date": "Previous {x_days}-day: ",
+        "higher": "Previous {x_days}-day volatility: {volatility} is higher than average volatility: {average}",
+        "lower": "Previous {x_days}-day volatility: {volatility} is lower than average volatility: {average}",
+    },
+    "weekly": {
+        "range": "Weeky Range: {value}",
+        "high": "Day high: {value}",
+        "low": "Day low: {value}",
+        "previous": "Previous week volatility: {value}",
+        "previous_date": "Previous week: ",
+        "higher": "Previous week volatility: {volatility} is higher than average volatility: {average}",
+        "lower": "Previous week volatility: {volatility} is lower than average volatility: {average}",
+    },
+}
+
+ZH_HANT = {
+    "page_title": "多頁面波幅儀表板",
+    "title": "波幅儀表板",
+    "stock_code": "輸入股票代碼：",
+    "period": "輸入滾動期間：",
+    "x_days": "輸入幾天的波幅：",
+    "v_alert": "平均波幅高於/低於前一日的百分比：",
+    "estimator": "波動率估計方法：",
+    "estimators": {
+        "range": "最高價 - 最低價範圍",
+        "close_to_close": "收盤價對收盤價",
+        "parkinson": "Parkinson",
+        "garman_klass": "Garman-Klass",
+        "rogers_satchell": "Rogers-Satchell",
+        "yang_zhang": "Yang-Zhang",
+    },
+    "estimator_value": "{name} 波動率（{period} 期，年化）：{value:.2%}",
+    "estimator_bands": ["1 標準差區間", "2 標準差區間", "3 標準差區間"],
+    "estimator_close": "基準收盤日：",
+    "refresh": "刷新",
+    "streaming": "即時串流",
+    "poll_interval": "更新間隔（秒）：",
+    "replay_csv": "從CSV檔案重播1分鐘數據（可選）：",
+    "debug": "顯示效能面板",
+    "debug_panel": "效能",
+    "debug_timings": "各階段耗時（毫秒，所有工作階段）",
+    "debug_counters": "計數器（快取查詢/未命中、下載次數、位元組）",
+    "no_data": "股票代碼 {stock_code} 無數據可用",
+    "current_unavailable": "目前價格暫時無法取得（{error}）；使用已完成的數據。",
+    "history_unavailable": "歷史數據暫時無法取得（{error}）；請稍後按刷新。",
+    "price": "價格：{price}",
+    "last_update": "上次更新時間：",
+    "section": "檢視：",
+    "tabs": ["今日波幅", "{x_days}天波幅", "週波幅", "多週期", "日內", "敏感度"],
+    "sensitivity_horizon": "週期：",
+    "sensitivity_caption": "滾動期數由{low}至{high}的波幅區間；垂直線標示目前使用的期數（{period}）。",
+    "sensitivity_axis": "滾動期數",
+    "sensitivity_value": "波幅",
+    "sensitivity_previous": "上一期波幅",
+    "intraday_minutes": "K線週期（分鐘）：",
+    "intraday_sessions": "統計的交易日數：",
+    "intraday_caption": "以已儲存的1分鐘數據，統計過去{period}個交易日內每條{x_days}分鐘K線。",
+    "intraday_unavailable": "已儲存的1分鐘數據仍不足以計算{x_days}分鐘波幅區間。",
+    "intraday": {
+        "range": "{x_days}分鐘波幅：{value}",
+        "high": "{x_days}分鐘最高：{value}",
+        "low": "{x_days}分鐘最低：{value}",
+        "previous": "上一條{x_days}分鐘波幅：{value}",
+        "previous_date": "上一條{x_days}分鐘K線：",
+        "higher": "上一條{x_days}分鐘波幅：{volatility} 高於平均波幅：{average}",
+        "lower": "上一條{x_days}分鐘波幅：{volatility} 低於平均波幅：{average}",
+    },
+    "max_horizon": "多週期分頁的最長天數：",
+    "horizons_caption": "過去{period}日內1至{max_horizon}天波幅的區間；顏色為數值相對該週期平均的比例。",
+    "horizon_axis": "天數",
+    "horizon_bands": {
+        "lower_3": "-3標準差", "lower_2": "-2標準差", "lower_1": "-1標準差", "average": "平均",
+        "upper_1": "+1標準差", "upper_2": "+2標準差", "upper_3": "+3標準差", "range": "當前波幅",
+    },
+    "horizon_relative": "相對平均",
+    "std_bands": ["1個標準差", "2個標準差", "3個標準差"],
+    "band_mode": "區間：",
+    "band_modes": ["標準差", "百分位數"],
+    "quantile_bands": ["第25 - 75百分位", "第5 - 95百分位", "第1 - 99百分位"],
+    "average": "平均{period}波幅：{value}",
+    "std": "波幅的標準差：{value}",
+    "sell": "賣出",
+    "buy": "買進",
+    "download_format": "下載格式：",
+    "prepare_download": "準備下載",
+    "download": {"csv": "下載數據為CSV", "parquet": "下載數據為Parquet"},
+    "mode": "模式：",
+    "modes": ["單一股票", "觀察清單"],
+    "watchlist_symbols": "輸入股票代碼（以逗號或空格分隔）：",
+    "watchlist_columns": {
+        "symbol": "股票代碼",
+        "range": "今日區間",
+        "volatility": "前一天波幅",
+        "average": "平均波幅",
+        "std": "波幅的標準差",
+        "lower_1": "1個標準差下限",
+        "upper_1": "1個標準差上限",
+        "lower_2": "2個標準差下限",
+        "upper_2": "2個標準差上限",
+        "lower_3": "3個標準差下限",
+        "upper_3": "3個標準差上限",
+        "q_lower_1": "第25百分位",
+        "q_upper_1": "第75百分位",
+        "q_lower_2": "第5百分位",
+        "q_upper_2": "第95百分位",
+        "q_lower_3": "第1百分位",
+        "q_upper_3": "第99百分位",
+        "z_score": "今日區間（標準差）",
+        "x_day_volatility": "前{x_days}天波幅",
+        "x_day_average": "平均{x_days}天波幅",
+        "signal": "訊號",
+        "x_day_signal": "{x_days}天訊號",
+    },
+    "daily": {
+        "range": "今日區間：{value}",
+        "high": "今日高位：{value}",
+        "low": "今日低位：{value}",
+        "previous": "前一天波幅：{value}",
+        "previous_date": "前一天：",
+        "higher": "前一天波幅：{volatility} 高於平均波幅：{average}",
+        "lower": "前一天波幅：{volatility} 低於平均波幅：{average}",
+    },
+    "x_day": {
+        "range": "{x_days}天區間：{value}",
+        "high": "{x_days}天高位：{value}",
+        "low": "{x_days}天低位：{value}",
+        "previous": "前{x_days}天波幅：{value}",
+        "previous_date": "前{x_days}天：",
+        "higher": "前{x_days}天波幅：{volatility} 高於平均波幅：{average}",
+        "lower": "前{x_days}天波幅：{volatility} 低於平均波幅：{average}",
+    },
+    "weekly": {
+        "range": "週區間：{value}",
+        "high": "本週高位：{value}",
+        "low": "本週低位：{value}",
+        "previous": "前一週波幅：{value}",
+        "previous_date": "前一週：",
+        "higher": "前一週波幅：{volatility} 高於平均波幅：{average}",
+        "lower": "前一週波幅：{volatility} 低於平均波幅：{average}",
+    },
+}
+
+ZH_HANS = {
+    "page_title": "多页面波幅仪表板",
+    "title": "波幅仪表板",
+    "stock_code": "输入股票代码：",
+    "period": "输入滚动周期：",
+    "x_days": "输入几天的波幅：",
+    "v_alert": "平均波幅高于/低于前一日的百分比：",
+    "estimator": "波动率估计方法：",
+    "estimators": {
+        "range": "最高价 - 最低价范围",
+        "close_to_close": "收盘价对收盘价",
+        "parkinson": "Parkinson",
+        "garman_klass": "Garman-Klass",
+        "rogers_satchell": "Rogers-Satchell",
+        "yang_zhang": "Yang-Zhang",
+    },
+    "estimator_value": "{name} 波动率（{period} 期，年化）：{value:.2%}",
+    "estimator_bands": ["1 标准差区间", "2 标准差区间", "3 标准差区间"],
+    "estimator_close": "基准收盘日：",
+    "refresh": "刷新",
+    "streaming": "实时串流",
+    "poll_interval": "更新间隔（秒）：",
+    "replay_csv": "从CSV文件重播1分钟数据（可选）：",
+    "debug": "显示性能面板",
+    "debug_panel": "性能",
+    "debug_timings": "各阶段耗时（毫秒，所有会话）",
+    "debug_counters": "计数器（缓存查询/未命中、下载次数、字节）",
+    "no_data": "股票代码 {stock_code} 无数据可用",
+    "current_unavailable": "当前价格暂时无法获取（{error}）；使用已完成的数据。",
+    "history_unavailable": "历史数据暂时无法获取（{error}）；请稍后按刷新。",
+    "price": "价格：{price}",
+    "last_update": "上次更新时间：",
+    "section": "查看：",
+    "tabs": ["今日波幅", "{x_days}天波幅", "周波幅", "多周期", "日内", "敏感度"],
+    "sensitivity_horizon": "周期：",
+    "sensitivity_caption": "滚动期数由{low}至{high}的波幅区间；垂直线标示目前使用的期数（{period}）。",
+    "sensitivity_axis": "滚动期数",
+    "sensitivity_value": "波幅",
+    "sensitivity_previous": "上一期波幅",
+    "intraday_minutes": "K线周期（分钟）：",
+    "intraday_sessions": "统计的交易日数：",
+    "intraday_caption": "以已储存的1分钟数据，统计过去{period}个交易日内每条{x_days}分钟K线。",
+    "intraday_unavailable": "已储存的1分钟数据仍不足以计算{x_days}分钟波幅区间。",
+    "intraday": {
+        "range": "{x_days}分钟波幅：{value}",
+        "high": "{x_days}分钟最高：{value}",
+        "low": "{x_days}分钟最低：{value}",
+        "previous": "上一条{x_days}分钟波幅：{value}",
+        "previous_date": "上一条{x_days}分钟K线：",
+        "higher": "上一条{x_days}分钟波幅：{volatility} 高于平均波幅：{average}",
+        "lower": "上一条{x_days}分钟波幅：{volatility} 低于平均波幅：{average}",
+    },
+    "max_horizon": "多周期分页的最长天数：",
+    "horizons_caption": "过去{period}日内1至{max_horizon}天波幅的区间；颜色为数值相对该周期平均的比例。",
+    "horizon_axis": "天数",
+    "horizon_bands": {
+        "lower_3": "-3标准差", "lower_2": "-2标准差", "lower_1": "-1标准差", "average": "平均",
+        "upper_1": "+1标准差", "upper_2": "+2标准差", "upper_3": "+3标准差", "range": "当前波幅",
+    },
+    "horizon_relative": "相对平均",
+    "std_bands": ["1个标准差", "2个标准差", "3个标准差"],
+    "band_mode": "区间：",
+    "band_modes": ["标准差", "百分位数"],
+    "quantile_bands": ["第25 - 75百分位", "第5 - 95百分位", "第1 - 99百分位"],
+    "average": "平均{period}波幅：{value}",
+    "std": "波幅的标准差：{value}",
+    "sell": "卖出",
+    "buy": "买进",
+    "download_format": "下载格式：",
+    "prepare_download": "准备下载",
+    "download": {"csv": "下载数据为CSV", "parquet": "下载数据为Parquet"},
+    "mode": "模式：",
+    "modes": ["单一股票", "观察清单"],
+    "watchlist_symbols": "输入股票代码（以逗号或空格分隔）：",
+    "watchlist_columns": {
+        "symbol": "股票代码",
+        "range": "今日区间",
+        "volatility": "前一天波幅",
+        "average": "平均波幅",
+        "std": "波幅的标准差",
+        "lower_1": "1个标准差下限",
+        "upper_1": "1个标准差上限",
+        "lower_2": "2个标准差下限",
+        "upper_2": "2个标准差上限",
+        "lower_3": "3个标准差下限",
+        "upper_3": "3个标准差上限",
+        "q_lower_1": "第25百分位",
+        "q_upper_1": "第75百分位",
+        "q_lower_2": "第5百分位",
+        "q_upper_2": "第95百分位",
+        "q_lower_3": "第1百分位",
+        "q_upper_3": "第99百分位",
+        "z_score": "今日区间（标准差）",
+        "x_day_volatility": "前{x_days}天波幅",
+        "x_day_average": "平均{x_days}天波幅",
+        "signal": "信号",
+        "x_day_signal": "{x_days}天信号",
+    },
+    "daily": {
+        "range": "今日区间：{value}",
+        "high": "最高价：{value}",
+        "low": "最低价：{value}",
+        "previous": "前一天波幅：{value}",
+        "previous_date": "前一天：",
+        "higher": "前一天波幅：{volatility} 高于平均波幅：{average}",
+        "lower": "前一天波幅：{volatility} 低于平均波幅：{average}",
+    },
+    "x_day": {
+        "range": "{x_days}天区间：{value}",
+        "high": "{x_days}天高点：{value}",
+        "low": "{x_days}天低点：{value}",
+        "previous": "前{x_days}天波幅：{value}",
+        "previous_date": "前{x_days}天：",
+        "higher": "前{x_days}天波幅：{volatility} 高于平均波幅：{average}",
+        "lower": "前{x_days}天波幅：{volatility} 低于平均波幅：{average}",
+    },
+    "weekly": {
+        "range": "周区间：{value}",
+        "high": "本周高价：{value}",
+        "low": "本周低价：{value}",
+        "previous": "前一周波幅：{value}",
+        "previous_date": "前一周：",
+        "higher": "前一周波幅：{volatility} 高于平均波幅：{average}",
+        "lower": "前一周波幅：{volatility} 低于平均波幅：{average}",
+    },
+}
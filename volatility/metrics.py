@@ -0,0 +1,204 @@
+"""Process-wide timers and counters for finding slow stages in production.
+
+Stages are timed with :func:`timer` (a context manager) or :func:`timed` (a
+decorator); counters such as cache hits and bytes fetched go through
+:func:`increment`.  Everything is kept in one in-memory registry that the
+dashboard's debug panel reads and :func:`prometheus_text` exports.
+
+Two optional outputs are switched on by environment variables:
+
+``VOLATILITY_METRICS_LOG``
+    Any non-empty value writes one JSON line per timed stage to stderr
+    through the ``volatility.metrics`` logger.  The logger is quiet by
+    default; setting its level to INFO in your own logging configuration
+    sends the lines elsewhere.
+``VOLATILITY_METRICS_PORT``
+    Serves the registry in the Prometheus text format on
+    ``http://<host>:<port>/metrics`` from a background thread.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+logger = logging.getLogger("volatility.metrics")
+# Streamlit lowers the root level, which would print every stage otherwise
+logger.setLevel(logging.WARNING)
+
+_lock = threading.Lock()
+# (name, sorted label items) -> value
+_counters = {}
+# (stage, sorted label items) -> [count, total seconds, max seconds, last seconds]
+_timers = {}
+
+
+def _key(name, labels):
+    return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def increment(name, value=1, **labels):
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(stage, seconds, **labels):
+    key = _key(stage, labels)
+    with _lock:
+        entry = _timers.get(key)
+        if entry is None:
+            _timers[key] = [1, seconds, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+            entry[3] = seconds
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({"event": "stage", "stage": stage, "seconds": round(seconds, 6), **labels}))
+
+
+@contextmanager
+def timer(stage, **labels):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, time.perf_counter() - started, **labels)
+
+
+def timed(stage):
+    """Decorator form of :func:`timer`."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def frame_bytes(frame):
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
+def record_fetch(source, interval, frame):
+    """Count a download: one request plus the rows and bytes it returned."""
+    increment("fetch_requests_total", source=source, interval=interval)
+    if frame is not None and not frame.empty:
+        increment("fetch_rows_total", len(frame), source=source, interval=interval)
+        increment("fetch_bytes_total", frame_bytes(frame), source=source, interval=interval)
+    return frame
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+
+
+def _label_text(labels):
+    return ", ".join(f"{key}={value}" for key, value in labels)
+
+
+def timings():
+    """One row per stage: calls, total, mean, max and last duration in milliseconds."""
+    with _lock:
+        items = [(name, labels, list(entry)) for (name, labels), entry in _timers.items()]
+    rows = [{"stage": name, "labels": _label_text(labels), "calls": count, "total_ms": total * 1e3,
+             "mean_ms": total / count * 1e3, "max_ms": peak * 1e3, "last_ms": last * 1e3}
+            for name, labels, (count, total, peak, last) in items]
+    columns = ["stage", "labels", "calls", "total_ms", "mean_ms", "max_ms", "last_ms"]
+    return pd.DataFrame(rows, columns=columns).sort_values("total_ms", ascending=False, ignore_index=True)
+
+
+def counters():
+    with _lock:
+        items = list(_counters.items())
+    rows = [{"counter": name, "labels": _label_text(labels), "value": value} for (name, labels), value in items]
+    return pd.DataFrame(rows, columns=["counter", "labels", "value"]).sort_values(["counter", "labels"],
+                                                                                 ignore_index=True)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prometheus_labels(labels, **extra):
+    items = list(labels) + list(extra.items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in items) + "}"
+
+
+def prometheus_text():
+    """The registry in the Prometheus text exposition format."""
+    with _lock:
+        counter_items = sorted(_counters.items())
+        timer_items = sorted((key, list(entry)) for key, entry in _timers.items())
+    lines = []
+    for name in sorted({name for (name, _), _ in counter_items}):
+        lines.append(f"# TYPE volatility_{name} counter")
+        for (counter, labels), value in counter_items:
+            if counter == name:
+                lines.append(f"volatility_{name}{_prometheus_labels(labels)} {value}")
+    if timer_items:
+        lines.append("# TYPE volatility_stage_seconds summary")
+        for (stage, labels), (count, total, _, _) in timer_items:
+            lines.append(f"volatility_stage_seconds_count{_prometheus_labels(labels, stage=stage)} {count}")
+            lines.append(f"volatility_stage_seconds_sum{_prometheus_labels(labels, stage=stage)} {total:.6f}")
+        lines.append("# TYPE volatility_stage_seconds_max gauge")
+        for (stage, labels), (_, _, peak, _) in timer_items:
+            lines.append(f"volatility_stage_seconds_max{_prometheus_labels(labels, stage=stage)} {peak:.6f}")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+
+
+def serve(port, host="0.0.0.0"):
+    """Start the ``/metrics`` endpoint on a daemon thread (once per process)."""
+    global _server
+    with _lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            threading.Thread(target=_server.serve_forever, name="volatility-metrics", daemon=True).start()
+    return _server
+
+
+def configure_from_env():
+    """Apply ``VOLATILITY_METRICS_LOG`` and ``VOLATILITY_METRICS_PORT``; safe to call on every rerun."""
+    if os.environ.get("VOLATILITY_METRICS_LOG") and not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    port = os.environ.get("VOLATILITY_METRICS_PORT")
+    if port and _server is None:
+        try:
+            serve(int(port))
+        except OSError as error:
+            # Another server process already owns the port
+            logger.warning("metrics endpoint not started on port %s: %s", port, error)
@@ -0,0 +1,81 @@
+"""Vectorized band snapshot for a whole universe of symbols.
+
+Takes wide (dates x symbols) High/Low panels and reproduces, for every
+column at once, the figures :func:`volatility.engine.compute_daily` and
+:func:`volatility.engine.compute_x_day` read for a single symbol.  Only
+the rows that feed the latest windows are touched, so the cost grows with
+``period`` and the number of symbols, not with the length of the history.
+"""
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from volatility.engine import QUANTILES, add_bands, tail, window_mean_std
+
+SNAPSHOT_COLUMNS = [
+    "range", "volatility", "average", "std",
+    "lower_1", "upper_1", "lower_2", "upper_2", "lower_3", "upper_3",
+    "q_lower_1", "q_upper_1", "q_lower_2", "q_upper_2", "q_lower_3", "q_upper_3",
+    "z_score", "x_day_volatility", "x_day_average",
+]
+
+
+def pack(high, low):
+    """Move every symbol's valid bars to the bottom of its column.
+
+    Symbols that did not trade on some dates of the shared index end up with
+    the same consecutive bars a per-symbol download would give, so the
+    latest rows line up across columns.
+    """
+    missing = np.isnan(high) | np.isnan(low)
+    high = np.where(missing, np.nan, high)
+    low = np.where(missing, np.nan, low)
+    order = np.argsort(~missing, axis=0, kind="stable")
+    return np.take_along_axis(high, order, axis=0), np.take_along_axis(low, order, axis=0)
+
+
+def band_snapshot(high, low, period, x_days):
+    """Latest daily bands and x-day figures for every column of the panels."""
+    symbols = high.columns
+    h, l = pack(high.to_numpy(dtype=float), low.reindex_like(high).to_numpy(dtype=float))
+
+    # Daily range: statistics of the window that ends on the previous bar
+    daily_range = tail(h, period + 1) - tail(l, period + 1)
+    average, std = window_mean_std(daily_range[:-1])
+    # np.quantile gives NaN for a column with a missing bar, like pandas
+    quantiles = np.round(np.quantile(daily_range[:-1], QUANTILES, axis=0), 2)
+    volatility = daily_range[-2]
+    day_high = np.round(tail(h, 1)[0], 2)
+    day_low = np.round(tail(l, 1)[0], 2)
+
+    # x-day range: rolling max/min over the rows feeding the last windows
+    rows = max(period, 2) + x_days - 1
+    x_high = sliding_window_view(tail(h, rows), x_days, axis=0).max(axis=-1)
+    x_low = sliding_window_view(tail(l, rows), x_days, axis=0).min(axis=-1)
+    x_range = x_high - x_low
+    x_average, _ = window_mean_std(x_range[len(x_range) - period:])
+
+    snapshot = pd.DataFrame({
+        "range": np.round(day_high - day_low, 2),
+        "volatility": np.round(volatility, 2),
+        "average": np.round(average, 2),
+        "std": np.round(std, 2),
+        "x_day_volatility": np.round(x_range[-2], 2),
+        "x_day_average": np.round(x_average, 2),
+    }, index=symbols)
+    add_bands(snapshot)
+    for n in (1, 2, 3):
+        snapshot[f"q_lower_{n}"] = quantiles[len(QUANTILES) // 2 - n]
+        snapshot[f"q_upper_{n}"] = quantiles[len(QUANTILES) // 2 + n - 1]
+    snapshot["z_score"] = (snapshot["range"] - snapshot["average"]) / snapshot["std"].replace(0, np.nan)
+    snapshot = snapshot[SNAPSHOT_COLUMNS]
+    snapshot.index.name = "symbol"
+    return snapshot
+
+
+def to_panels(histories):
+    """Wide High/Low panels from ``{symbol: bars}`` frames."""
+    histories = {symbol: bars for symbol, bars in histories.items() if not bars.empty}
+    high = pd.DataFrame({symbol: bars["High"] for symbol, bars in histories.items()})
+    low = pd.DataFrame({symbol: bars["Low"] for symbol, bars in histories.items()})
+    return high.sort_index(), low.sort_index()
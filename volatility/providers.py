@@ -0,0 +1,192 @@
+"""Market data providers.
+
+All bar downloads go through a :class:`Provider`.  :class:`YFinanceProvider`
+is the default; :class:`LocalProvider` reads bar files from a local
+directory (memory-mapped Parquet or Arrow IPC) so the dashboard can run
+against an in-house warehouse, or be benchmarked, without network access.
+:class:`HttpProvider` reads CSV bars from an HTTP service, such as the
+stub server in ``benchmarks.stub_server``.
+
+The active provider comes from the ``VOLATILITY_PROVIDER`` environment
+variable (``yfinance``, ``local`` or ``http``; ``VOLATILITY_DATA_DIR``
+points the local provider at its files, ``VOLATILITY_HTTP_URL`` the HTTP
+provider at its service) unless :func:`set_provider` is called.
+"""
+import os
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+import pandas as pd
+
+from volatility.fetch import FETCH_TIMEOUT
+
+
+def local_bars(frame):
+    """``frame`` indexed by naive exchange-local timestamps, like :meth:`BarStore.load`.
+
+    Offsets such as yfinance's -04:00/-05:00 are dropped rather than
+    converted, so a 09:30 bar stays a 09:30 bar.
+    """
+    index = frame.index
+    if isinstance(index, pd.DatetimeIndex):
+        if index.tz is None:
+            return frame
+        index = index.tz_localize(None)
+    elif index.dtype == object and len(index):
+        # Offsets that change within the file (DST) leave read_csv with an object index
+        index = pd.DatetimeIndex([pd.Timestamp(value).replace(tzinfo=None) for value in index], name=index.name)
+    else:
+        return frame
+    return frame.set_axis(index)
+
+
+class Provider:
+    """Source of OHLCV bars in the yfinance column layout.
+
+    ``cacheable`` tells the data layer whether downloads should be kept in
+    the local bar store; providers that already read local files skip it.
+    """
+    cacheable = True
+
+    def history(self, symbol, start, end, interval="1d"):
+        raise NotImplementedError
+
+    def latest_session(self, symbol, interval="1m"):
+        raise NotImplementedError
+
+    def history_many(self, symbols, start, end, interval="1d"):
+        return {symbol: self.history(symbol, start, end, interval) for symbol in symbols}
+
+
+class YFinanceProvider(Provider):
+    """Bars from Yahoo Finance through ``yf.download``."""
+
+    def __init__(self, max_workers=8, timeout=FETCH_TIMEOUT):
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def history(self, symbol, start, end, interval="1d"):
+        import yfinance as yf
+        return yf.download(symbol, start=start, end=end, interval=interval, progress=False, timeout=self.timeout)
+
+    def latest_session(self, symbol, interval="1m"):
+        import yfinance as yf
+        return yf.download(symbol, period="1d", interval=interval, progress=False, timeout=self.timeout)
+
+    def history_many(self, symbols, start, end, interval="1d"):
+        # yf.download keeps module-level state, so a batch is one call and the
+        # concurrency comes from yfinance's own thread pool
+        import yfinance as yf
+        frame = yf.download(list(symbols), start=start, end=end, interval=interval, group_by="ticker",
+                            threads=self.max_workers, progress=False, timeout=self.timeout)
+        if not isinstance(frame.columns, pd.MultiIndex):
+            return {symbols[0]: frame}
+        present = frame.columns.get_level_values(0)
+        return {symbol: frame[symbol].dropna(how="all") for symbol in symbols if symbol in present}
+
+
+class LocalProvider(Provider):
+    """Bars read from ``<root>/<interval>/<SYMBOL>.parquet`` (or ``.arrow``/``.feather``).
+
+    Files hold one row per bar with a timestamp column (``Date``,
+    ``Datetime`` or the first column) and the usual OHLCV columns.  They are
+    memory-mapped, so repeated reads of a large file stay cheap.
+    """
+    cacheable = False
+    EXTENSIONS = (".parquet", ".arrow", ".feather")
+
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, symbol, interval):
+        for extension in self.EXTENSIONS:
+            path = os.path.join(self.root, interval, symbol + extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _read(self, symbol, interval):
+        path = self._path(symbol, interval)
+        if path is None:
+            return pd.DataFrame()
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError("LocalProvider needs pyarrow: pip install pyarrow") from error
+        if path.endswith(".parquet"):
+            table = pq.read_table(path, memory_map=True)
+        else:
+            table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        frame = table.to_pandas()
+        for column in ("Date", "Datetime", frame.columns[0]):
+            if column in frame.columns:
+                frame = frame.set_index(column)
+                break
+        frame.index = pd.DatetimeIndex(frame.index)
+        return local_bars(frame).sort_index()
+
+    def history(self, symbol, start, end, interval="1d"):
+        frame = self._read(symbol, interval)
+        if frame.empty:
+            return frame
+        return frame[(frame.index >= pd.Timestamp(start).normalize()) & (frame.index < pd.Timestamp(end))]
+
+    def latest_session(self, symbol, interval="1m"):
+        frame = self._read(symbol, interval)
+        if frame.empty:
+            return frame
+        return frame[frame.index >= frame.index[-1].normalize()]
+
+
+class HttpProvider(Provider):
+    """Bars from an HTTP service answering with CSV in the yfinance layout.
+
+    ``GET <base_url>/history?symbol=&interval=&start=&end=`` returns the
+    bars in [start, end), ``GET <base_url>/latest?symbol=&interval=`` the
+    latest session.  A 404 means no data for the symbol.
+    """
+
+    def __init__(self, base_url, timeout=FETCH_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _get(self, path, **params):
+        url = f"{self.base_url}/{path}?{urlencode(params)}"
+        try:
+            with urlopen(url, timeout=self.timeout) as response:
+                frame = pd.read_csv(response, index_col=0, parse_dates=True)
+        except HTTPError as error:
+            if error.code == 404:
+                return pd.DataFrame()
+            raise
+        return frame
+
+    def history(self, symbol, start, end, interval="1d"):
+        return self._get("history", symbol=symbol, interval=interval,
+                         start=pd.Timestamp(start).isoformat(), end=pd.Timestamp(end).isoformat())
+
+    def latest_session(self, symbol, interval="1m"):
+        return self._get("latest", symbol=symbol, interval=interval)
+
+
+_provider = None
+
+
+def set_provider(provider):
+    global _provider
+    _provider = provider
+
+
+def get_provider():
+    global _provider
+    if _provider is None:
+        name = os.environ.get("VOLATILITY_PROVIDER", "yfinance")
+        if name == "local":
+            _provider = LocalProvider(os.environ.get("VOLATILITY_DATA_DIR", "data"))
+        elif name == "http":
+            _provider = HttpProvider(os.environ.get("VOLATILITY_HTTP_URL", "http://127.0.0.1:8765"))
+        else:
+            _provider = YFinanceProvider()
+    return _provider
@@ -0,0 +1,104 @@
+"""Bands and signals for a whole range of rolling periods at once.
+
+The tabs show the bands of one ``period``.  Here the range series of each
+horizon gets one prefix sum of values and squares, and the mean and
+standard deviation of the latest window of every period come from two
+lookups each, the same figures as :func:`compute_daily`,
+:func:`compute_x_day` and :func:`compute_weekly` with that period.
+
+:func:`sweep_many` spreads the symbols of a universe over processes.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from volatility.data import recent_weeks, resample_bars
+from volatility.engine import add_bands
+from volatility.watchlist import signal_column
+
+PERIODS = range(10, 251)
+SWEEP_COLUMNS = ["volatility", "average", "std",
+                 "lower_3", "lower_2", "lower_1", "upper_1", "upper_2", "upper_3"]
+
+
+def window_stats(values, periods, end):
+    """Mean and sample std of the ``period`` values ending at position ``end`` (-1 or -2), per period.
+
+    A window with a missing value, or longer than the series, gives NaN.
+    """
+    periods = np.asarray(periods)
+    stop = len(values) + end + 1
+    # Newest first, so the sums of the last p values are prefix sums
+    window = values[max(stop - periods.max(), 0):stop][::-1]
+    finite = np.isfinite(window)
+    # Centring first keeps the sums of squares small
+    centre = window[finite].mean() if finite.any() else 0.0
+    shifted = np.where(finite, window - centre, 0.0)
+    totals = np.concatenate([[0.0], np.cumsum(shifted)])
+    squares = np.concatenate([[0.0], np.cumsum(shifted ** 2)])
+    missing = np.concatenate([[0], np.cumsum(~finite)])
+    p = np.minimum(periods, len(window))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = totals[p] / p
+        variance = (squares[p] - totals[p] * mean) / (p - 1)
+    valid = (periods <= len(window)) & (missing[p] == 0)
+    return (np.where(valid, mean + centre, np.nan),
+            np.where(valid, np.sqrt(np.clip(variance, 0.0, None)), np.nan))
+
+
+def _horizon_sweep(volatility, periods, end):
+    average, std = window_stats(volatility, periods, end)
+    table = pd.DataFrame({"volatility": volatility[-2] if len(volatility) > 1 else np.nan,
+                          "average": average, "std": std}, index=pd.Index(periods, name="period")).round(2)
+    return add_bands(table)[SWEEP_COLUMNS]
+
+
+def period_sweep(daily, periods=PERIODS, x_days=1, weekly=None):
+    """Figures of every horizon and period, one row per (horizon, period).
+
+    ``weekly`` defaults to the weekly bars resampled from ``daily`` over
+    the span of the weekly tab, so longer periods are NaN there as well.
+    """
+    periods = list(periods)
+    if weekly is None:
+        weekly = recent_weeks(resample_bars(daily))
+    high, low = daily["High"].to_numpy(dtype=float), daily["Low"].to_numpy(dtype=float)
+    x_range = (daily["High"].rolling(x_days).max() - daily["Low"].rolling(x_days).min()).to_numpy()
+    # Windows end where the tabs take them: the x-day average includes the bar in progress
+    tables = {
+        "daily": _horizon_sweep(high - low, periods, -2),
+        "x_day": _horizon_sweep(x_range, periods, -1),
+        "weekly": _horizon_sweep((weekly["High"] - weekly["Low"]).to_numpy(dtype=float), periods, -2),
+    }
+    return pd.concat(tables, names=["horizon"])
+
+
+def add_signals(table, v_alert):
+    table = table.copy()
+    table["signal"] = signal_column(table["volatility"], table["average"], v_alert)
+    return table
+
+
+def _sweep_task(task):
+    symbol, daily, periods, x_days = task
+    if len(daily) < 2:
+        return symbol, None
+    return symbol, period_sweep(daily, periods, x_days)
+
+
+def sweep_many(histories, periods=PERIODS, x_days=1, max_workers=None):
+    """:func:`period_sweep` of every symbol of ``{symbol: daily bars}`` in one table.
+
+    ``max_workers=1`` runs in-process, which is faster for a few symbols.
+    """
+    tasks = [(symbol, bars[["High", "Low"]], list(periods), x_days) for symbol, bars in histories.items()]
+    if max_workers == 1:
+        results = list(map(_sweep_task, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_sweep_task, tasks, chunksize=max(1, len(tasks) // 64)))
+    tables = {symbol: table for symbol, table in results if table is not None}
+    if not tables:
+        return pd.DataFrame(columns=SWEEP_COLUMNS)
+    return pd.concat(tables, names=["symbol"])
@@ -0,0 +1,195 @@
+"""Precomputed volatility state for a universe of symbols.
+
+A nightly job (``python -m volatility snapshot``) stores, for every symbol
+and common (period, x_days) pair, the rolling state over the completed bars,
+the last bar and the weekly figures.  The dashboard reads that row first:
+combined with the 1-minute data it gives the same daily and x-day figures
+as the full computation, without downloading or rolling the history.
+
+The snapshot is a SQLite file keyed by (symbol, period, x_days).  A new run
+writes a fresh file and swaps it in, so readers never see a partial one.
+
+    # crontab: after the close, for tomorrow morning
+    30 22 * * 1-5  python -m volatility snapshot --symbols-file universe.txt --periods 20,50 --x-days 1,5
+"""
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from volatility.data import DAILY_HISTORY_DAYS, download_weekly
+from volatility.engine import VolatilityResult, compute_weekly
+from volatility.incremental import VolatilityState
+from volatility.watchlist import download_many
+
+DEFAULT_PATH = os.environ.get(
+    "VOLATILITY_SNAPSHOT",
+    os.path.join(os.path.expanduser("~"), ".volatility", "snapshot.sqlite"),
+)
+# Without 1-minute data to date it, a snapshot older than this is not used
+MAX_AGE = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    symbol TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    x_days INTEGER NOT NULL,
+    computed_at REAL NOT NULL,
+    bar_time TEXT NOT NULL,
+    bar_high REAL NOT NULL,
+    bar_low REAL NOT NULL,
+    state TEXT NOT NULL,
+    daily_volatility REAL, daily_average REAL, daily_std REAL,
+    x_day_volatility REAL, x_day_average REAL, x_day_std REAL,
+    weekly_volatility REAL, weekly_average REAL, weekly_std REAL,
+    weekly_high REAL, weekly_low REAL, weekly_previous_date TEXT, weekly_quantiles TEXT,
+    PRIMARY KEY (symbol, period, x_days)
+);
+"""
+_COLUMNS = ("symbol", "period", "x_days", "computed_at", "bar_time", "bar_high", "bar_low", "state",
+            "daily_volatility", "daily_average", "daily_std", "x_day_volatility", "x_day_average", "x_day_std",
+            "weekly_volatility", "weekly_average", "weekly_std", "weekly_high", "weekly_low",
+            "weekly_previous_date", "weekly_quantiles")
+
+
+@dataclass
+class Snapshot:
+    """One symbol's stored state; ``state`` covers every bar before ``bar_time``."""
+    symbol: str
+    period: int
+    x_days: int
+    computed_at: float
+    bar_time: pd.Timestamp
+    bar_high: float
+    bar_low: float
+    state: VolatilityState
+    weekly: VolatilityResult
+
+    def bars(self):
+        """The last bar as a one-row frame, standing in for the history in ``live_results``."""
+        return pd.DataFrame({"High": [self.bar_high], "Low": [self.bar_low]},
+                            index=pd.DatetimeIndex([self.bar_time], name="Date"))
+
+    def usable(self, data_c):
+        """Whether the snapshot plus ``data_c`` still covers every completed bar.
+
+        A session that starts more than one business day after the stored
+        bar means a bar is missing (the job did not run, or a holiday).
+        """
+        if data_c is None or data_c.empty:
+            return time.time() - self.computed_at < MAX_AGE
+        session = data_c.index[-1].normalize()
+        if session < self.bar_time:
+            return False
+        between = pd.bdate_range(self.bar_time + timedelta(days=1), session - timedelta(days=1))
+        return len(between) == 0
+
+    def weekly_for(self, data_c):
+        """The stored weekly figures with ``data_c`` folded into the current week.
+
+        Returns None once the session is in a later week than the stored
+        bar: the previous week, its statistics and the signal have moved on,
+        so the weekly figures have to be computed live.
+        """
+        has_data = data_c is not None and not data_c.empty
+        session = data_c.index[-1] if has_data else pd.Timestamp.today()
+        if _week_start(session) > _week_start(self.bar_time):
+            return None
+        if not has_data:
+            return self.weekly
+        return replace(self.weekly, high=round(float(max(self.weekly.high, data_c["High"].max())), 2),
+                       low=round(float(min(self.weekly.low, data_c["Low"].min())), 2))
+
+
+def _week_start(timestamp):
+    # Start of the W-MON bucket, as labelled by resample_bars
+    timestamp = pd.Timestamp(timestamp).normalize()
+    return timestamp - timedelta(days=timestamp.weekday())
+
+
+def _row(symbol, history, weekly, period, x_days, computed_at):
+    last = history.iloc[-1]
+    state = VolatilityState.from_frame(history.iloc[:-1], period, x_days)
+    daily = state.daily(last["High"], last["Low"])
+    x_day = state.x_day(last["High"], last["Low"])
+    return (symbol, period, x_days, computed_at, history.index[-1].isoformat(), float(last["High"]),
+            float(last["Low"]), json.dumps(state.to_dict()),
+            daily.volatility, daily.average, daily.std, x_day.volatility, x_day.average, x_day.std,
+            weekly.volatility, weekly.average, weekly.std, weekly.high, weekly.low,
+            pd.Timestamp(weekly.previous_date).isoformat(), json.dumps(weekly.quantiles))
+
+
+class SnapshotStore:
+    """Reads and rebuilds the snapshot file at ``path``."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+
+    def read(self, symbol, period, x_days):
+        if not os.path.exists(self.path):
+            return None
+        with sqlite3.connect(self.path, timeout=30) as conn:
+            row = conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM snapshots "
+                               "WHERE symbol = ? AND period = ? AND x_days = ?",
+                               (symbol, period, x_days)).fetchone()
+        if row is None:
+            return None
+        values = dict(zip(_COLUMNS, row))
+        weekly = VolatilityResult(
+            frame=None,
+            volatility=values["weekly_volatility"],
+            average=values["weekly_average"],
+            std=values["weekly_std"],
+            high=values["weekly_high"],
+            low=values["weekly_low"],
+            previous_date=pd.Timestamp(values["weekly_previous_date"]),
+            quantiles=tuple(json.loads(values["weekly_quantiles"])),
+        )
+        return Snapshot(symbol, period, x_days, values["computed_at"], pd.Timestamp(values["bar_time"]),
+                        values["bar_high"], values["bar_low"],
+                        VolatilityState.from_dict(json.loads(values["state"])), weekly)
+
+    def table(self):
+        """Every stored row except the serialized state, e.g. for a morning report."""
+        with sqlite3.connect(self.path, timeout=30) as conn:
+            frame = pd.read_sql_query(f"SELECT {', '.join(c for c in _COLUMNS if c != 'state')} FROM snapshots "
+                                      "ORDER BY symbol, period, x_days", conn)
+        return frame.set_index("symbol")
+
+    def rebuild(self, histories, periods, x_days_values):
+        """Replace the file with rows for every symbol of ``{symbol: daily bars}``.
+
+        Returns the number of rows written.
+        """
+        computed_at = time.time()
+        rows = []
+        for symbol, history in histories.items():
+            if len(history) < 2:
+                continue
+            weekly_bars = download_weekly(symbol, daily=history)
+            for period in periods:
+                weekly = compute_weekly(weekly_bars, int(period))
+                for x_days in x_days_values:
+                    rows.append(_row(symbol, history, weekly, int(period), int(x_days), computed_at))
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        partial = f"{self.path}.{os.getpid()}.tmp"
+        if os.path.exists(partial):
+            os.remove(partial)
+        with sqlite3.connect(partial) as conn:
+            conn.executescript(_SCHEMA)
+            conn.executemany(f"INSERT INTO snapshots VALUES ({', '.join('?' * len(_COLUMNS))})", rows)
+        conn.close()
+        os.replace(partial, self.path)
+        return len(rows)
+
+
+def build_snapshot(symbols, periods, x_days_values, path=DEFAULT_PATH, days=DAILY_HISTORY_DAYS):
+    end_date = datetime.today()
+    histories = download_many(symbols, end_date - timedelta(days=days), end_date)
+    return SnapshotStore(path).rebuild(histories, periods, x_days_values)
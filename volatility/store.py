@@ -0,0 +1,312 @@
+"""Local on-disk bar store so reruns only fetch the bars that are missing.
+
+Bars are kept in a SQLite database keyed by (symbol, interval, timestamp).
+Every read tops the store up from the last stored timestamp instead of
+downloading the full history again.  The re-downloaded bar is compared with
+the stored one: after a split or a dividend the provider adjusts the whole
+history, so a changed bar drops the symbol's bars and downloads them all
+again.  Top-ups of one (symbol, interval) are
+coalesced: concurrent sessions, and other processes using the same file,
+wait for the download in flight instead of repeating it.
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from volatility import metrics
+from volatility.coalesce import KeyedLock
+from volatility.providers import local_bars
+
+BAR_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+DEFAULT_PATH = os.environ.get(
+    "VOLATILITY_BAR_STORE",
+    os.path.join(os.path.expanduser("~"), ".volatility", "bars.sqlite"),
+)
+# Providers only serve recent intraday bars: yfinance rejects 1-minute
+# requests that start more than about a week back
+MINUTE_HISTORY_DAYS = 7
+# Bars the store derives from an interval, dropped with it when it is adjusted
+DERIVED_PREFIXES = {"1d": "resample-", "1m": "intraday-"}
+# Symbols per query of load_many
+LOAD_BATCH_SIZE = 500
+# Do not ask the provider for a new tail more often than this (seconds)
+DEFAULT_MIN_REFRESH = float(os.environ.get("VOLATILITY_MIN_REFRESH", "60"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    open REAL, high REAL, low REAL, close REAL, adj_close REAL, volume REAL,
+    PRIMARY KEY (symbol, interval, ts)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    covered_from TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (symbol, interval)
+);
+"""
+
+
+def _intraday(interval):
+    return interval.endswith(("m", "h"))
+
+
+def _intraday_limit():
+    # Earliest start the provider still serves intraday bars for, with a day to spare
+    return pd.Timestamp(datetime.today() - timedelta(days=MINUTE_HISTORY_DAYS - 1)).normalize()
+
+
+def _ts(value):
+    return pd.Timestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class BarStore:
+    """OHLCV bars persisted in SQLite, keyed by symbol and interval."""
+
+    def __init__(self, path=DEFAULT_PATH, min_refresh=DEFAULT_MIN_REFRESH):
+        self.path = path
+        self.min_refresh = min_refresh
+        self._lock = threading.Lock()
+        self._keys = KeyedLock(path + ".lock")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def load(self, symbol, interval, start=None, end=None):
+        query = ("SELECT ts, open, high, low, close, adj_close, volume FROM bars "
+                 "WHERE symbol = ? AND interval = ?")
+        params = [symbol, interval]
+        if start is not None:
+            query += " AND ts >= ?"
+            params.append(_ts(start))
+        if end is not None:
+            query += " AND ts < ?"
+            params.append(_ts(end))
+        query += " ORDER BY ts"
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        frame = pd.DataFrame([row[1:] for row in rows], columns=BAR_COLUMNS,
+                             index=pd.DatetimeIndex([row[0] for row in rows]))
+        frame.index.name = "Datetime" if _intraday(interval) else "Date"
+        return frame
+
+    def load_many(self, symbols, interval, start=None, end=None):
+        """``{symbol: bars}`` like :meth:`load`, with one query per batch of symbols instead of one each."""
+        conditions, params = "", []
+        if start is not None:
+            conditions += " AND ts >= ?"
+            params.append(_ts(start))
+        if end is not None:
+            conditions += " AND ts < ?"
+            params.append(_ts(end))
+        symbols = list(symbols)
+        rows = []
+        with self._connect() as conn:
+            # SQLite allows only so many parameters per statement
+            for i in range(0, len(symbols), LOAD_BATCH_SIZE):
+                batch = symbols[i:i + LOAD_BATCH_SIZE]
+                rows += conn.execute(
+                    "SELECT symbol, ts, open, high, low, close, adj_close, volume FROM bars "
+                    f"WHERE interval = ? AND symbol IN ({', '.join('?' * len(batch))}){conditions} "
+                    "ORDER BY symbol, ts", [interval, *batch, *params]).fetchall()
+        frame = pd.DataFrame([row[2:] for row in rows], columns=BAR_COLUMNS,
+                             index=pd.DatetimeIndex([row[1] for row in rows]))
+        frame.index.name = "Datetime" if _intraday(interval) else "Date"
+        # Rows come grouped by symbol, so each symbol is one slice
+        keys = [row[0] for row in rows]
+        bounds = [i for i in range(1, len(keys)) if keys[i] != keys[i - 1]]
+        starts, stops = [0] + bounds, bounds + [len(keys)]
+        frames = {keys[a]: frame.iloc[a:b] for a, b in zip(starts, stops) if a < b}
+        return {symbol: frames.get(symbol, frame.iloc[:0]) for symbol in symbols}
+
+    def save(self, symbol, interval, frame):
+        if frame.empty:
+            return
+        frame = frame.reindex(columns=BAR_COLUMNS)
+        rows = [
+            (symbol, interval, _ts(ts), *(None if pd.isna(v) else float(v) for v in values))
+            for ts, values in zip(frame.index, frame.itertuples(index=False, name=None))
+        ]
+        with self._lock, self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _coverage(self, symbol, interval):
+        with self._connect() as conn:
+            row = conn.execute("SELECT covered_from, fetched_at FROM coverage "
+                               "WHERE symbol = ? AND interval = ?", (symbol, interval)).fetchone()
+        if row is None:
+            return None, 0.0
+        return pd.Timestamp(row[0]), row[1]
+
+    def _set_coverage(self, symbol, interval, covered_from):
+        with self._lock, self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO coverage VALUES (?, ?, ?, ?)",
+                         (symbol, interval, _ts(covered_from), time.time()))
+
+    def forget(self, symbol, interval):
+        """Drop the stored bars and coverage of ``symbol``, and the bars derived from them."""
+        intervals = "interval = ?"
+        params = [symbol, interval]
+        if interval in DERIVED_PREFIXES:
+            intervals += " OR interval LIKE ?"
+            params.append(DERIVED_PREFIXES[interval] + "%")
+        with self._lock, self._connect() as conn:
+            conn.execute(f"DELETE FROM bars WHERE symbol = ? AND ({intervals})", params)
+            conn.execute(f"DELETE FROM coverage WHERE symbol = ? AND ({intervals})", params)
+
+    def matches(self, symbol, interval, frame):
+        """Whether the stored bars that ``frame`` downloads again are unchanged.
+
+        Only the open and the Adj Close / Close ratio are compared: both stay
+        put while a bar is in progress, but a split rescales the prices of
+        earlier bars and a dividend their adjustment.
+        """
+        if frame.empty:
+            return True
+        frame = local_bars(frame).reindex(columns=BAR_COLUMNS)
+        stored = self.load(symbol, interval, frame.index[0], frame.index[-1] + pd.Timedelta(seconds=1))
+        common = stored.index.intersection(frame.index)
+        if common.empty:
+            return True
+        stored, new = stored.loc[common], frame.loc[common]
+        return bool(np.isclose(new["Open"], stored["Open"], rtol=1e-6, equal_nan=True).all()
+                    and np.isclose(new["Adj Close"] / new["Close"], stored["Adj Close"] / stored["Close"],
+                                   rtol=1e-6, equal_nan=True).all())
+
+    def last_timestamp(self, symbol, interval):
+        with self._connect() as conn:
+            row = conn.execute("SELECT MAX(ts) FROM bars WHERE symbol = ? AND interval = ?",
+                               (symbol, interval)).fetchone()
+        return None if row[0] is None else pd.Timestamp(row[0])
+
+    def plan(self, symbol, interval, start):
+        """Return the timestamp to download from, or None if the store is fresh.
+
+        The last stored bar is always re-requested because it may have been
+        captured while still in progress.
+        """
+        covered_from, fetched_at = self._coverage(symbol, interval)
+        return self._plan(pd.Timestamp(start), covered_from, fetched_at, self.last_timestamp(symbol, interval),
+                          interval)
+
+    def _plan(self, start, covered_from, fetched_at, last, interval):
+        if covered_from is None or last is None or start < covered_from:
+            fetch_from = start
+        elif time.time() - fetched_at >= self.min_refresh:
+            fetch_from = last
+        else:
+            return None
+        if _intraday(interval):
+            # An older start gives an empty frame, not an error, and the gap would never be filled
+            fetch_from = max(fetch_from, _intraday_limit())
+        return fetch_from
+
+    def plan_many(self, symbols, interval, start):
+        """``{symbol: plan(...)}`` for many symbols with two queries per batch."""
+        start = pd.Timestamp(start)
+        symbols = list(symbols)
+        coverage, last = {}, {}
+        with self._connect() as conn:
+            for i in range(0, len(symbols), LOAD_BATCH_SIZE):
+                batch = symbols[i:i + LOAD_BATCH_SIZE]
+                marks = ", ".join("?" * len(batch))
+                for symbol, covered_from, fetched_at in conn.execute(
+                        "SELECT symbol, covered_from, fetched_at FROM coverage "
+                        f"WHERE interval = ? AND symbol IN ({marks})", [interval, *batch]):
+                    coverage[symbol] = (pd.Timestamp(covered_from), fetched_at)
+                for symbol, ts in conn.execute(
+                        f"SELECT symbol, MAX(ts) FROM bars WHERE interval = ? AND symbol IN ({marks}) "
+                        "GROUP BY symbol", [interval, *batch]):
+                    last[symbol] = pd.Timestamp(ts)
+        return {symbol: self._plan(start, *coverage.get(symbol, (None, 0.0)), last.get(symbol), interval)
+                for symbol in symbols}
+
+    def record(self, symbol, interval, frame, fetched_from):
+        """Save a downloaded frame and remember which span is now covered.
+
+        Returns False, with nothing of ``symbol`` stored any more, if the
+        frame shows that the stored bars were adjusted since; the caller
+        downloads the full span again.
+        """
+        if not self.matches(symbol, interval, frame):
+            metrics.increment("store_adjusted_total", interval=interval)
+            self.forget(symbol, interval)
+            return False
+        self.save(symbol, interval, frame)
+        covered_from, _ = self._coverage(symbol, interval)
+        fetched_from = pd.Timestamp(fetched_from)
+        if covered_from is None or fetched_from < covered_from:
+            covered_from = fetched_from
+        self._set_coverage(symbol, interval, covered_from)
+        return True
+
+    def fetch(self, symbol, interval, start, end, download):
+        """Return bars in [start, end), downloading only what is not stored yet.
+
+        ``download(start, end)`` must return a yfinance-style OHLCV frame.
+        """
+        start = pd.Timestamp(start)
+        with self._keys.hold(symbol, interval):
+            fetch_from = self.plan(symbol, interval, start)
+            metrics.increment("store_lookups_total", interval=interval,
+                              result="miss" if fetch_from is not None else "hit")
+            if fetch_from is not None and not self.record(symbol, interval, download(fetch_from, end), fetch_from):
+                # The stored bars were adjusted and dropped: download the full span
+                fetch_from = self.plan(symbol, interval, start)
+                self.record(symbol, interval, download(fetch_from, end), fetch_from)
+        with metrics.timer("store.load", interval=interval):
+            return self.load(symbol, interval, start.normalize(), end)
+
+    def fetch_latest_session(self, symbol, interval, download_session, download, min_refresh=None):
+        """Return the bars of the most recent session for an intraday interval.
+
+        ``download_session()`` fetches the whole latest session and is only
+        used when nothing recent is stored; otherwise ``download(start, end)``
+        tops the store up from the last stored bar.  ``min_refresh``
+        overrides the store-wide refresh interval for this call.
+        """
+        if min_refresh is None:
+            min_refresh = self.min_refresh
+        with self._keys.hold(symbol, interval):
+            _, fetched_at = self._coverage(symbol, interval)
+            last = self.last_timestamp(symbol, interval)
+            stale = last is None or last < _intraday_limit() or time.time() - fetched_at >= min_refresh
+            metrics.increment("store_lookups_total", interval=interval, result="miss" if stale else "hit")
+            session = last is None or last < _intraday_limit()
+            if not session and time.time() - fetched_at >= min_refresh:
+                # An adjusted history was dropped: start again from the latest session
+                session = not self.record(symbol, interval, download(last, datetime.today()), last)
+            if session:
+                # The provider no longer serves the bars since ``last``; stored bars
+                # are only contiguous from this session on
+                bars = download_session()
+                self.save(symbol, interval, bars)
+                if not bars.empty:
+                    self._set_coverage(symbol, interval, bars.index[0])
+        last = self.last_timestamp(symbol, interval)
+        if last is None:
+            return self.load(symbol, interval)
+        return self.load(symbol, interval, start=last.normalize())
+
+
+_default_store = None
+
+
+def get_store():
+    global _default_store
+    if _default_store is None:
+        _default_store = BarStore()
+    return _default_store
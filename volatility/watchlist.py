@@ -0,0 +1,108 @@
+"""Screening a list of symbols at once for the watchlist mode."""
+import re
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from volatility import metrics
+from volatility.data import DAILY_HISTORY_DAYS
+from volatility.engine import BUY, SELL, compute_daily, compute_x_day
+from volatility.fetch import with_retries
+from volatility.panel import band_snapshot, to_panels
+from volatility.providers import get_provider, local_bars
+from volatility.store import get_store
+
+BATCH_SIZE = 100
+
+
+def parse_symbols(text):
+    symbols = []
+    for symbol in re.split(r"[\s,;]+", text.upper()):
+        if symbol and symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+def download_many(symbols, start, end, interval="1d", batch_size=BATCH_SIZE):
+    """Return ``{symbol: bars}`` for many symbols using batched requests.
+
+    Symbols whose stored bars are still fresh are not requested at all; the
+    rest are grouped by how far back they need to go and fetched in
+    multi-ticker batches through the provider.
+    """
+    provider = get_provider()
+    source = type(provider).__name__
+    if not provider.cacheable:
+        histories = with_retries(lambda: provider.history_many(symbols, start, end, interval), name=source)
+        return {symbol: metrics.record_fetch(source, interval, local_bars(bars)) for symbol, bars in histories.items()}
+    store = get_store()
+    start = pd.Timestamp(start)
+    pending = []
+    for symbol, fetch_from in store.plan_many(symbols, interval, start).items():
+        metrics.increment("store_lookups_total", interval=interval, result="miss" if fetch_from is not None else "hit")
+        if fetch_from is not None:
+            pending.append((fetch_from, symbol))
+    adjusted = _download_pending(provider, store, pending, end, interval, batch_size)
+    if adjusted:
+        # Their stored bars were adjusted for a split or dividend and dropped
+        _download_pending(provider, store, [(fetch_from, symbol) for symbol, fetch_from
+                                           in store.plan_many(adjusted, interval, start).items()],
+                          end, interval, batch_size)
+    with metrics.timer("store.load_many", interval=interval):
+        return store.load_many(symbols, interval, start.normalize(), end)
+
+
+def _download_pending(provider, store, pending, end, interval, batch_size):
+    """Download ``[(fetch_from, symbol)]`` in batches; returns the symbols whose stored bars were adjusted."""
+    source = type(provider).__name__
+    adjusted = []
+    pending = sorted(pending)
+    for i in range(0, len(pending), batch_size):
+        batch = pending[i:i + batch_size]
+        batch_start = batch[0][0]
+        batch_symbols = [symbol for _, symbol in batch]
+        with metrics.timer("download_many.batch", interval=interval):
+            histories = with_retries(lambda: provider.history_many(batch_symbols, batch_start, end, interval),
+                                     name=source)
+        for symbol, bars in histories.items():
+            if not store.record(symbol, interval, metrics.record_fetch(source, interval, bars), batch_start):
+                adjusted.append(symbol)
+    return adjusted
+
+
+@metrics.timed("stats.watchlist")
+def screen(histories, period, x_days):
+    """Latest daily bands and x-day figures for every symbol with enough history."""
+    high, low = to_panels(histories)
+    return band_snapshot(high, low, period, x_days)
+
+
+def signal_column(volatility, average, v_alert):
+    """Vectorized VolatilityResult.signal over whole columns."""
+    return pd.Series(np.select(
+        [volatility > average * (1 + v_alert), volatility < average * (1 - v_alert)],
+        [SELL, BUY], default=""), index=volatility.index)
+
+
+def add_signals(table, v_alert):
+    table = table.copy()
+    table["signal"] = signal_column(table["volatility"], table["average"], v_alert)
+    table["x_day_signal"] = signal_column(table["x_day_volatility"], table["x_day_average"], v_alert)
+    return table
+
+
+def run_watchlist(symbols, period, x_days, days=DAILY_HISTORY_DAYS):
+    end_date = datetime.today()
+    histories = download_many(symbols, end_date - timedelta(days=days), end_date)
+    return screen(histories, period, x_days)
+
+
+def watchlist_frames(symbols, period, x_days, days=DAILY_HISTORY_DAYS):
+    """``(symbol, frame)`` pairs with the daily and x-day columns, computed one symbol at a time."""
+    end_date = datetime.today()
+    histories = download_many(symbols, end_date - timedelta(days=days), end_date)
+    for symbol in symbols:
+        bars = histories.get(symbol)
+        if bars is not None and len(bars) >= 2:
+            yield symbol, compute_x_day(compute_daily(bars, period).frame, period, x_days).frame